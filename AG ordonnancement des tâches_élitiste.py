@@ -1,101 +1,20 @@
-import random
-
-# --- Fonction de coût : temps d'achèvement cumulé (flow time) ---
-def calculer_cout_ordonnancement(ordre, durees):
-    temps = 0
-    cout_total = 0
-    for tache in ordre:
-        temps += durees[tache]
-        cout_total += temps
-    return cout_total
-
-# --- Génération de la population initiale ---
-def generer_population(taille_pop, nb_taches):
-    return [random.sample(range(nb_taches), nb_taches) for _ in range(taille_pop)]
-
-# --- Croisement simple (1 point) ---
-def croisement_simple(p1, p2):
-    point = random.randint(1, len(p1)-2)
-    enfant = p1[:point] + [v for v in p2 if v not in p1[:point]]
-    return enfant
-
-# --- Croisement double (2 points) ---
-def croisement_double(p1, p2):
-    a, b = sorted(random.sample(range(len(p1)), 2))
-    segment = p1[a:b]
-    reste = [v for v in p2 if v not in segment]
-    return reste[:a] + segment + reste[a:]
-
-# --- Croisement uniforme avec réparation ---
-def croisement_uniforme(p1, p2):
-    taille = len(p1)
-    enfant = [p1[i] if random.random() < 0.5 else p2[i] for i in range(taille)]
-    compteur = {}
-    for v in enfant:
-        compteur[v] = compteur.get(v, 0) + 1
-    doublons = [i for i, v in enumerate(enfant) if compteur[v] > 1]
-    manquantes = list(set(range(taille)) - set(enfant))
-    for i in doublons:
-        v = enfant[i]
-        if compteur[v] > 1 and manquantes:
-            enfant[i] = manquantes.pop()
-            compteur[v] -= 1
-            compteur[enfant[i]] = 1
-    return enfant
-
-# --- Mutation par échange ---
-def mutation(individu, taux):
-    if random.random() < taux:
-        i, j = random.sample(range(len(individu)), 2)
-        individu[i], individu[j] = individu[j], individu[i]
-    return individu
-
-# --- Algorithme génétique avec sélection élitiste ---
-def algo_genetique_elitiste(durees, taille_pop, taux_elite, taux_mut, generations, type_croisement):
-    nb_taches = len(durees)
-    population = generer_population(taille_pop, nb_taches)
-
-    for gen in range(generations):
-        # Évaluer et trier la population par coût croissant
-        population.sort(key=lambda ind: calculer_cout_ordonnancement(ind, durees))
-        elite_count = max(1, int(taille_pop * taux_elite))
-        elite = population[:elite_count]  # Les meilleurs individus
-
-        nouvelle_gen = elite.copy()
-
-        # Générer le reste de la population par croisement et mutation
-        while len(nouvelle_gen) < taille_pop:
-            p1, p2 = random.sample(elite, 2)
-            if type_croisement == "simple":
-                enfant = croisement_simple(p1, p2)
-            elif type_croisement == "double":
-                enfant = croisement_double(p1, p2)
-            elif type_croisement == "uniforme":
-                enfant = croisement_uniforme(p1, p2)
-            else:
-                raise ValueError("Type de croisement inconnu")
-            enfant = mutation(enfant, taux_mut)
-            nouvelle_gen.append(enfant)
-
-        population = nouvelle_gen
-
-    # Retourner le meilleur individu final
-    meilleur = min(population, key=lambda ind: calculer_cout_ordonnancement(ind, durees))
-    meilleur_cout = calculer_cout_ordonnancement(meilleur, durees)
-    return meilleur, meilleur_cout
-# Durées des tâches
-durees_taches = [5, 2, 8, 4, 3, 6, 7, 1, 9, 2]
-
-# Test avec les trois croisements
-for croisement in ["simple", "double", "uniforme"]:
-    meilleur, cout = algo_genetique_elitiste(
-        durees=durees_taches,
-        taille_pop=100,
-        taux_elite=0.2,
-        taux_mut=0.1,
-        generations=300,
-        type_croisement=croisement
-    )
-    print(f"\n--- Croisement {croisement} ---")
-    print("Meilleur ordre de tâches :", meilleur)
-    print("Coût total (flow time) :", cout)
+from algo_evolutionnaire.donnees import DUREES_TACHES as durees_taches
+from algo_evolutionnaire.genetique import algo_genetique_elitiste
+
+# --- Démonstration : AG élitiste sur l'ordonnancement d'exemple (flow time) ---
+# Les parents sont tirés parmi les seules élites.
+
+if __name__ == "__main__":
+    # Test avec les trois croisements
+    for croisement in ["simple", "double", "uniforme"]:
+        meilleur, cout = algo_genetique_elitiste(
+            durees=durees_taches,
+            taille_pop=100,
+            taux_elite=0.2,
+            taux_mut=0.1,
+            generations=300,
+            type_croisement=croisement
+        )
+        print(f"\n--- Croisement {croisement} ---")
+        print("Meilleur ordre de tâches :", meilleur)
+        print("Coût total (flow time) :", cout)
@@ -0,0 +1,40 @@
+"""
+Algorithmes évolutionnaires et métaheuristiques pour problèmes de permutation
+(TSP, ordonnancement sur une machine).
+
+    from algo_evolutionnaire import ProblemeTSP, RecuitSimule
+    solution, cout = RecuitSimule(iterations_max=5000).resoudre(ProblemeTSP(matrice))
+
+L'import du paquet ne fait aucun travail : les sous-modules (et NumPy) ne sont
+chargés qu'au premier accès à l'un des noms ci-dessous.
+"""
+import importlib
+
+_EXPORTS = {
+    "Probleme": "problemes",
+    "ProblemeTSP": "problemes",
+    "ProblemeFlowTime": "problemes",
+    "ProblemeTWT": "problemes",
+    "Solveur": "solveurs",
+    "AGElitiste": "solveurs",
+    "AGElitisteLot": "solveurs",
+    "AGRoulette": "solveurs",
+    "RecuitSimule": "solveurs",
+    "RechercheTabou": "solveurs",
+    "SOLVEURS": "solveurs",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(nom):
+    module = _EXPORTS.get(nom)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    valeur = getattr(importlib.import_module(f".{module}", __name__), nom)
+    globals()[nom] = valeur  # Les accès suivants ne repassent pas par __getattr__
+    return valeur
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,135 @@
+import random
+import time
+
+import numpy as np
+
+# --- Critères d'arrêt et redémarrages ---
+# Sans autre indication, chaque moteur exécute son nombre fixe d'itérations
+# (générations pour les AG). Un objet Arret, passé par le paramètre `arret`,
+# ajoute des critères d'arrêt anticipé, vérifiés à chaque itération (par blocs
+# de PERIODE_ARRET itérations pour le recuit) :
+# - duree_max : budget de temps en secondes
+# - evaluations_max : budget d'évaluations (deltas compris pour le recuit et le tabou,
+#   évaluations réellement calculées pour les AG avec cache)
+# - cout_cible : arrêt dès que le meilleur coût l'atteint
+# - patience : nombre d'itérations sans amélioration du meilleur coût, redémarrages compris
+# et une politique de Redemarrage optionnelle sur stagnation. En fin d'exécution,
+# arret.motif donne le critère déclenché (None si toutes les itérations ont été
+# faites) et arret.redemarrages le nombre de redémarrages. Avec un point de
+# reprise, les budgets et compteurs sont sauvegardés et se poursuivent à la reprise.
+#
+#     arret = Arret(duree_max=2.0, patience=50_000, redemarrage=Redemarrage(10_000, force=3))
+#     RecuitSimule(iterations_max=10**8, arret=arret).resoudre(probleme)
+#     arret.motif  # "duree", "evaluations", "cout_cible" ou "patience"
+
+PERIODE_ARRET = 1000  # Itérations du recuit entre deux vérifications
+
+
+def _verifier_positif(nom, valeur):
+    if valeur is not None and valeur <= 0:
+        raise ValueError(f"{nom} doit être strictement positif.")
+
+
+class Redemarrage:
+    """
+    Après `stagnation` itérations sans amélioration (depuis la dernière amélioration
+    ou le dernier redémarrage), la recherche repart de la meilleure solution
+    perturbée par `force` échanges aléatoires, ou d'un ordre aléatoire si force=None.
+    Les AG conservent leurs élites et remplacent le reste de la population.
+    redemarrages_max : nombre maximal de redémarrages (None = illimité).
+    """
+
+    def __init__(self, stagnation, force=None, redemarrages_max=None):
+        _verifier_positif("stagnation", stagnation)
+        _verifier_positif("force", force)
+        self.stagnation = stagnation
+        self.force = force
+        self.redemarrages_max = redemarrages_max
+
+    def perturber(self, solution):
+        solution = list(solution)
+        if self.force is None:
+            random.shuffle(solution)
+            return solution
+        for _ in range(self.force):
+            i, j = random.sample(range(len(solution)), 2)
+            solution[i], solution[j] = solution[j], solution[i]
+        return solution
+
+
+class Arret:
+    """
+    Critères d'arrêt anticipé d'une exécution (None = critère inactif) et
+    politique de redémarrage optionnelle. Voir l'entête du module.
+    """
+
+    def __init__(self, duree_max=None, evaluations_max=None, cout_cible=None, patience=None, redemarrage=None):
+        _verifier_positif("duree_max", duree_max)
+        _verifier_positif("evaluations_max", evaluations_max)
+        _verifier_positif("patience", patience)
+        self.duree_max = duree_max
+        self.evaluations_max = evaluations_max
+        self.cout_cible = cout_cible
+        self.patience = patience
+        self.redemarrage = redemarrage
+        self.motif = None
+        self.redemarrages = 0
+
+    def demarrer(self, evaluations=0, etat=None):
+        """
+        Début d'exécution. evaluations : compteur de l'évaluateur à cet instant ;
+        etat : contenu d'un point de reprise, dont les compteurs sont repris s'il en contient.
+        """
+        self.motif = None
+        self._debut = time.perf_counter()
+        self._evaluations_depart = evaluations
+        iteration = 0 if etat is None else etat["iteration"].item()
+        if etat is None or "arret" not in etat:
+            self.derniere_amelioration = self.dernier_redemarrage = iteration
+            self.redemarrages, self._evaluations_avant, self._duree_avant = 0, 0, 0.0
+        else:
+            (self.derniere_amelioration, self.dernier_redemarrage, self.redemarrages,
+             self._evaluations_avant) = etat["arret"].tolist()
+            self._duree_avant = etat["arret_duree"].item()
+
+    def duree(self):
+        return self._duree_avant + time.perf_counter() - self._debut
+
+    def evaluations(self, evaluations):
+        return self._evaluations_avant + evaluations - self._evaluations_depart
+
+    def ameliore(self, iteration):
+        self.derniere_amelioration = iteration
+
+    def atteint(self, iteration, meilleur_cout, evaluations):
+        """
+        Vrai si un critère est atteint après `iteration` itérations ; il est noté dans self.motif.
+        """
+        if self.cout_cible is not None and meilleur_cout <= self.cout_cible:
+            self.motif = "cout_cible"
+        elif self.patience is not None and iteration - self.derniere_amelioration >= self.patience:
+            self.motif = "patience"
+        elif self.evaluations_max is not None and self.evaluations(evaluations) >= self.evaluations_max:
+            self.motif = "evaluations"
+        elif self.duree_max is not None and self.duree() >= self.duree_max:
+            self.motif = "duree"
+        return self.motif is not None
+
+    def redemarrer(self, iteration):
+        """
+        Vrai si la recherche doit redémarrer après `iteration` itérations (le redémarrage est alors compté).
+        """
+        redemarrage = self.redemarrage
+        if redemarrage is None or self.redemarrages == redemarrage.redemarrages_max:
+            return False
+        if iteration - max(self.derniere_amelioration, self.dernier_redemarrage) < redemarrage.stagnation:
+            return False
+        self.dernier_redemarrage = iteration
+        self.redemarrages += 1
+        return True
+
+    def etat(self, evaluations):
+        # Tableaux ajoutés au point de reprise (voir reprise.py)
+        return {"arret": np.array([self.derniere_amelioration, self.dernier_redemarrage, self.redemarrages,
+                                   self.evaluations(evaluations)], dtype=np.int64),
+                "arret_duree": np.float64(self.duree())}
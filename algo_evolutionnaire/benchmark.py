@@ -0,0 +1,226 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import fields
+from datetime import datetime, timezone
+from statistics import mean
+
+import numpy as np
+
+from .instances import charger_meilleurs_connus, charger_orlib_wt, charger_tsplib, tsp_aleatoire, twt_aleatoire
+from .solveurs import SOLVEURS
+
+# --- Banc d'essai reproductible ---
+# Chaque (instance, solveur, graine) est exécuté une fois pour le temps (sans
+# instrumentation), puis, si demandé, une seconde fois avec la même graine sous
+# tracemalloc pour le pic mémoire : le traçage ralentit fortement les
+# allocations et fausserait la mesure du temps. Les résultats sont écrits en
+# JSON Lines (un enregistrement par exécution) et peuvent être comparés à un
+# fichier de référence pour détecter les régressions entre versions.
+#
+#     python -m algo_evolutionnaire.benchmark --tsp berlin52.tsp --meilleurs solutions.txt \
+#         --solveurs recuit tabou --graines 0 1 2 --sortie resultats.jsonl
+
+
+def mesurer(probleme, solveur, graine, memoire=True):
+    """
+    Exécute solveur.resoudre(probleme) avec la graine donnée et retourne les mesures.
+    """
+    random.seed(graine)
+    probleme.nb_evaluations = 0
+    debut = time.perf_counter()
+    solution, cout = solveur.resoudre(probleme)
+    duree = time.perf_counter() - debut
+    evaluations = probleme.nb_evaluations
+
+    pic = None
+    if memoire:
+        random.seed(graine)
+        tracemalloc.start()
+        try:
+            solveur.resoudre(probleme)
+            pic = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        probleme.nb_evaluations = evaluations
+
+    return {
+        "cout": cout,
+        "duree_s": duree,
+        "evaluations": evaluations,
+        "evaluations_par_s": evaluations / duree if duree > 0 else None,
+        "memoire_pic_octets": pic,
+        "solution": list(solution),
+    }
+
+
+def _parametres(solveur):
+    # Lecture superficielle : asdict() copierait en profondeur un cache ou un observateur
+    return {champ.name: getattr(solveur, champ.name) for champ in fields(solveur)}
+
+
+def _environnement(etiquette):
+    return {
+        "etiquette": etiquette,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def executer_benchmark(problemes, solveurs, graines, meilleurs_connus=None, memoire=True, sortie=None,
+                       etiquette=None, garder_solutions=False):
+    """
+    Exécute chaque solveur sur chaque problème pour chaque graine.
+
+    - solveurs : {nom: instance de solveur} (voir solveurs.SOLVEURS)
+    - meilleurs_connus : {nom d'instance: valeur de référence}, pour l'écart en %
+    - sortie : fichier JSON Lines complété au fil des exécutions (None = pas d'écriture)
+    Retourne la liste des enregistrements.
+    """
+    meilleurs_connus = meilleurs_connus or {}
+    environnement = _environnement(etiquette)
+    resultats = []
+    fichier = open(sortie, "a", encoding="utf-8") if sortie else None
+    try:
+        for probleme in problemes:
+            reference = meilleurs_connus.get(probleme.nom)
+            for nom_solveur, solveur in solveurs.items():
+                for graine in graines:
+                    mesure = mesurer(probleme, solveur, graine, memoire)
+                    if not garder_solutions:
+                        del mesure["solution"]
+                    enregistrement = {
+                        "instance": probleme.nom,
+                        "taille": probleme.taille,
+                        "solveur": nom_solveur,
+                        "parametres": _parametres(solveur),
+                        "graine": graine,
+                        **mesure,
+                        "meilleur_connu": reference,
+                        "ecart_pct": 100 * (mesure["cout"] - reference) / reference if reference else None,
+                        **environnement,
+                    }
+                    resultats.append(enregistrement)
+                    if fichier is not None:
+                        fichier.write(json.dumps(enregistrement, default=repr) + "\n")
+                        fichier.flush()
+    finally:
+        if fichier is not None:
+            fichier.close()
+    return resultats
+
+
+def lire_resultats(chemin):
+    with open(chemin, encoding="utf-8") as fichier:
+        return [json.loads(ligne) for ligne in fichier if ligne.strip()]
+
+
+def _configuration(resultat):
+    return json.dumps(resultat["parametres"], sort_keys=True, default=repr)
+
+
+def resumer(resultats):
+    """
+    Moyennes sur les graines par (instance, solveur, paramètres du solveur).
+    """
+    groupes = {}
+    for resultat in resultats:
+        cle = (resultat["instance"], resultat["solveur"], _configuration(resultat))
+        groupes.setdefault(cle, []).append(resultat)
+    resume = {}
+    for cle, groupe in groupes.items():
+        ecarts = [r["ecart_pct"] for r in groupe if r.get("ecart_pct") is not None]
+        memoires = [r["memoire_pic_octets"] for r in groupe if r.get("memoire_pic_octets") is not None]
+        resume[cle] = {
+            "executions": len(groupe),
+            "cout": mean(r["cout"] for r in groupe),
+            "ecart_pct": mean(ecarts) if ecarts else None,
+            "duree_s": mean(r["duree_s"] for r in groupe),
+            "evaluations_par_s": mean(r["evaluations_par_s"] or 0 for r in groupe),
+            "memoire_pic_octets": max(memoires) if memoires else None,
+        }
+    return resume
+
+
+def comparer(reference, courant, seuil=0.10):
+    """
+    Compare deux séries de résultats et retourne la liste des régressions :
+    durée moyenne ou pic mémoire en hausse de plus de `seuil` (fraction), ou coût
+    moyen plus élevé, pour une même instance et un même solveur avec les mêmes paramètres.
+    """
+    avant, apres = resumer(reference), resumer(courant)
+    regressions = []
+    for cle in sorted(avant.keys() & apres.keys()):
+        a, b = avant[cle], apres[cle]
+        for mesure in ("duree_s", "memoire_pic_octets"):
+            if a[mesure] and b[mesure] and b[mesure] > a[mesure] * (1 + seuil):
+                regressions.append(f"{cle[0]} / {cle[1]} : {mesure} {a[mesure]:.4g} -> {b[mesure]:.4g}")
+        if b["cout"] > a["cout"]:
+            regressions.append(f"{cle[0]} / {cle[1]} : cout {a['cout']:.6g} -> {b['cout']:.6g}")
+    return regressions
+
+
+def _afficher(resume):
+    print(f"{'instance':<20}{'solveur':<14}{'cout':>14}{'ecart %':>10}{'temps (s)':>12}{'eval/s':>14}{'mem (Mo)':>10}")
+    for (instance, solveur, _), r in sorted(resume.items()):
+        ecart = f"{r['ecart_pct']:.2f}" if r["ecart_pct"] is not None else "-"
+        memoire = f"{r['memoire_pic_octets'] / 2**20:.1f}" if r["memoire_pic_octets"] is not None else "-"
+        print(f"{instance:<20}{solveur:<14}{r['cout']:>14.6g}{ecart:>10}{r['duree_s']:>12.3f}"
+              f"{r['evaluations_par_s']:>14.0f}{memoire:>10}")
+
+
+def main(arguments=None):
+    parseur = argparse.ArgumentParser(description="Banc d'essai des solveurs d'algo_evolutionnaire.")
+    parseur.add_argument("--tsp", nargs="*", default=[], help="fichiers TSPLIB (.tsp / .atsp)")
+    parseur.add_argument("--wt", nargs="*", default=[], help="fichiers OR-Library de retard pondéré (wt40.txt, ...)")
+    parseur.add_argument("--wt-limite", type=int, default=None, help="nombre d'instances lues par fichier wt")
+    parseur.add_argument("--aleatoire-tsp", nargs="*", type=int, default=[], help="tailles de TSP aléatoires")
+    parseur.add_argument("--aleatoire-twt", nargs="*", type=int, default=[], help="tailles de TWT aléatoires")
+    parseur.add_argument("--meilleurs", nargs="*", default=[],
+                         help="fichiers de valeurs de référence (« nom : valeur », "
+                              "ou une valeur par ligne pour --wt)")
+    parseur.add_argument("--solveurs", nargs="*", default=sorted(SOLVEURS), choices=sorted(SOLVEURS))
+    parseur.add_argument("--parametres", default="{}",
+                         help='paramètres JSON par solveur, ex: \'{"recuit": {"iterations_max": 20000}}\'')
+    parseur.add_argument("--graines", nargs="*", type=int, default=[0, 1, 2])
+    parseur.add_argument("--sortie", default=None, help="fichier JSON Lines de résultats (complété)")
+    parseur.add_argument("--etiquette", default=None, help="étiquette de version enregistrée avec les résultats")
+    parseur.add_argument("--sans-memoire", action="store_true", help="ne pas mesurer le pic mémoire")
+    parseur.add_argument("--comparer", default=None, help="résultats de référence (JSON Lines) à comparer")
+    parseur.add_argument("--seuil", type=float, default=0.10, help="tolérance de régression (fraction)")
+    args = parseur.parse_args(arguments)
+
+    problemes = [charger_tsplib(chemin) for chemin in args.tsp]
+    wt = [probleme for chemin in args.wt for probleme in charger_orlib_wt(chemin)[:args.wt_limite]]
+    problemes += wt
+    problemes += [tsp_aleatoire(n) for n in args.aleatoire_tsp] + [twt_aleatoire(n) for n in args.aleatoire_twt]
+    if not problemes:
+        parseur.error("aucune instance : utilisez --tsp, --wt, --aleatoire-tsp ou --aleatoire-twt")
+
+    meilleurs = {}
+    for chemin in args.meilleurs:
+        meilleurs.update(charger_meilleurs_connus(chemin, [probleme.nom for probleme in wt]))
+
+    parametres = json.loads(args.parametres)
+    solveurs = {nom: SOLVEURS[nom](**parametres.get(nom, {})) for nom in args.solveurs}
+
+    resultats = executer_benchmark(problemes, solveurs, args.graines, meilleurs, memoire=not args.sans_memoire,
+                                   sortie=args.sortie, etiquette=args.etiquette)
+    _afficher(resumer(resultats))
+
+    if args.comparer:
+        regressions = comparer(lire_resultats(args.comparer), resultats, args.seuil)
+        for regression in regressions:
+            print("RÉGRESSION", regression)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+from collections import OrderedDict
+
+import numpy as np
+
+# --- Cache de fitness pour les populations ---
+# Chaque permutation est identifiée par un hachage de type Zobrist sur 64 bits :
+# XOR des valeurs Z(position, gène). Au lieu d'une table n x n (800 Mo pour
+# n = 10 000), Z(p, g) mélange une clé aléatoire par gène et une par position
+# par la finalisation de MurmurHash3 : 16 octets par position. Le hachage d'une
+# population entière se calcule d'un bloc avec NumPy. Les coûts sont conservés
+# dans un dictionnaire ordonné de taille bornée, le moins récemment utilisé
+# étant évincé en premier (LRU). Les collisions (probabilité ~ m² / 2^65 pour m
+# permutations distinctes) sont ignorées.
+
+_DECALAGE = np.uint64(33)
+_MULTIPLICATEURS = (np.uint64(0xFF51AFD7ED558CCD), np.uint64(0xC4CEB9FE1A85EC53))
+
+
+def _melanger(valeurs):
+    # Finalisation fmix64 de MurmurHash3, sur place (tableau uint64, arithmétique modulo 2^64)
+    for multiplicateur in _MULTIPLICATEURS:
+        valeurs ^= valeurs >> _DECALAGE
+        valeurs *= multiplicateur
+    valeurs ^= valeurs >> _DECALAGE
+    return valeurs
+
+
+class CacheFitness:
+    """
+    Cache LRU des coûts, indexé par le hachage de Zobrist des individus.
+    - taille_individu : longueur des permutations
+    - taille_max : nombre maximal d'entrées conservées (environ 100 octets chacune) ;
+      les clés de hachage occupent en plus 16 octets par position
+    Compteurs : succes (coûts retrouvés, y compris doublons d'une même population),
+    echecs (individus réellement évalués), evictions.
+    """
+
+    def __init__(self, taille_individu, taille_max=100_000, graine=0):
+        if taille_max < 1:
+            raise ValueError("taille_max doit être au moins 1.")
+        rng = np.random.default_rng(graine)
+        self._cles_genes = rng.integers(0, 2**64, size=taille_individu, dtype=np.uint64)
+        self._cles_positions = rng.integers(0, 2**64, size=taille_individu, dtype=np.uint64)
+        self.taille_max = taille_max
+        self._entrees = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+
+    # --- Hachage ---
+
+    def hacher(self, individu):
+        return int(self.hacher_population(np.asarray(individu)[np.newaxis])[0])
+
+    def hacher_population(self, population):
+        """
+        Hachages (uint64) de toutes les lignes d'un tableau 2-D d'individus.
+        """
+        valeurs = self._cles_genes[np.asarray(population)]
+        valeurs ^= self._cles_positions
+        return np.bitwise_xor.reduce(_melanger(valeurs), axis=1)
+
+    # --- Accès au cache ---
+
+    def __len__(self):
+        return len(self._entrees)
+
+    @property
+    def taux_succes(self):
+        total = self.succes + self.echecs
+        return self.succes / total if total else 0.0
+
+    def obtenir(self, cle):
+        """
+        Coût associé à la clé (None si absent) ; l'entrée devient la plus récente.
+        """
+        cout = self._entrees.get(cle)
+        if cout is not None:
+            self._entrees.move_to_end(cle)
+        return cout
+
+    def ajouter(self, cle, cout):
+        self._entrees[cle] = cout
+        self._entrees.move_to_end(cle)
+        if len(self._entrees) > self.taille_max:
+            self._entrees.popitem(last=False)
+            self.evictions += 1
+
+    def cout(self, individu, fonction_cout):
+        """
+        Coût d'un individu, calculé par fonction_cout(individu) seulement s'il est absent du cache.
+        """
+        cle = self.hacher(individu)
+        cout = self.obtenir(cle)
+        if cout is None:
+            self.echecs += 1
+            cout = fonction_cout(individu)
+            self.ajouter(cle, cout)
+        else:
+            self.succes += 1
+        return cout
+
+    def evaluer_population(self, population, evaluer):
+        """
+        Coûts de toutes les lignes de `population` : seuls les individus absents
+        du cache (et distincts entre eux) sont passés, en un seul bloc, à evaluer(sous_population).
+        """
+        population = np.asarray(population)
+        cles = self.hacher_population(population).tolist()
+        couts = [None] * len(cles)
+        a_evaluer = {}  # clé -> indice de la première ligne concernée
+        for k, cle in enumerate(cles):
+            cout = self.obtenir(cle)
+            if cout is not None:
+                couts[k] = cout
+                self.succes += 1
+            elif cle in a_evaluer:
+                self.succes += 1  # Doublon dans la population : évalué une seule fois
+            else:
+                a_evaluer[cle] = k
+                self.echecs += 1
+
+        if a_evaluer:
+            nouveaux = dict(zip(a_evaluer, np.asarray(evaluer(population[list(a_evaluer.values())])).tolist()))
+            for cle, cout in nouveaux.items():
+                self.ajouter(cle, cout)
+            for k, cle in enumerate(cles):
+                if couts[k] is None:
+                    couts[k] = nouveaux[cle]
+        return np.asarray(couts)
+
+    def envelopper(self, evaluer):
+        """
+        Retourne une fonction d'évaluation de population équivalente à `evaluer`, passant par le cache.
+        """
+        return lambda population: self.evaluer_population(population, evaluer)
+
+    def statistiques(self):
+        return {"entrees": len(self), "succes": self.succes, "echecs": self.echecs,
+                "evictions": self.evictions, "taux_succes": self.taux_succes}
@@ -0,0 +1,303 @@
+import math
+
+import numpy as np
+
+from .distances import SourceCoordonnees, SourceDistances, listes_voisins
+from .evaluation_TSP import matrice_en_tableau
+from .genetique import generer_population
+from .mutations import mutation_lot
+from .problemes import ProblemeFlowTime, ProblemeTSP, ProblemeTWT
+from .selection import generateur_numpy
+
+# --- Heuristiques de construction ---
+# Solutions de départ bien meilleures qu'un ordre aléatoire, obtenues en une passe :
+# TSP :
+# - plus_proche_voisin : avec des coordonnées (SourceCoordonnees), grille de cases
+#   parcourue en anneaux autour de la ville courante, O(n) en moyenne ; sinon
+#   une ligne de la matrice par ville, O(n²) vectorisé
+# - aretes_gloutonnes : arêtes des k plus proches voisins par longueur croissante,
+#   gardées tant qu'elles ne créent ni degré 3 ni cycle ; fragments raccordés au plus
+#   proche (le calcul des listes de voisins, O(n²) vectorisé, domine)
+# - hilbert : villes dans l'ordre de la courbe de Hilbert (coordonnées requises), O(n log n)
+# Ordonnancement :
+# - spt : durées croissantes (optimal pour le flow time)
+# - edd : dates de livraison croissantes
+# - atc : règle Apparent Tardiness Cost pour le TWT, O(n²) vectorisé
+# population_amorcee construit une fraction d'une population initiale d'AG à
+# partir de ces solutions, perturbées pour garder de la diversité.
+#
+#     AGElitiste(amorcage=0.1).resoudre(probleme)
+#     RechercheTabou(depart="aretes_gloutonnes").resoudre(probleme)
+
+VILLES_PAR_CASE = 2  # Occupation moyenne visée pour la grille du plus proche voisin
+BITS_HILBERT = 16  # Résolution de la courbe : 2**16 x 2**16 cases
+K_ARETES = 10  # Voisins par ville envisagés par aretes_gloutonnes
+K_ATC = 2.0  # Paramètre d'anticipation de la règle ATC
+
+
+def _coordonnees(matrice):
+    # (x, y) si les distances croissent avec la distance euclidienne des coordonnées, sinon None
+    if isinstance(matrice, SourceCoordonnees) and matrice.type_distance != "GEO":
+        return matrice.x, matrice.y
+    return None
+
+
+def _lecteurs(matrice):
+    # Lecture vectorisée des distances : d(u, v) élément par élément et ligne(a)
+    source = matrice_en_tableau(matrice)
+    if isinstance(source, SourceDistances):
+        return source.distances, lambda a: source.lignes(a, a + 1)[0]
+    return (lambda u, v: source[u, v]), (lambda a: source[a])
+
+
+# --- TSP : plus proche voisin ---
+
+def _ppv_matrice(matrice, depart):
+    _, ligne = _lecteurs(matrice)
+    n = len(matrice)
+    visitees = np.zeros(n, dtype=bool)
+    tour = [depart]
+    visitees[depart] = True
+    for _ in range(n - 1):
+        distances = np.where(visitees, np.inf, ligne(tour[-1]))
+        suivante = int(np.argmin(distances))
+        visitees[suivante] = True
+        tour.append(suivante)
+    return tour
+
+
+def _ppv_grille(x, y, depart):
+    n = len(x)
+    cote = max(1, math.isqrt(n // VILLES_PAR_CASE))
+    xmin, ymin = x.min(), y.min()
+    pas = max(x.max() - xmin, y.max() - ymin) / cote or 1.0
+    cx = np.minimum(((x - xmin) / pas).astype(np.intp), cote - 1).tolist()
+    cy = np.minimum(((y - ymin) / pas).astype(np.intp), cote - 1).tolist()
+    cases = [[[] for _ in range(cote)] for _ in range(cote)]
+    for v in range(n):
+        cases[cx[v]][cy[v]].append(v)
+    xs, ys = x.tolist(), y.tolist()
+    restantes = np.ones(n, dtype=bool)
+
+    def retirer(v):
+        cases[cx[v]][cy[v]].remove(v)
+        restantes[v] = False
+
+    tour = [depart]
+    retirer(depart)
+    for nb_restantes in range(n - 1, 0, -1):
+        a = tour[-1]
+        ax, ay, ca, cb = xs[a], ys[a], cx[a], cy[a]
+        meilleure, meilleur_d2, rayon = -1, math.inf, 0
+        # Anneaux de cases de plus en plus larges : une ville hors des anneaux 0..r est à plus de r * pas
+        while (meilleure < 0 or meilleur_d2 > ((rayon - 1) * pas) ** 2) and (2 * rayon - 1) ** 2 <= 4 * nb_restantes:
+            for i in range(max(0, ca - rayon), min(cote, ca + rayon + 1)):
+                bord = i == ca - rayon or i == ca + rayon
+                for j in (range(max(0, cb - rayon), min(cote, cb + rayon + 1)) if bord
+                          else [j for j in (cb - rayon, cb + rayon) if 0 <= j < cote]):
+                    for v in cases[i][j]:
+                        d2 = (xs[v] - ax) ** 2 + (ys[v] - ay) ** 2
+                        if d2 < meilleur_d2:
+                            meilleure, meilleur_d2 = v, d2
+            rayon += 1
+        if meilleure < 0 or meilleur_d2 > ((rayon - 1) * pas) ** 2:
+            # Villes restantes trop éparses pour les anneaux : recherche directe
+            candidates = np.flatnonzero(restantes)
+            meilleure = int(candidates[np.argmin((x[candidates] - ax) ** 2 + (y[candidates] - ay) ** 2)])
+        retirer(meilleure)
+        tour.append(meilleure)
+    return tour
+
+
+def plus_proche_voisin(matrice, depart=0):
+    """
+    Tournée du plus proche voisin depuis la ville `depart`. Sur une SourceCoordonnees
+    (hors GEO), la recherche passe par une grille de cases et compare les distances
+    euclidiennes exactes (les égalités des distances arrondies sont départagées) ;
+    sinon par les lignes de la matrice.
+    """
+    coordonnees = _coordonnees(matrice)
+    if coordonnees is not None:
+        return _ppv_grille(*coordonnees, depart)
+    return _ppv_matrice(matrice, depart)
+
+
+# --- TSP : arêtes gloutonnes ---
+
+def _racine(parents, v):
+    while parents[v] != v:
+        parents[v] = parents[parents[v]]
+        v = parents[v]
+    return v
+
+
+def aretes_gloutonnes(matrice, k=K_ARETES):
+    """
+    Heuristique gloutonne des arêtes sur les arêtes (a, b), b parmi les k plus
+    proches voisins de a : par longueur croissante, une arête est gardée si ses deux
+    extrémités sont de degré < 2 et dans des fragments différents. Les fragments
+    obtenus sont ensuite enchaînés, chacun relié au plus proche fragment restant.
+    """
+    n = len(matrice)
+    if n < 3:
+        return list(range(n))
+    d, _ = _lecteurs(matrice)
+    voisins = np.asarray(listes_voisins(matrice, k))
+    a, b = np.repeat(np.arange(n), voisins.shape[1]), voisins.ravel()
+    a, b = np.minimum(a, b), np.maximum(a, b)
+    cles = np.unique(a * n + b)  # Chaque arête une fois
+    a, b = np.divmod(cles, n)
+    ordre = np.argsort(d(a, b), kind="stable")
+
+    degres, parents = [0] * n, list(range(n))
+    adjacentes = [[] for _ in range(n)]
+    for u, v in zip(a[ordre].tolist(), b[ordre].tolist()):
+        if degres[u] < 2 and degres[v] < 2:
+            ru, rv = _racine(parents, u), _racine(parents, v)
+            if ru != rv:
+                parents[ru] = rv
+                degres[u] += 1
+                degres[v] += 1
+                adjacentes[u].append(v)
+                adjacentes[v].append(u)
+
+    # Enchaînement des fragments : parcours jusqu'à l'autre extrémité, puis extrémité libre la plus proche
+    extremites = np.array([v for v in range(n) if degres[v] < 2])
+    visitees = np.zeros(n, dtype=bool)
+    tour, courante = [], int(extremites[0])
+    while True:
+        precedente = -1
+        while courante >= 0:
+            tour.append(courante)
+            visitees[courante] = True
+            suivantes = [v for v in adjacentes[courante] if v != precedente and not visitees[v]]
+            precedente, courante = courante, (suivantes[0] if suivantes else -1)
+        libres = extremites[~visitees[extremites]]
+        if len(libres) == 0:
+            return tour
+        courante = int(libres[np.argmin(d(np.full(len(libres), tour[-1]), libres))])
+
+
+# --- TSP : courbe de Hilbert ---
+
+def indices_hilbert(x, y, bits=BITS_HILBERT):
+    """
+    Rang de chaque point (x, y) le long de la courbe de Hilbert couvrant leur
+    boîte englobante, sur une grille de 2**bits cases de côté.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    cote = 1 << bits
+    etendue = max(x.max() - x.min(), y.max() - y.min()) or 1.0
+    xi = np.minimum(((x - x.min()) / etendue * cote).astype(np.int64), cote - 1)
+    yi = np.minimum(((y - y.min()) / etendue * cote).astype(np.int64), cote - 1)
+    rangs = np.zeros(len(x), dtype=np.int64)
+    s = cote >> 1
+    while s > 0:
+        rx, ry = (xi & s) > 0, (yi & s) > 0
+        rangs += s * s * ((3 * rx) ^ ry)
+        # Rotation du quadrant pour que la sous-courbe soit dans l'orientation de référence
+        retourner = ~ry & rx
+        xi, yi = np.where(retourner, cote - 1 - xi, xi), np.where(retourner, cote - 1 - yi, yi)
+        xi, yi = np.where(ry, xi, yi), np.where(ry, yi, xi)
+        s >>= 1
+    return rangs
+
+
+def ordre_hilbert(matrice):
+    """
+    Tournée des villes dans l'ordre de la courbe de Hilbert (SourceCoordonnees, hors GEO).
+    """
+    coordonnees = _coordonnees(matrice)
+    if coordonnees is None:
+        raise ValueError("La courbe de Hilbert demande des coordonnées (SourceCoordonnees, hors GEO).")
+    return np.argsort(indices_hilbert(*coordonnees), kind="stable").tolist()
+
+
+# --- Ordonnancement ---
+
+def spt(durees):
+    # Shortest Processing Time : optimal pour le flow time sur une machine
+    return np.argsort(np.asarray(durees), kind="stable").tolist()
+
+
+def edd(dates):
+    # Earliest Due Date : optimal pour le retard maximal
+    return np.argsort(np.asarray(dates), kind="stable").tolist()
+
+
+def atc(p, d, w, k=K_ATC):
+    """
+    Règle Apparent Tardiness Cost : à chaque date t, la tâche suivante maximise
+    (w / p) * exp(-max(d - p - t, 0) / (k * p_moyen)), p_moyen étant la durée moyenne
+    des tâches restantes (calculé en logarithme, sans dépassement de capacité).
+    """
+    p, d, w = (np.asarray(v, dtype=float) for v in (p, d, w))
+    priorites = np.log(w / p)
+    restantes = np.ones(len(p), dtype=bool)
+    ordre, t, reste = [], 0.0, p.sum()
+    for nb_restantes in range(len(p), 0, -1):
+        marges = np.maximum(d - p - t, 0.0)
+        scores = np.where(restantes, priorites - marges / (k * reste / nb_restantes), -np.inf)
+        tache = int(np.argmax(scores))
+        ordre.append(tache)
+        restantes[tache] = False
+        t += p[tache]
+        reste -= p[tache]
+    return ordre
+
+
+# --- Par problème ---
+
+HEURISTIQUES = {
+    "plus_proche_voisin": (ProblemeTSP, lambda probleme: plus_proche_voisin(probleme.matrice)),
+    "aretes_gloutonnes": (ProblemeTSP, lambda probleme: aretes_gloutonnes(probleme.matrice)),
+    "hilbert": (ProblemeTSP, lambda probleme: ordre_hilbert(probleme.matrice)),
+    "spt": ((ProblemeFlowTime, ProblemeTWT),
+            lambda probleme: spt(probleme.durees if isinstance(probleme, ProblemeFlowTime) else probleme.p)),
+    "edd": (ProblemeTWT, lambda probleme: edd(probleme.d)),
+    "atc": (ProblemeTWT, lambda probleme: atc(probleme.p, probleme.d, probleme.w)),
+}
+
+
+def heuristiques_par_defaut(probleme):
+    # Heuristiques utilisées par population_amorcee lorsqu'aucune n'est indiquée
+    if isinstance(probleme, ProblemeTSP):
+        return ("aretes_gloutonnes", "plus_proche_voisin") + (("hilbert",) if _coordonnees(probleme.matrice) else ())
+    if isinstance(probleme, ProblemeTWT):
+        return ("atc", "edd", "spt")
+    return ("spt",)
+
+
+def construire(probleme, heuristique):
+    """
+    Solution du problème construite par `heuristique` (nom de HEURISTIQUES).
+    """
+    if heuristique not in HEURISTIQUES:
+        raise ValueError(f"Heuristique non reconnue. Choisissez parmi {', '.join(HEURISTIQUES)}.")
+    problemes, fonction = HEURISTIQUES[heuristique]
+    if not isinstance(probleme, problemes):
+        raise ValueError(f"L'heuristique '{heuristique}' ne s'applique pas au problème '{probleme.nom}'.")
+    return fonction(probleme)
+
+
+def population_amorcee(probleme, taille_population, proportion=0.1, heuristiques=None, force=3,
+                       mutation="echange"):
+    """
+    Population initiale dont une fraction `proportion` provient des heuristiques
+    (heuristiques_par_defaut si None), à tour de rôle : la première copie de chaque
+    solution est intacte, les suivantes subissent `force` mutations `mutation`
+    (mutations.MUTATIONS). Le reste de la population est aléatoire. Retourne un
+    tableau 2-D utilisable comme population_initiale des AG.
+    """
+    nb_amorces = min(taille_population, round(proportion * taille_population))
+    aleatoires = np.asarray(generer_population(taille_population - nb_amorces, probleme.taille),
+                            dtype=np.intp).reshape(-1, probleme.taille)
+    if nb_amorces == 0:
+        return aleatoires
+    solutions = [construire(probleme, heuristique)
+                 for heuristique in (heuristiques or heuristiques_par_defaut(probleme))]
+    amorces = np.array([solutions[k % len(solutions)] for k in range(nb_amorces)], dtype=np.intp)
+    rng = generateur_numpy()
+    for _ in range(force):
+        mutation_lot(mutation, amorces[len(solutions):], 1.0, rng)
+    return np.concatenate((amorces, aleatoires))
@@ -0,0 +1,294 @@
+import random
+
+import numpy as np
+
+# --- Croisements pour chromosomes de permutation ---
+# Les parents et l'enfant sont des tableaux NumPy d'entiers ; les tests
+# d'appartenance (« gène déjà placé ? ») passent par un tableau booléen ou un
+# tableau de positions au lieu d'une recherche dans une liste, d'où un coût O(n)
+# par enfant. Les tableaux de travail (Tampons) et le tableau de sortie sont
+# fournis par l'appelant et réutilisés d'un enfant à l'autre.
+
+
+class Tampons:
+    """
+    Tableaux de travail de taille n réutilisés par les croisements.
+    """
+
+    def __init__(self, n):
+        self.present = np.zeros(n, dtype=bool)
+        self.position = np.empty(n, dtype=np.intp)
+
+
+def _preparer(parent, sortie, tampons):
+    n = len(parent)
+    if sortie is None:
+        sortie = np.empty(n, dtype=parent.dtype)
+    if tampons is None:
+        tampons = Tampons(n)
+    return n, sortie, tampons
+
+
+# --- OX (Order Crossover) ---
+
+def croisement_ox(parent1, parent2, debut, fin, sortie=None, tampons=None):
+    """
+    Copie parent1[debut:fin] puis place les gènes manquants dans l'ordre où ils
+    apparaissent dans parent2, à partir de la position fin (en bouclant).
+    Même enfant que croisement_permutation_valide (ci-dessous) pour le même segment.
+    """
+    n, sortie, tampons = _preparer(parent1, sortie, tampons)
+    present = tampons.present
+    present[:] = False
+    sortie[debut:fin] = parent1[debut:fin]
+    present[parent1[debut:fin]] = True
+    reste = parent2[~present[parent2]]
+    sortie[(fin + np.arange(len(reste))) % n] = reste
+    return sortie
+
+
+# --- PMX (Partially Mapped Crossover) ---
+
+def croisement_pmx(parent1, parent2, debut, fin, sortie=None, tampons=None):
+    """
+    L'enfant part de parent2 ; chaque gène de parent1[debut:fin] est amené à sa
+    position par un échange, suivi grâce au tableau des positions : O(n).
+    """
+    n, sortie, tampons = _preparer(parent1, sortie, tampons)
+    position = tampons.position
+    sortie[:] = parent2
+    position[sortie] = np.arange(n)
+    for k in range(debut, fin):
+        gene, deplace = parent1[k], sortie[k]
+        j = position[gene]
+        sortie[k], sortie[j] = gene, deplace
+        position[gene], position[deplace] = k, j
+    return sortie
+
+
+# --- CX (Cycle Crossover) ---
+
+def croisement_cycle(parent1, parent2, sortie=None, tampons=None):
+    """
+    Les cycles de positions sont copiés alternativement depuis parent1 et parent2 :
+    chaque gène garde la position qu'il avait chez l'un des parents.
+    """
+    n, sortie, tampons = _preparer(parent1, sortie, tampons)
+    position, impair = tampons.position, tampons.present
+    position[parent1] = np.arange(n)
+    suivant = position[parent2].tolist()  # Position suivante dans le cycle
+    numero = [-1] * n  # Numéro du cycle de chaque position
+    cycle = 0
+    for depart in range(n):
+        k = depart
+        while numero[k] < 0:
+            numero[k] = cycle
+            k = suivant[k]
+        if numero[depart] == cycle:
+            cycle += 1
+    # Cycles pairs depuis parent1, impairs depuis parent2
+    np.bitwise_and(numero, 1, out=impair, casting="unsafe")
+    sortie[:] = parent1
+    np.copyto(sortie, parent2, where=impair)
+    return sortie
+
+
+# --- ERX (Edge Recombination Crossover) ---
+
+def croisement_arete(parent1, parent2, sortie=None, tampons=None):
+    """
+    Construit l'enfant à partir des arêtes des deux parents : depuis la ville
+    courante, on va vers la voisine (dans l'un des parents) qui a le moins de
+    voisines restantes ; si aucune ne reste, vers une ville non visitée au hasard.
+    """
+    n, sortie, tampons = _preparer(parent1, sortie, tampons)
+    visite = tampons.present
+    visite[:] = False
+
+    # Table des arêtes : les (au plus) quatre voisines de chaque ville
+    aretes = np.empty((n, 4), dtype=np.intp)
+    aretes[parent1, 0], aretes[parent1, 1] = np.roll(parent1, 1), np.roll(parent1, -1)
+    aretes[parent2, 2], aretes[parent2, 3] = np.roll(parent2, 1), np.roll(parent2, -1)
+    restantes = [set(ligne) for ligne in aretes.tolist()]
+
+    # Villes non visitées, avec suppression en O(1) (échange avec la dernière)
+    non_visitees = list(range(n))
+    indice = list(range(n))
+
+    courante = int(parent1[0])
+    for k in range(n):
+        sortie[k] = courante
+        visite[courante] = True
+        derniere = non_visitees.pop()
+        if derniere != courante:
+            non_visitees[indice[courante]] = derniere
+            indice[derniere] = indice[courante]
+        for voisine in restantes[courante]:
+            restantes[voisine].discard(courante)
+        if k == n - 1:
+            break
+        candidates = restantes[courante]
+        if candidates:
+            courante = min(candidates, key=lambda ville: (len(restantes[ville]), random.random()))
+        else:
+            courante = random.choice(non_visitees)
+    return sortie
+
+
+# --- Croisement d'une génération entière ---
+
+OPERATEURS_SEGMENT = {"ox": croisement_ox, "pmx": croisement_pmx}
+OPERATEURS_SANS_SEGMENT = {"cycle": croisement_cycle, "arete": croisement_arete}
+
+
+def tirer_segments(rng, nb_enfants, n):
+    """
+    Tire pour chaque enfant un segment [debut, fin) avec 0 <= debut < fin <= n - 1
+    (deux positions distinctes triées, comme random.sample(range(n), 2)).
+    """
+    a = rng.integers(0, n, nb_enfants)
+    b = (a + rng.integers(1, n, nb_enfants)) % n
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def croisement_ox_lot(parents1, parents2, debuts, fins, sortie=None):
+    """
+    OX vectorisé sur toute une génération : la ligne r de `sortie` reçoit l'enfant
+    de parents1[r] et parents2[r] pour le segment [debuts[r], fins[r]).
+    """
+    m, n = parents1.shape
+    if sortie is None:
+        sortie = np.empty_like(parents1)
+    lignes = np.arange(m)[:, None]
+    colonnes = np.arange(n)
+    dans_segment = (colonnes >= debuts[:, None]) & (colonnes < fins[:, None])
+    np.copyto(sortie, parents1, where=dans_segment)
+
+    # present[r, g] : le gène g est dans le segment copié depuis parents1[r]
+    present = np.empty((m, n), dtype=bool)
+    present[lignes, parents1] = dans_segment
+    garder = ~present[lignes, parents2]
+
+    # Le k-ième gène conservé de parents2[r] va en position (fins[r] + k) % n
+    rang = np.cumsum(garder, axis=1) - 1
+    r, c = np.nonzero(garder)
+    sortie[r, (fins[r] + rang[r, c]) % n] = parents2[r, c]
+    return sortie
+
+
+def croisement_lot(operateur, population, indices1, indices2, sortie, rng=None, tampons=None):
+    """
+    Produit une génération d'enfants dans le tableau réutilisé `sortie`
+    (len(indices1) lignes) à partir des couples population[indices1[r]],
+    population[indices2[r]]. operateur : "ox", "pmx", "cycle" ou "arete".
+    L'OX est entièrement vectorisé ; les autres bouclent sur les enfants avec
+    des tampons partagés.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    nb_enfants, n = len(indices1), population.shape[1]
+    parents1, parents2 = population[indices1], population[indices2]
+    if operateur == "ox":
+        debuts, fins = tirer_segments(rng, nb_enfants, n)
+        return croisement_ox_lot(parents1, parents2, debuts, fins, sortie[:nb_enfants])
+
+    tampons = Tampons(n) if tampons is None else tampons
+    if operateur in OPERATEURS_SEGMENT:
+        fonction = OPERATEURS_SEGMENT[operateur]
+        debuts, fins = tirer_segments(rng, nb_enfants, n)
+        for r in range(nb_enfants):
+            fonction(parents1[r], parents2[r], debuts[r], fins[r], sortie[r], tampons)
+    elif operateur in OPERATEURS_SANS_SEGMENT:
+        fonction = OPERATEURS_SANS_SEGMENT[operateur]
+        for r in range(nb_enfants):
+            fonction(parents1[r], parents2[r], sortie[r], tampons)
+    else:
+        raise ValueError("Croisement non reconnu. Choisissez parmi 'ox', 'pmx', 'cycle', 'arete'.")
+    return sortie[:nb_enfants]
+
+
+# --- Croisements sur listes (algorithmes génétiques) ---
+# Un enfant à la fois, sur des listes Python ; tous produisent une permutation valide.
+
+def croisement_permutation_valide(individu1, individu2):
+    """
+    Croisement adapté aux problèmes de permutation (comme le TSP - type OX/PMX).
+    Garantit que l'enfant est une permutation valide sans doublons.
+    """
+    taille = len(individu1)
+    debut, fin = sorted(random.sample(range(taille), 2))
+    enfant = [None] * taille
+    enfant[debut:fin] = individu1[debut:fin]
+    present = [False] * taille  # present[g] : le gène g est déjà dans l'enfant (test en O(1))
+    for gene in enfant[debut:fin]:
+        present[gene] = True
+
+    position = fin
+    for gene in individu2:
+        if not present[gene]:
+            if position >= taille:
+                position = 0
+            enfant[position] = gene
+            position += 1
+    return enfant
+
+
+def croisement_simple(p1, p2):
+    """
+    Croisement 1 point : tête de p1, puis les gènes restants dans l'ordre de p2.
+    """
+    point = random.randint(1, len(p1)-2)
+    tete = set(p1[:point])
+    enfant = p1[:point] + [v for v in p2 if v not in tete]
+    return enfant
+
+
+def croisement_double(p1, p2):
+    """
+    Croisement 2 points : segment de p1 à sa place, le reste dans l'ordre de p2.
+    """
+    a, b = sorted(random.sample(range(len(p1)), 2))
+    segment = p1[a:b]
+    dans_segment = set(segment)
+    reste = [v for v in p2 if v not in dans_segment]
+    return reste[:a] + segment + reste[a:]
+
+
+def croisement_uniforme(p1, p2):
+    """
+    Croisement uniforme avec réparation : les doublons sont remplacés par les gènes manquants.
+    """
+    taille = len(p1)
+    enfant = [p1[i] if random.random() < 0.5 else p2[i] for i in range(taille)]
+
+    # Comptage des occurrences
+    compteur = {}
+    for v in enfant:
+        compteur[v] = compteur.get(v, 0) + 1
+
+    # Identifier les doublons (indices à corriger) et les gènes manquants
+    doublons = [i for i, v in enumerate(enfant) if compteur[v] > 1]
+    manquantes = list(set(range(taille)) - set(enfant))
+
+    # Remplacer les doublons par les gènes manquants
+    for i in doublons:
+        v = enfant[i]
+        if compteur[v] > 1 and manquantes:
+            enfant[i] = manquantes.pop()
+            compteur[v] -= 1
+            compteur[enfant[i]] = 1
+    return enfant
+
+
+CROISEMENTS = {
+    "permutation": croisement_permutation_valide,
+    "simple": croisement_simple,
+    "double": croisement_double,
+    "uniforme": croisement_uniforme,
+}
+
+
+def obtenir_croisement(type_croisement):
+    if type_croisement not in CROISEMENTS:
+        raise ValueError("Type de croisement non reconnu. "
+                         "Choisissez parmi 'permutation', 'simple', 'double', 'uniforme'.")
+    return CROISEMENTS[type_croisement]
@@ -0,0 +1,262 @@
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+
+# --- Sources de distances pour le TSP ---
+# Tous les algorithmes lisent les distances par `matrice[a][b]` et `len(matrice)` :
+# une liste de listes convient pour les petites instances. Au-delà, une source
+# évite de construire n² entiers Python :
+# - MatriceDense : tableau NumPy compact (int32 / float32 par défaut)
+# - MatriceMemmap : fichier .npy projeté en mémoire, en lecture seule ; seul le
+#   chemin est transmis aux processus de travail, qui partagent les pages du fichier
+# - SourceCoordonnees : distances TSPLIB (EUC_2D, CEIL_2D, ATT, GEO) calculées à
+#   la demande depuis les coordonnées, avec un petit cache LRU optionnel
+# Les évaluations vectorisées (populations, listes de voisins) passent par
+# source.distances(u, v) et source.lignes(debut, fin) au lieu d'indexer case par case.
+
+TYPES_COORDONNEES = ("EUC_2D", "CEIL_2D", "ATT", "GEO")
+RAYON_TERRE = 6378.388  # Valeur fixée par TSPLIB pour GEO
+
+# Nombre de cases lues à la fois pour vérifier la symétrie ou remplir un fichier
+CELLULES_PAR_BLOC = 1 << 22
+
+
+def _entier_proche(x):
+    # nint() de TSPLIB : arrondi à l'entier le plus proche (0.5 vers le haut)
+    return np.floor(x + 0.5).astype(np.int64)
+
+
+def _radians_geo(v):
+    # Coordonnées GEO en degrés.minutes (DDD.MM)
+    degres = np.trunc(v)
+    return 3.141592 * (degres + 5.0 * (v - degres) / 3.0) / 180.0
+
+
+def distances_coordonnees(xa, ya, xb, yb, type_distance):
+    """
+    Distances TSPLIB entre les points (xa, ya) et (xb, yb), élément par élément
+    (tableaux diffusables entre eux). Retourne des entiers.
+    """
+    if type_distance == "GEO":
+        latitude_a, longitude_a = _radians_geo(xa), _radians_geo(ya)
+        latitude_b, longitude_b = _radians_geo(xb), _radians_geo(yb)
+        q1 = np.cos(longitude_a - longitude_b)
+        q2 = np.cos(latitude_a - latitude_b)
+        q3 = np.cos(latitude_a + latitude_b)
+        arc = np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0))
+        return (RAYON_TERRE * arc + 1.0).astype(np.int64)
+    dx, dy = xa - xb, ya - yb
+    if type_distance == "EUC_2D":
+        return _entier_proche(np.sqrt(dx * dx + dy * dy))
+    if type_distance == "CEIL_2D":
+        return np.ceil(np.sqrt(dx * dx + dy * dy)).astype(np.int64)
+    if type_distance == "ATT":
+        r = np.sqrt((dx * dx + dy * dy) / 10.0)
+        t = _entier_proche(r)
+        return np.where(t < r, t + 1, t)
+    raise ValueError(f"Type de distance non reconnu. Choisissez parmi {', '.join(TYPES_COORDONNEES)}.")
+
+
+def type_compact(tableau):
+    """
+    Type NumPy compact pour une matrice : int32 si les entiers y tiennent, float32 sinon.
+    """
+    tableau = np.asarray(tableau)
+    if np.issubdtype(tableau.dtype, np.integer):
+        limites = np.iinfo(np.int32)
+        if tableau.size == 0 or (limites.min <= tableau.min() and tableau.max() <= limites.max):
+            return np.int32
+        return np.int64
+    return np.float32
+
+
+class _Ligne:
+    # Ligne `a` d'une source : source[a][b] appelle distance(a, b) et retourne un scalaire Python
+    __slots__ = ("_distance", "_a")
+
+    def __init__(self, distance, a):
+        self._distance = distance
+        self._a = a
+
+    def __getitem__(self, b):
+        return self._distance(self._a, b)
+
+
+class SourceDistances:
+    """
+    Base des sources : distance(a, b) (scalaire Python), distances(u, v) (vectorisé),
+    lignes(debut, fin) (bloc dense), source[a][b] et len(source).
+    """
+
+    symetrique = None
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, a):
+        return _Ligne(self.distance, a)
+
+    def distance(self, a, b):
+        raise NotImplementedError
+
+    def distances(self, u, v):
+        raise NotImplementedError
+
+    def lignes(self, debut, fin):
+        return self.distances(np.arange(debut, min(fin, self.n))[:, None], np.arange(self.n)[None, :])
+
+    def longueur(self, chemin):
+        """
+        Longueur d'une tournée (retour au départ inclus), calculée d'un bloc.
+        """
+        chemin = np.asarray(chemin, dtype=np.intp)
+        longueurs = self.distances(chemin, np.roll(chemin, -1))
+        return longueurs.sum(dtype=np.result_type(longueurs.dtype, np.int64)).item()
+
+    def est_symetrique(self):
+        if self.symetrique is None:
+            self.symetrique = self._verifier_symetrie()
+        return self.symetrique
+
+    def _verifier_symetrie(self):
+        pas = max(1, CELLULES_PAR_BLOC // max(self.n, 1))
+        for debut in range(0, self.n, pas):
+            lignes = np.arange(debut, min(debut + pas, self.n))[:, None]
+            colonnes = np.arange(self.n)[None, :]
+            if not np.array_equal(self.distances(lignes, colonnes), self.distances(colonnes, lignes)):
+                return False
+        return True
+
+
+class MatriceDense(SourceDistances):
+    """
+    Matrice complète en tableau NumPy contigu.
+    dtype : type des cases (par défaut type_compact : int32 ou float32).
+    """
+
+    def __init__(self, matrice, dtype=None, symetrique=None):
+        tableau = np.asarray(matrice)
+        self.tableau = np.ascontiguousarray(tableau, dtype=dtype or type_compact(tableau))
+        self.n = len(self.tableau)
+        self.symetrique = symetrique
+        self.distance = self.tableau.item
+
+    def distances(self, u, v):
+        return self.tableau[u, v]
+
+    def lignes(self, debut, fin):
+        return self.tableau[debut:fin]
+
+
+class MatriceMemmap(MatriceDense):
+    """
+    Matrice lue dans un fichier .npy (voir enregistrer_matrice) projeté en
+    mémoire en lecture seule. Sérialisée par son seul chemin pour les processus de travail.
+    """
+
+    def __init__(self, chemin, symetrique=None):
+        self.chemin = os.fspath(chemin)
+        self.tableau = np.load(self.chemin, mmap_mode="r")
+        self.n = len(self.tableau)
+        self.symetrique = symetrique
+        self.distance = self.tableau.item
+
+    def __reduce__(self):
+        return MatriceMemmap, (self.chemin, self.symetrique)
+
+
+class SourceCoordonnees(SourceDistances):
+    """
+    Distances calculées à la demande depuis les coordonnées (x, y), sans matrice.
+    taille_cache : nombre de paires (a, b) mémorisées (LRU, 0 = pas de cache),
+    surtout utile pour GEO dont chaque distance coûte plusieurs fonctions trigonométriques.
+    """
+
+    symetrique = True
+
+    def __init__(self, x, y, type_distance="EUC_2D", taille_cache=0):
+        if type_distance not in TYPES_COORDONNEES:
+            raise ValueError(f"Type de distance non reconnu. Choisissez parmi {', '.join(TYPES_COORDONNEES)}.")
+        self.x, self.y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        self._x, self._y = self.x.tolist(), self.y.tolist()
+        self.n = len(self._x)
+        self.type_distance = type_distance
+        self.taille_cache = taille_cache
+        self.distance = self._distance if taille_cache == 0 else lru_cache(maxsize=taille_cache)(self._distance)
+
+    def __reduce__(self):
+        return SourceCoordonnees, (self.x, self.y, self.type_distance, self.taille_cache)
+
+    def _distance(self, a, b):
+        if self.type_distance == "GEO":
+            # Mêmes fonctions NumPy que distances() : résultats identiques au bit près
+            return 0 if a == b else distances_coordonnees(self.x[a], self.y[a], self.x[b], self.y[b], "GEO").item()
+        dx, dy = self._x[a] - self._x[b], self._y[a] - self._y[b]
+        if self.type_distance == "EUC_2D":
+            return math.floor(math.sqrt(dx * dx + dy * dy) + 0.5)
+        if self.type_distance == "CEIL_2D":
+            return math.ceil(math.sqrt(dx * dx + dy * dy))
+        r = math.sqrt((dx * dx + dy * dy) / 10.0)
+        t = math.floor(r + 0.5)
+        return t + 1 if t < r else t
+
+    def distances(self, u, v):
+        u, v = np.asarray(u), np.asarray(v)
+        resultat = distances_coordonnees(self.x[u], self.y[u], self.x[v], self.y[v], self.type_distance)
+        if self.type_distance == "GEO":
+            resultat = np.where(u == v, 0, resultat)
+        return resultat
+
+    def statistiques_cache(self):
+        return self.distance.cache_info() if self.taille_cache else None
+
+
+def enregistrer_matrice(chemin, source, dtype=None):
+    """
+    Écrit la matrice complète d'une source (ou d'un tableau) dans un fichier .npy,
+    par blocs de lignes, et retourne la MatriceMemmap correspondante.
+    """
+    if not isinstance(source, SourceDistances):
+        source = MatriceDense(source, dtype)
+    if dtype is None:
+        dtype = source.tableau.dtype if isinstance(source, MatriceDense) else np.int32
+    n = len(source)
+    fichier = np.lib.format.open_memmap(chemin, mode="w+", dtype=dtype, shape=(n, n))
+    pas = max(1, CELLULES_PAR_BLOC // max(n, 1))
+    for debut in range(0, n, pas):
+        fichier[debut:debut + pas] = source.lignes(debut, debut + pas)
+    fichier.flush()
+    del fichier
+    return MatriceMemmap(chemin, symetrique=source.symetrique)
+
+
+# --- Plus proches voisins ---
+
+# Nombre maximal de lignes de la matrice traitées à la fois pour les listes de voisins
+LIGNES_PAR_BLOC = 1024
+
+
+def listes_voisins(matrice, k):
+    """
+    Retourne, pour chaque ville, la liste de ses k plus proches voisines
+    (triées par distance croissante, la ville elle-même exclue).
+    """
+    if not isinstance(matrice, SourceDistances):
+        matrice = np.asarray(matrice)
+    n = len(matrice)
+    k = min(k, n - 1)
+    voisins = np.empty((n, k), dtype=np.intp)
+    pas = max(1, min(LIGNES_PAR_BLOC, CELLULES_PAR_BLOC // max(n, 1)))
+    for debut in range(0, n, pas):
+        if isinstance(matrice, SourceDistances):
+            bloc = matrice.lignes(debut, debut + pas).astype(float)
+        else:
+            bloc = matrice[debut:debut + pas].astype(float)
+        lignes = np.arange(len(bloc))
+        bloc[lignes, lignes + debut] = np.inf
+        proches = np.argpartition(bloc, k - 1, axis=1)[:, :k]
+        ordre = np.take_along_axis(bloc, proches, axis=1).argsort(axis=1, kind="stable")
+        voisins[debut:debut + len(bloc)] = np.take_along_axis(proches, ordre, axis=1)
+    return voisins.tolist()
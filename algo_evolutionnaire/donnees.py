@@ -0,0 +1,27 @@
+# --- Données d'exemple utilisées par les scripts de démonstration ---
+
+# Matrice de distances entre 10 villes (TSP)
+MATRICE_DISTANCES = [
+    [0, 2, 2, 7, 15, 2, 5, 7, 6, 5],
+    [2, 0, 10, 4, 7, 3, 7, 15, 8, 2],
+    [2, 10, 0, 1, 4, 3, 3, 4, 2, 3],
+    [7, 4, 1, 0, 2, 15, 7, 7, 5, 4],
+    [7, 10, 4, 2, 0, 7, 3, 2, 2, 7],
+    [2, 3, 3, 7, 7, 0, 1, 7, 2, 10],
+    [5, 7, 3, 7, 3, 1, 0, 2, 1, 3],
+    [7, 7, 4, 7, 2, 7, 2, 0, 1, 10],
+    [6, 8, 2, 5, 2, 2, 1, 1, 0, 15],
+    [5, 2, 3, 4, 7, 10, 3, 10, 15, 0]
+]
+
+# Durées des tâches (ordonnancement, flow time)
+DUREES_TACHES = [5, 2, 8, 4, 3, 6, 7, 1, 9, 2]
+
+# Tâches pondérées (ordonnancement, TWT) : tuples (temps_traitement, date_livraison, poids)
+TACHES = [
+    (5, 10, 3), # Tâche 0
+    (3, 8, 2),  # Tâche 1
+    (8, 20, 4), # Tâche 2
+    (2, 5, 5),  # Tâche 3
+    (6, 15, 1)  # Tâche 4
+]
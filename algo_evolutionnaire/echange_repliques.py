@@ -0,0 +1,180 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from .recuit import palier_metropolis, verifier_mouvement
+from .refroidissement import calibrer_temperatures
+
+# --- Échange de répliques (parallel tempering) ---
+# M chaînes de Metropolis tournent chacune à une température fixe d'une échelle
+# (une par processus). Après chaque palier de `pas_par_echange` itérations, les
+# états de températures voisines sont échangés selon le critère de Metropolis :
+#     P(échange k <-> k+1) = min(1, exp((1/T_k - 1/T_k+1) * (E_k - E_k+1)))
+# Les bonnes solutions descendent ainsi vers les basses températures tandis que
+# les répliques chaudes continuent d'explorer, au lieu d'un unique refroidissement
+# qui gèle la chaîne après quelques milliers d'itérations.
+#
+# Un palier est une fonction palier(donnees, solution, temperature, nb_pas, **options)
+# retournant (solution, cout, meilleure_solution, meilleur_cout, nb_acceptes),
+# typiquement recuit.palier_metropolis avec pour donnees un évaluateur
+# incrémental (EvaluateurTSP, EvaluateurFlowTime ou EvaluateurTWT).
+#
+# Depuis un solveur : RecuitSimule(repliques=8) ou
+# RecuitSimule(repliques=EchangeRepliques(8, pas_par_echange=500)) remplace le
+# refroidissement par un échange de répliques de même budget d'itérations.
+
+# Palier et données du problème, transmis une seule fois à chaque processus
+_palier = None
+_donnees = None
+_options = None
+
+
+def _initialiser(palier, donnees, options):
+    global _palier, _donnees, _options
+    _palier, _donnees, _options = palier, donnees, options
+
+
+def _executer_palier(tache):
+    solution, temperature, nb_pas, graine = tache
+    random.seed(graine)
+    return _palier(_donnees, solution, temperature, nb_pas, **_options)
+
+
+def echelle_geometrique(temperature_min, temperature_max, nb_repliques):
+    """
+    Échelle de températures croissantes en progression géométrique.
+    """
+    if nb_repliques == 1:
+        return [temperature_min]
+    rapport = (temperature_max / temperature_min) ** (1 / (nb_repliques - 1))
+    return [temperature_min * rapport ** k for k in range(nb_repliques)]
+
+
+def echange_repliques(palier, donnees, temperatures, nb_echanges, pas_par_echange, options=None,
+                      graine=None, nb_processus=None, rapport=None, solution_initiale=None):
+    """
+    Exécute l'échange de répliques et retourne (meilleure_solution, meilleur_cout, statistiques).
+
+    - palier, donnees : voir l'en-tête du module ; options : arguments supplémentaires du palier
+    - temperatures : échelle de températures (une réplique par température)
+    - nb_echanges : nombre de phases palier + tentative d'échange
+    - nb_processus : taille du pool (None = min(nb répliques, nb cœurs), 1 = séquentiel)
+    - rapport : fonction optionnelle appelée après chaque phase avec (phase, statistiques)
+    - solution_initiale : point de départ commun des répliques (sinon un ordre aléatoire chacune)
+
+    statistiques contient, pour chaque température : le coût courant et le meilleur
+    coût par phase, le taux d'acceptation des mouvements et celui des échanges avec
+    la température suivante. Nombre total d'évaluations : len(temperatures) *
+    nb_echanges * pas_par_echange.
+    """
+    options = options or {}
+    nb_repliques = len(temperatures)
+    rng = random.Random(graine)
+    solutions = [solution_initiale] * nb_repliques  # None : chaque réplique part d'une solution aléatoire
+    couts = [None] * nb_repliques
+    meilleure_solution, meilleur_cout = None, float('inf')
+    statistiques = [
+        {"temperature": temperature, "couts": [], "meilleurs": [], "acceptes": 0,
+         "echanges_tentes": 0, "echanges_acceptes": 0}
+        for temperature in temperatures
+    ]
+
+    if nb_processus is None:
+        nb_processus = min(nb_repliques, os.cpu_count() or 1)
+    if nb_processus == 1:
+        _initialiser(palier, donnees, options)
+        executeur, carte = None, map
+    else:
+        executeur = ProcessPoolExecutor(max_workers=nb_processus, initializer=_initialiser,
+                                        initargs=(palier, donnees, options))
+        carte = executeur.map
+    try:
+        for phase in range(nb_echanges):
+            taches = [(solutions[k], temperatures[k], pas_par_echange, rng.getrandbits(64))
+                      for k in range(nb_repliques)]
+            resultats = carte(_executer_palier, taches)
+            for k, (solution, cout, meilleure, cout_meilleure, nb_acceptes) in enumerate(resultats):
+                solutions[k], couts[k] = solution, cout
+                stats = statistiques[k]
+                stats["acceptes"] += nb_acceptes
+                meilleurs = stats["meilleurs"]
+                meilleurs.append(min(cout_meilleure, meilleurs[-1]) if meilleurs else cout_meilleure)
+                if cout_meilleure < meilleur_cout:
+                    meilleure_solution, meilleur_cout = meilleure, cout_meilleure
+
+            # Tentatives d'échange entre températures voisines (paires paires/impaires en alternance)
+            for k in range(phase % 2, nb_repliques - 1, 2):
+                statistiques[k]["echanges_tentes"] += 1
+                exposant = (1 / temperatures[k] - 1 / temperatures[k + 1]) * (couts[k] - couts[k + 1])
+                if exposant >= 0 or rng.random() < math.exp(exposant):
+                    solutions[k], solutions[k + 1] = solutions[k + 1], solutions[k]
+                    couts[k], couts[k + 1] = couts[k + 1], couts[k]
+                    statistiques[k]["echanges_acceptes"] += 1
+
+            for k, stats in enumerate(statistiques):
+                stats["couts"].append(couts[k])
+                stats["taux_acceptation"] = stats["acceptes"] / ((phase + 1) * pas_par_echange)
+                stats["taux_echange"] = stats["echanges_acceptes"] / max(1, stats["echanges_tentes"])
+            if rapport is not None:
+                rapport(phase, statistiques)
+    finally:
+        if executeur is not None:
+            executeur.shutdown()
+
+    return meilleure_solution, meilleur_cout, statistiques
+
+
+# --- Mode échange de répliques du recuit simulé ---
+
+class EchangeRepliques:
+    """
+    Remplace le refroidissement de RecuitSimule : `nb_repliques` chaînes de Metropolis
+    sur une échelle géométrique entre temperature_min et temperature_max, échangées
+    toutes les `pas_par_echange` itérations. Les bornes omises sont calibrées sur un
+    échantillon de deltas (refroidissement.calibrer_temperatures) ; les statistiques
+    de la dernière exécution restent dans `statistiques`.
+    """
+
+    def __init__(self, nb_repliques=8, pas_par_echange=1000, temperature_min=None, temperature_max=None,
+                 nb_processus=None, rapport=None):
+        if nb_repliques < 1 or pas_par_echange < 1:
+            raise ValueError("nb_repliques et pas_par_echange doivent être strictement positifs.")
+        self.nb_repliques = nb_repliques
+        self.pas_par_echange = pas_par_echange
+        self.temperature_min = temperature_min
+        self.temperature_max = temperature_max
+        self.nb_processus = nb_processus
+        self.rapport = rapport
+        self.statistiques = None
+
+    def executer(self, evaluateur, iterations_max, mouvement="echange", solution_initiale=None,
+                 temperature_max=None):
+        """
+        Échange de répliques d'environ `iterations_max` itérations au total, toutes
+        répliques confondues. temperature_max sert si self.temperature_max est None.
+        Retourne (meilleure_solution, meilleur_cout).
+        """
+        verifier_mouvement(evaluateur, mouvement)
+        temperature_min = self.temperature_min
+        temperature_max = temperature_max if self.temperature_max is None else self.temperature_max
+        if temperature_min is None or temperature_max is None:
+            if solution_initiale is None:
+                evaluateur.definir_ordre(random.sample(range(len(evaluateur.ordre)), len(evaluateur.ordre)))
+            else:
+                evaluateur.definir_ordre(solution_initiale)
+            temperature_auto, temperature_finale = calibrer_temperatures(evaluateur, mouvement)
+            temperature_max = temperature_auto if temperature_max is None else temperature_max
+            temperature_min = min(temperature_finale, temperature_max) if temperature_min is None else temperature_min
+        temperatures = echelle_geometrique(temperature_min, temperature_max, self.nb_repliques)
+        nb_echanges = max(1, iterations_max // (self.nb_repliques * self.pas_par_echange))
+
+        # Les répliques évaluent sur des copies de l'évaluateur dans les processus : le compteur
+        # est mis à jour ici (un definir_ordre et pas_par_echange deltas par palier)
+        evaluations = evaluateur.nb_evaluations + self.nb_repliques * nb_echanges * (self.pas_par_echange + 1)
+        meilleure_solution, meilleur_cout, self.statistiques = echange_repliques(
+            palier_metropolis, evaluateur, temperatures, nb_echanges, self.pas_par_echange,
+            {"mouvement": mouvement}, graine=random.getrandbits(64), nb_processus=self.nb_processus,
+            rapport=self.rapport, solution_initiale=solution_initiale)
+        evaluateur.nb_evaluations = evaluations
+        return meilleure_solution, meilleur_cout
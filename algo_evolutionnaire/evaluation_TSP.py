@@ -0,0 +1,74 @@
+import numpy as np
+
+from .distances import MatriceDense, SourceDistances
+
+# --- Évaluation vectorisée d'une population de tournées ---
+# La population est un tableau 2-D d'entiers (une tournée par ligne) et la
+# matrice de distances un tableau NumPy : toutes les tournées sont évaluées par
+# un seul « gather-and-sum », sans boucle Python par individu. Une source
+# calculée à la demande (distances.SourceCoordonnees) est interrogée par bloc.
+
+# Nombre de cellules traitées par bloc (limite la mémoire des indices temporaires)
+TAILLE_BLOC = 1 << 19
+
+
+def calculer_distance_totale(chemin, matrice):
+    """
+    Distance totale d'un chemin, retour à la ville de départ inclus.
+    """
+    if isinstance(matrice, SourceDistances):
+        return matrice.longueur(chemin)
+    return sum(matrice[chemin[i]][chemin[(i + 1) % len(chemin)]] for i in range(len(chemin)))
+
+
+def matrice_en_tableau(matrice_distances):
+    """
+    Convertit la matrice de distances (liste de listes) en tableau NumPy contigu.
+    À faire une seule fois par exécution. Une MatriceDense donne son tableau
+    (sans copie) ; les autres sources sont retournées telles quelles.
+    """
+    if isinstance(matrice_distances, MatriceDense):
+        return matrice_distances.tableau
+    if isinstance(matrice_distances, SourceDistances):
+        return matrice_distances
+    return np.ascontiguousarray(matrice_distances)
+
+
+def population_en_tableau(population):
+    """
+    Convertit une population (liste de tournées) en tableau 2-D d'entiers.
+    """
+    return np.asarray(population, dtype=np.int32)
+
+
+def evaluer_population(population, matrice):
+    """
+    Calcule la distance totale (retour au départ inclus) de chaque tournée.
+    population : tableau (taille_population, n) ; matrice : tableau (n, n) ou source de distances.
+    Retourne un tableau de taille_population distances (sommées en int64 / float64).
+    """
+    if not isinstance(matrice, np.ndarray):
+        matrice = matrice_en_tableau(matrice)
+    population = np.asarray(population)
+    taille_population, n = population.shape
+    source = None if isinstance(matrice, np.ndarray) else matrice
+    if source is None:
+        matrice_plate = matrice.ravel()
+        type_somme = np.result_type(matrice.dtype, np.int64)
+    else:
+        type_somme = np.result_type(source.distances(np.zeros(1, np.intp), np.zeros(1, np.intp)).dtype, np.int64)
+    distances = np.empty(taille_population, dtype=type_somme)
+
+    # Indice plat de l'arête (ville k -> ville k+1) : ville_k * n + ville_k+1
+    lignes_par_bloc = max(1, TAILLE_BLOC // max(n, 1))
+    for debut in range(0, taille_population, lignes_par_bloc):
+        bloc = population[debut:debut + lignes_par_bloc].astype(np.intp)
+        if source is not None:
+            aretes = source.distances(bloc, np.roll(bloc, -1, axis=1))
+        else:
+            indices = bloc * n
+            indices[:, :-1] += bloc[:, 1:]
+            indices[:, -1] += bloc[:, 0]
+            aretes = matrice_plate.take(indices)
+        distances[debut:debut + lignes_par_bloc] = aretes.sum(axis=1, dtype=type_somme)
+    return distances
@@ -0,0 +1,378 @@
+import random
+
+import numpy as np
+
+from .voisinage import masquer
+
+# --- Fonctions de coût (une solution à la fois) ---
+
+def calculer_cout_ordonnancement(ordre, durees):
+    """
+    Temps d'achèvement cumulé (flow time) d'un ordre de tâches.
+    """
+    temps = 0
+    cout_total = 0
+    for tache in ordre:
+        temps += durees[tache]
+        cout_total += temps
+    return cout_total
+
+
+def calculer_twt(ordre_taches, taches):
+    """
+    Total Weighted Tardiness (TWT) d'un ordre de tâches.
+    taches : liste de tuples (p_j, d_j, w_j) (temps de traitement, date de livraison, poids)
+    """
+    twt = 0
+    temps_achevement_machine = 0  # Temps où la machine est libre après la tâche précédente
+    for indice_tache in ordre_taches:
+        p_j, d_j, w_j = taches[indice_tache]
+        temps_achevement_machine += p_j
+        twt += w_j * max(0, temps_achevement_machine - d_j)
+    return twt
+
+
+# --- Interface commune des évaluateurs incrémentaux ---
+# Un évaluateur maintient un ordre (`ordre`) et son coût (`cout`) ; les
+# métaheuristiques n'utilisent que definir_ordre, tirer, delta, appliquer et
+# meilleur_mouvement, ce qui leur permet de traiter le TSP (mouvements_TSP.EvaluateurTSP)
+# et les problèmes d'ordonnancement avec le même code. nb_evaluations compte
+# les solutions évaluées (complètes ou par delta).
+
+class _EvaluateurOrdre:
+    MOUVEMENTS = ("echange", "insertion")
+    CACHES = ("fins",)  # Tableaux tenus à jour incrémentalement (sauvegardés par reprise.py)
+
+    def _fin(self, k):
+        return self.fins[k].item() if k >= 0 else 0
+
+    def tirer(self, mouvement):
+        """
+        Mouvement aléatoire : deux positions distinctes (i, j).
+        """
+        return tuple(random.sample(range(len(self.ordre)), 2))
+
+    def enumerer(self, mouvement):
+        n = len(self.ordre)
+        for i in range(n):
+            for j in range(i + 1 if mouvement == "echange" else 0, n):
+                if j != i:
+                    yield (i, j)
+
+    def delta(self, mouvement, move):
+        self.nb_evaluations += 1
+        if mouvement == "echange":
+            return self.delta_echange(*move)
+        return self.delta_insertion(*move)
+
+    def meilleur_mouvement(self, mouvement="echange", interdit=None):
+        """
+        Meilleur mouvement (delta minimal, premier dans l'ordre (i, j) en cas d'égalité)
+        que `interdit(move, delta)` n'exclut pas. Retourne (inf, None) si tous les
+        mouvements sont exclus.
+        """
+        meilleur_delta, meilleur_move = float('inf'), None
+        for move in self.enumerer(mouvement):
+            delta = self.delta(mouvement, move)
+            if delta < meilleur_delta and (interdit is None or not interdit(move, delta)):
+                meilleur_delta, meilleur_move = delta, move
+        return meilleur_delta, meilleur_move
+
+    def noyau_deltas(self, mouvement):
+        # Pas de calcul des deltas par blocs (voir voisinage.py) : balayage série
+        return None
+
+    def deltas_paires(self, mouvement, i, j):
+        # Deltas des mouvements (i[k], j[k]) un par un, sans compter les évaluations
+        calcul = self.delta_echange if mouvement == "echange" else self.delta_insertion
+        return np.array([calcul(a, b) for a, b in zip(np.asarray(i).tolist(), np.asarray(j).tolist())])
+
+    def paires_proches(self, mouvement, k):
+        """
+        Mouvements entre positions distantes d'au plus k : (i, i + d) pour l'échange,
+        (i, i + d) et (i + d, i) pour l'insertion, d = 1..k. Retourne (i, j).
+        """
+        n = len(self.ordre)
+        i, d = np.repeat(np.arange(n), k), np.tile(np.arange(1, k + 1), n)
+        valides = i + d < n
+        i, j = i[valides], (i + d)[valides]
+        if mouvement == "echange":
+            return i, j
+        return np.concatenate((i, j)), np.concatenate((j, i))
+
+    def appliquer(self, mouvement, move, delta=None):
+        # delta : inutilisé, le coût est tenu à jour par les préfixes
+        if mouvement == "echange":
+            self.appliquer_echange(*move)
+        else:
+            self.appliquer_insertion(*move)
+
+
+# --- Évaluation incrémentale du flow time (somme des temps d'achèvement) ---
+# Le coût s'écrit  somme_k (n - k) * p[ordre[k]]  : échanger deux tâches ou en
+# déplacer une ne modifie le coût que d'une quantité fermée, calculée en O(1)
+# à partir des durées et des temps d'achèvement cumulés (préfixes).
+
+MOUVEMENTS = _EvaluateurOrdre.MOUVEMENTS
+
+
+def evaluer_population_flowtime(population, durees):
+    """
+    Flow time de chaque ordre d'une population (liste d'ordres ou tableau 2-D),
+    calculé en un seul produit matriciel.
+    """
+    population = np.asarray(population)
+    n = population.shape[1]
+    poids = np.arange(n, 0, -1)
+    return np.asarray(durees)[population] @ poids
+
+
+def evaluer_population_twt(population, p, d, w):
+    """
+    TWT de chaque ordre d'une population (tableau 2-D), sans boucle par individu.
+    """
+    population = np.asarray(population)
+    fins = np.cumsum(np.asarray(p)[population], axis=1)
+    return (np.asarray(w)[population] * np.maximum(0, fins - np.asarray(d)[population])).sum(axis=1)
+
+
+class EvaluateurFlowTime(_EvaluateurOrdre):
+    """
+    Maintient un ordre de tâches, ses temps d'achèvement et son flow time.
+    Les mouvements sont évalués sans copier l'ordre :
+    - delta_echange(i, j)   : O(1)
+    - delta_insertion(i, j) : O(1) (tâche de la position i déplacée en position j)
+    Appliquer un mouvement met à jour les préfixes en O(|j - i|).
+    """
+
+    def __init__(self, ordre, durees):
+        self.durees = list(durees)
+        self.nb_evaluations = 0
+        self.definir_ordre(ordre)
+
+    def definir_ordre(self, ordre):
+        """
+        Remplace l'ordre courant et recalcule les préfixes : O(n).
+        """
+        self.ordre = list(ordre)
+        self._p = np.array([self.durees[t] for t in self.ordre])  # Durées dans l'ordre courant
+        self.fins = np.cumsum(self._p)  # fins[k] : temps d'achèvement de la k-ième tâche
+        self.cout = self.fins.sum().item()
+        self.nb_evaluations += 1
+
+    # --- Évaluation des mouvements ---
+
+    def delta_echange(self, i, j):
+        if i > j:
+            i, j = j, i
+        return (j - i) * (self._p[j] - self._p[i]).item()
+
+    def delta_insertion(self, i, j):
+        p_a = self._p[i].item()
+        if j > i:
+            # Les tâches i+1..j avancent de p_a, la tâche déplacée finit en fins[j]
+            return (self.fins[j] - self.fins[i]).item() - (j - i) * p_a
+        # Les tâches j..i-1 reculent de p_a, la tâche déplacée finit en fins[j-1] + p_a
+        return (i - j) * p_a + self._fin(j - 1) + p_a - self.fins[i].item()
+
+    def _deltas_ligne(self, mouvement, i):
+        """
+        Deltas de tous les mouvements partant de la position i (vectorisé) :
+        j > i pour l'échange, j != i pour l'insertion.
+        """
+        n = len(self.ordre)
+        if mouvement == "echange":
+            j = np.arange(i + 1, n)
+            return j, (j - i) * (self._p[i + 1:] - self._p[i])
+        j = np.concatenate((np.arange(i), np.arange(i + 1, n)))
+        fins_avant = np.concatenate(([0], self.fins[:-1]))
+        p_a = self._p[i]
+        deltas = np.where(
+            j > i,
+            self.fins[j] - self.fins[i] - (j - i) * p_a,
+            (i - j) * p_a + fins_avant[j] + p_a - self.fins[i],
+        )
+        return j, deltas
+
+    def meilleur_mouvement(self, mouvement="echange", interdit=None):
+        """
+        Meilleur mouvement (delta minimal, premier dans l'ordre (i, j) en cas d'égalité)
+        que `interdit(move, delta)` n'exclut pas. Chaque ligne i est évaluée d'un bloc
+        avec NumPy. Retourne (inf, None) si tous les mouvements sont exclus.
+        """
+        meilleur_delta, meilleur_move = float('inf'), None
+        for i in range(len(self.ordre)):
+            j, deltas = self._deltas_ligne(mouvement, i)
+            self.nb_evaluations += len(j)
+            if len(j) == 0:
+                continue
+            candidats = np.flatnonzero(deltas < meilleur_delta)
+            if len(candidats) == 0:
+                continue
+            # Candidats par delta croissant (ordre des j conservé en cas d'égalité)
+            for k in candidats[np.argsort(deltas[candidats], kind="stable")]:
+                move, delta = (i, int(j[k])), deltas[k].item()
+                if interdit is None or not interdit(move, delta):
+                    meilleur_delta, meilleur_move = delta, move
+                    break
+        return meilleur_delta, meilleur_move
+
+    def deltas_paires(self, mouvement, i, j):
+        """
+        Deltas des mouvements (i[k], j[k]) (i < j pour l'échange), calculés d'un coup.
+        Ne compte pas les évaluations.
+        """
+        i, j = np.asarray(i, dtype=np.intp), np.asarray(j, dtype=np.intp)
+        p, fins = self._p, self.fins
+        if mouvement == "echange":
+            return (j - i) * (p[j] - p[i])
+        p_a, fin_a = p[i], fins[i]
+        fins_avant_j = np.where(j > 0, fins[j - 1], 0)
+        return np.where(j > i, fins[j] - fin_a - (j - i) * p_a, (i - j) * p_a + fins_avant_j + p_a - fin_a)
+
+    def noyau_deltas(self, mouvement):
+        """
+        Fonction (debut, fin) -> bloc des deltas des mouvements (i, j) des lignes
+        debut..fin-1, calculés d'un coup (voir voisinage.masquer).
+        """
+        p, fins = self._p, self.fins
+        positions = np.arange(len(p))
+        if mouvement == "echange":
+            def noyau(debut, fin):
+                i, j = np.arange(debut, fin)[:, None], positions[debut + 1:]
+                return masquer((j - i) * (p[debut + 1:] - p[i]), j > i, debut + 1)
+            return noyau
+
+        fins_avant = np.concatenate(([0], fins[:-1]))
+
+        def noyau(debut, fin):
+            # Formule j > i sur tout le bloc, puis formule j < i sur les seules colonnes j < fin
+            i, gauche = np.arange(debut, fin)[:, None], positions[:fin]
+            p_a, fin_a = p[i], fins[i]
+            deltas = fins - fin_a - (positions - i) * p_a
+            deltas[:, :fin] = np.where(gauche < i, (i - gauche) * p_a + fins_avant[:fin] + p_a - fin_a,
+                                       deltas[:, :fin])
+            return masquer(deltas, positions != i)
+        return noyau
+
+    # --- Application des mouvements ---
+
+    def appliquer_echange(self, i, j):
+        if i > j:
+            i, j = j, i
+        self.cout += self.delta_echange(i, j)
+        self.ordre[i], self.ordre[j] = self.ordre[j], self.ordre[i]
+        self._p[i], self._p[j] = self._p[j], self._p[i]
+        self.fins[i:j] = self._fin(i - 1) + np.cumsum(self._p[i:j])
+
+    def appliquer_insertion(self, i, j):
+        self.cout += self.delta_insertion(i, j)
+        self.ordre.insert(j, self.ordre.pop(i))
+        debut, fin = min(i, j), max(i, j)
+        if j > i:
+            self._p[i:j + 1] = np.roll(self._p[i:j + 1], -1)
+        else:
+            self._p[j:i + 1] = np.roll(self._p[j:i + 1], 1)
+        self.fins[debut:fin + 1] = self._fin(debut - 1) + np.cumsum(self._p[debut:fin + 1])
+
+
+# --- Évaluation incrémentale du retard pondéré total (TWT) ---
+# Échanger les tâches des positions i < j ne modifie que les temps d'achèvement
+# des positions i..j (ceux d'avant i et d'après j sont inchangés) : le delta est
+# recalculé sur cette seule fenêtre, à partir des préfixes mis en cache.
+
+class EvaluateurTWT(_EvaluateurOrdre):
+    """
+    Maintient un ordre de tâches, ses temps d'achèvement et son Total Weighted
+    Tardiness pour des données (p, d, w) passées en paramètre :
+    - p : temps de traitement, d : dates de livraison, w : poids (une valeur par tâche)
+    - delta_echange(i, j), delta_insertion(i, j) : O(|j - i|), sans copier l'ordre
+    Appliquer un mouvement met à jour le cache sur la même fenêtre.
+    """
+    CACHES = ("fins", "retards")
+
+    def __init__(self, p, d, w, ordre=None):
+        self.p, self.d, self.w = np.asarray(p), np.asarray(d), np.asarray(w)
+        self.nb_evaluations = 0
+        self.definir_ordre(range(len(self.p)) if ordre is None else ordre)
+
+    @classmethod
+    def depuis_taches(cls, taches, ordre=None):
+        """
+        Construit l'évaluateur depuis une liste de tuples (p_j, d_j, w_j).
+        """
+        p, d, w = zip(*taches)
+        return cls(p, d, w, ordre)
+
+    def definir_ordre(self, ordre):
+        """
+        Remplace l'ordre courant et recalcule le cache : O(n).
+        """
+        self.ordre = list(ordre)
+        indices = np.asarray(self.ordre, dtype=np.intp)
+        # Données des tâches dans l'ordre courant
+        self._p, self._d, self._w = self.p[indices], self.d[indices], self.w[indices]
+        self.fins = np.cumsum(self._p)
+        self.retards = self._w * np.maximum(0, self.fins - self._d)  # Retard pondéré par position
+        self.cout = self.retards.sum().item()
+        self.nb_evaluations += 1
+
+    # --- Évaluation des mouvements ---
+
+    def delta_echange(self, i, j):
+        if i > j:
+            i, j = j, i
+        if i == j:
+            return 0
+        p_a, p_b = self._p[i], self._p[j]
+        # La tâche b finit en fins[i-1] + p_b, la tâche a en fins[j] (inchangé),
+        # les tâches intermédiaires sont décalées de p_b - p_a
+        nouveau = self._w[j] * max(0, self._fin(i - 1) + p_b - self._d[j]) \
+            + self._w[i] * max(0, self.fins[j] - self._d[i])
+        if j - i > 1:
+            milieu = slice(i + 1, j)
+            nouveau += (self._w[milieu] * np.maximum(0, self.fins[milieu] + (p_b - p_a) - self._d[milieu])).sum()
+        return (nouveau - self.retards[i:j + 1].sum()).item()
+
+    def delta_insertion(self, i, j):
+        if i == j:
+            return 0
+        p_a = self._p[i]
+        if j > i:
+            # Les tâches i+1..j avancent de p_a, la tâche déplacée finit en fins[j]
+            decales = slice(i + 1, j + 1)
+            nouveau = self._w[i] * max(0, self.fins[j] - self._d[i]) \
+                + (self._w[decales] * np.maximum(0, self.fins[decales] - p_a - self._d[decales])).sum()
+            return (nouveau - self.retards[i:j + 1].sum()).item()
+        # Les tâches j..i-1 reculent de p_a, la tâche déplacée finit en fins[j-1] + p_a
+        decales = slice(j, i)
+        nouveau = self._w[i] * max(0, self._fin(j - 1) + p_a - self._d[i]) \
+            + (self._w[decales] * np.maximum(0, self.fins[decales] + p_a - self._d[decales])).sum()
+        return (nouveau - self.retards[j:i + 1].sum()).item()
+
+    # --- Application des mouvements ---
+
+    def _mettre_a_jour(self, debut, fin):
+        """
+        Recalcule le cache sur la fenêtre de positions debut..fin.
+        """
+        fenetre = slice(debut, fin + 1)
+        self.fins[fenetre] = self._fin(debut - 1) + np.cumsum(self._p[fenetre])
+        ancien = self.retards[fenetre].sum()
+        self.retards[fenetre] = self._w[fenetre] * np.maximum(0, self.fins[fenetre] - self._d[fenetre])
+        self.cout += (self.retards[fenetre].sum() - ancien).item()
+
+    def appliquer_echange(self, i, j):
+        if i > j:
+            i, j = j, i
+        self.ordre[i], self.ordre[j] = self.ordre[j], self.ordre[i]
+        for tableau in (self._p, self._d, self._w):
+            tableau[i], tableau[j] = tableau[j], tableau[i]
+        self._mettre_a_jour(i, j)
+
+    def appliquer_insertion(self, i, j):
+        self.ordre.insert(j, self.ordre.pop(i))
+        debut, fin = min(i, j), max(i, j)
+        for tableau in (self._p, self._d, self._w):
+            tableau[debut:fin + 1] = np.roll(tableau[debut:fin + 1], -1 if j > i else 1)
+        self._mettre_a_jour(debut, fin)
@@ -0,0 +1,563 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from .croisements import OPERATEURS_SANS_SEGMENT, OPERATEURS_SEGMENT, Tampons, croisement_lot, obtenir_croisement
+from .evaluation_TSP import evaluer_population, matrice_en_tableau, population_en_tableau
+from .evaluation_ordonnancement import evaluer_population_flowtime
+from .mutations import mutation_lot, verifier_mutation
+from .population import PopulationPartagee
+from .reprise import entiers_compacts
+from .selection import SELECTIONS, generateur_numpy, meilleurs_indices
+from .telemetrie import diversite, emettre
+
+# --- Algorithmes génétiques sur permutations ---
+# Les deux moteurs (élitiste et roulette) ne connaissent du problème que
+# `evaluer(population)`, qui retourne le coût de chaque ligne d'un tableau 2-D
+# d'individus : le TSP et l'ordonnancement partagent ainsi les mêmes opérateurs.
+# La population est évaluée une seule fois par génération.
+
+
+# Durées cumulées par génération, émises vers l'observateur (voir telemetrie.py)
+TEMPS_OPERATEURS = ("temps_evaluation", "temps_selection", "temps_croisement", "temps_mutation", "temps_amelioration")
+
+
+# --- Opérateurs ---
+
+def generer_population(taille_pop, taille_individu):
+    return [random.sample(range(taille_individu), taille_individu) for _ in range(taille_pop)]
+
+
+def _indices_roulette(couts, k):
+    fitness = 1 / (couts + 1e-6)
+    probabilites = fitness / fitness.sum()
+    return random.choices(range(len(couts)), weights=probabilites.tolist(), k=k)
+
+
+def selection_roulette(population, couts, k):
+    # couts : tableau des coûts déjà calculés pour chaque individu
+    return population[_indices_roulette(couts, k)].tolist()
+
+
+def _selection_parents(selection):
+    """
+    Fonction (couts, k) -> indices des k parents. selection : "roulette"
+    (selection_roulette ci-dessus), un nom de selection.SELECTIONS ("tournoi", "sus",
+    "rang") ou une fonction (couts, k) -> indices.
+    """
+    if selection == "roulette":
+        return _indices_roulette
+    if not callable(selection) and selection not in SELECTIONS:
+        raise ValueError(f"Sélection non reconnue. Choisissez parmi roulette, {', '.join(SELECTIONS)}.")
+    return selection if callable(selection) else SELECTIONS[selection]
+
+
+def mutation(individu, taux):
+    # Mutation par échange de deux gènes
+    if random.random() < taux:
+        i, j = random.sample(range(len(individu)), 2)
+        individu[i], individu[j] = individu[j], individu[i]
+    return individu
+
+
+def _population_depart(taille_pop, taille_individu, population_initiale):
+    if population_initiale is None:
+        population_initiale = generer_population(taille_pop, taille_individu)
+    return population_en_tableau(population_initiale)
+
+
+def _reproduire(generation, parents, taille, fonction_croisement, taux_mutation, amelioration):
+    # Complète `generation` jusqu'à `taille` individus avec des enfants de parents tirés dans `parents`
+    while len(generation) < taille:
+        parent1, parent2 = random.sample(parents, 2)
+        enfant = mutation(fonction_croisement(parent1, parent2), taux_mutation)
+        if amelioration is not None:
+            enfant = amelioration(enfant)
+        generation.append(enfant)
+    return generation
+
+
+def _reproduire_chronometre(generation, parents, taille, fonction_croisement, taux_mutation, amelioration, temps):
+    # Mêmes tirages que _reproduire, en cumulant dans `temps` la durée de chaque opérateur
+    horloge = time.perf_counter
+    while len(generation) < taille:
+        t0 = horloge()
+        parent1, parent2 = random.sample(parents, 2)
+        t1 = horloge()
+        enfant = fonction_croisement(parent1, parent2)
+        t2 = horloge()
+        enfant = mutation(enfant, taux_mutation)
+        t3 = horloge()
+        if amelioration is not None:
+            enfant = amelioration(enfant)
+        temps["temps_selection"] += t1 - t0
+        temps["temps_croisement"] += t2 - t1
+        temps["temps_mutation"] += t3 - t2
+        temps["temps_amelioration"] += horloge() - t3
+        generation.append(enfant)
+    return generation
+
+
+def _sauvegarder_generation(reprise, solveur, generation, population, couts, meilleur, meilleur_cout, arret,
+                            evaluations):
+    reprise.sauvegarder(solveur, generation, population=entiers_compacts(population), couts=couts,
+                        meilleur=entiers_compacts(meilleur), meilleur_cout=np.asarray(meilleur_cout),
+                        **(arret.etat(evaluations) if arret is not None else {}))
+
+
+def _restaurer_generation(etat):
+    # Retourne (générations effectuées, population, couts, meilleur, meilleur_cout)
+    return (etat["iteration"].item(), etat["population"].astype(np.int32), etat["couts"],
+            etat["meilleur"].tolist(), etat["meilleur_cout"].item())
+
+
+def _compter_evaluations(evaluer, compteur):
+    # Cumule dans compteur[0] le nombre d'individus évalués (critère evaluations_max)
+    def evaluer_compte(population):
+        compteur[0] += len(population)
+        return evaluer(population)
+    return evaluer_compte
+
+
+def _redemarrer_population(arret, generation, population, couts, nombre_conserves, meilleur, meilleur_cout, evaluer):
+    # Conserve les meilleurs individus et remplace les autres par des perturbations du meilleur
+    conserves = population[meilleurs_indices(couts, nombre_conserves)].tolist()
+    perturbes = [arret.redemarrage.perturber(meilleur) for _ in range(len(population) - len(conserves))]
+    population = population_en_tableau(conserves + perturbes)
+    couts = evaluer(population)
+    indice = int(np.argmin(couts))
+    if couts[indice] < meilleur_cout:
+        meilleur, meilleur_cout = population[indice].tolist(), couts[indice].item()
+        arret.ameliore(generation)
+    return population, couts, meilleur, meilleur_cout
+
+
+def _evenement_generation(solveur, generation, meilleur_cout, couts, population, temps):
+    return {"solveur": solveur, "iteration": generation, "meilleur_cout": meilleur_cout,
+            "cout_moyen": float(couts.mean()), "diversite": diversite(population), **temps}
+
+
+def _operateur_mutation(mutation, taux_mutation):
+    # None : mutation d'origine, enfant par enfant, sauf avec un taux adaptatif (mutation par lot "echange")
+    if mutation is None and callable(taux_mutation):
+        mutation = "echange"
+    if mutation is not None:
+        verifier_mutation(mutation)
+    return mutation
+
+
+def _reproduire_par_lot(parents, couts_parents, couts, nb_enfants, fonction_croisement, taux_mutation, mutation,
+                        amelioration, temps=None):
+    """
+    Variante de _reproduire (mêmes tirages de parents) : tous les enfants sont croisés,
+    puis mutés d'un bloc par mutations.mutation_lot, puis améliorés. Retourne le
+    tableau des enfants ; temps, s'il est fourni, cumule la durée de chaque opérateur.
+    """
+    horloge = time.perf_counter
+    t0 = horloge()
+    couples = [random.sample(range(len(parents)), 2) for _ in range(nb_enfants)]
+    t1 = horloge()
+    enfants = population_en_tableau([fonction_croisement(parents[i], parents[j]) for i, j in couples])
+    t2 = horloge()
+    if callable(taux_mutation):  # Taux par enfant, d'après le meilleur de ses parents (mutations.TauxAdaptatif)
+        taux_mutation = taux_mutation(np.asarray(couts_parents)[couples].min(axis=1), couts)
+    mutation_lot(mutation, enfants, taux_mutation, generateur_numpy())
+    t3 = horloge()
+    if amelioration is not None:
+        enfants = population_en_tableau([amelioration(enfant) for enfant in enfants.tolist()])
+    if temps is not None:
+        temps["temps_selection"] += t1 - t0
+        temps["temps_croisement"] += t2 - t1
+        temps["temps_mutation"] += t3 - t2
+        temps["temps_amelioration"] += horloge() - t3
+    return enfants
+
+
+# --- AG élitiste ---
+
+def ag_elitiste(evaluer, taille_individu, taille_population, taux_elitism, taux_mutation, generations,
+                type_croisement="permutation", population_initiale=None, retourner_population=False,
+                amelioration=None, taille_reproduction=None, cache=None, observateur=None, reprise=None, arret=None,
+                mutation=None):
+    """
+    Les élites sont conservées telles quelles, les enfants sont issus de parents
+    tirés parmi les `taille_reproduction` meilleurs individus (par défaut
+    max(2, taille_population * (1 - taux_elitism / 2))).
+    mutation : None (un échange au plus par enfant, enfant par enfant) ou opérateur
+    par lot de mutations.MUTATIONS appliqué à tous les enfants à la fois, jamais aux
+    élites ; taux_mutation peut alors être un taux par enfant (mutations.TauxAdaptatif).
+    amelioration : étape mémétique optionnelle appliquée à chaque enfant
+    (ex: recherche_locale_TSP.operateur_memetique(matrice_distances)).
+    cache : CacheFitness optionnel (cache.py) ; les élites et les enfants en double
+    ne sont alors évalués qu'une fois.
+    observateur : reçoit un événement par génération (voir telemetrie.py).
+    reprise : PointReprise optionnel (reprise.py) ; l'évolution repart du dernier point
+    sauvegardé s'il existe (population_initiale est alors ignorée).
+    arret : Arret optionnel (arret.py), vérifié à chaque génération ; un redémarrage
+    conserve les élites et remplace le reste de la population.
+    Retourne (meilleur, cout) ou (meilleur, cout, population, couts).
+    """
+    fonction_croisement = obtenir_croisement(type_croisement)
+    mutation = _operateur_mutation(mutation, taux_mutation)
+    evaluations = [0]
+    if arret is not None:
+        evaluer = _compter_evaluations(evaluer, evaluations)
+    if cache is not None:
+        evaluer = cache.envelopper(evaluer)
+    nombre_elites = max(1, int(taille_population * taux_elitism))
+    if taille_reproduction is None:
+        taille_reproduction = max(2, int(taille_population * (1 - taux_elitism/2)))
+
+    etat = reprise.charger("ag_elitiste") if reprise is not None else None
+    if arret is not None:
+        arret.demarrer(etat=etat)
+    if etat is None:
+        premiere_generation = 0
+        population = _population_depart(taille_population, taille_individu, population_initiale)
+        couts = evaluer(population)
+        indice_meilleur = int(np.argmin(couts))
+        meilleur, meilleur_cout = population[indice_meilleur].tolist(), couts[indice_meilleur].item()
+    else:
+        premiere_generation, population, couts, meilleur, meilleur_cout = _restaurer_generation(etat)
+
+    for generation in range(premiere_generation, generations):
+        if observateur is not None:
+            debut = time.perf_counter()
+        # Sélection partielle : seuls les meilleurs individus utiles sont triés
+        ordre = meilleurs_indices(couts, max(nombre_elites, taille_reproduction))
+        parents_pool = population[ordre[:taille_reproduction]].tolist()
+        if observateur is not None:
+            temps = dict.fromkeys(TEMPS_OPERATEURS, 0.0)
+            temps["temps_selection"] = time.perf_counter() - debut
+
+        if mutation is not None:
+            enfants = _reproduire_par_lot(parents_pool, couts[ordre[:taille_reproduction]], couts,
+                                          taille_population - nombre_elites, fonction_croisement, taux_mutation,
+                                          mutation, amelioration, temps if observateur is not None else None)
+            population = np.concatenate([population[ordre[:nombre_elites]], enfants])
+        else:
+            nouvelle_generation = population[ordre[:nombre_elites]].tolist()
+            if observateur is None:
+                _reproduire(nouvelle_generation, parents_pool, taille_population, fonction_croisement, taux_mutation,
+                            amelioration)
+            else:
+                _reproduire_chronometre(nouvelle_generation, parents_pool, taille_population, fonction_croisement,
+                                        taux_mutation, amelioration, temps)
+            population = population_en_tableau(nouvelle_generation)
+        if observateur is not None:
+            debut = time.perf_counter()
+
+        couts = evaluer(population)
+        indice_candidat = int(np.argmin(couts))
+        if couts[indice_candidat] < meilleur_cout:
+            meilleur, meilleur_cout = population[indice_candidat].tolist(), couts[indice_candidat].item()
+            if arret is not None:
+                arret.ameliore(generation + 1)
+
+        termine = arret is not None and arret.atteint(generation + 1, meilleur_cout, evaluations[0])
+        if observateur is not None:
+            temps["temps_evaluation"] = time.perf_counter() - debut
+            emettre(observateur, _evenement_generation("ag_elitiste", generation + 1, meilleur_cout, couts, population,
+                                                       temps), meilleur)
+        if termine:
+            break
+        if arret is not None and arret.redemarrer(generation + 1):
+            population, couts, meilleur, meilleur_cout = _redemarrer_population(
+                arret, generation + 1, population, couts, nombre_elites, meilleur, meilleur_cout, evaluer)
+        if reprise is not None and (generation + 1) % reprise.periode == 0:
+            _sauvegarder_generation(reprise, "ag_elitiste", generation + 1, population, couts, meilleur, meilleur_cout,
+                                    arret, evaluations[0])
+
+    # La population finale et ses coûts permettent de poursuivre l'évolution (ex: modèle en îles)
+    if retourner_population:
+        return meilleur, meilleur_cout, population, couts
+    return meilleur, meilleur_cout
+
+
+# --- AG avec sélection par roulette ---
+
+def ag_roulette(evaluer, taille_individu, taille_pop, taux_sel, taux_mut, generations, type_croisement,
+                population_initiale=None, retourner_population=False, amelioration=None, cache=None,
+                observateur=None, reprise=None, selection="roulette", arret=None, mutation=None):
+    """
+    Les parents (taille_pop * taux_sel) sont tirés par roulette, avec une
+    probabilité proportionnelle à 1 / coût, et la population est entièrement remplacée.
+    selection : "roulette", "tournoi", "sus", "rang" ou fonction (couts, k) -> indices
+    (voir selection.py).
+    cache, observateur, reprise, arret, mutation : voir ag_elitiste (un redémarrage ne conserve que le meilleur).
+    Retourne (meilleur, cout) ou (meilleur, cout, population, couts).
+    """
+    fonction_croisement = obtenir_croisement(type_croisement)
+    choisir_parents = _selection_parents(selection)
+    mutation = _operateur_mutation(mutation, taux_mut)
+    evaluations = [0]
+    if arret is not None:
+        evaluer = _compter_evaluations(evaluer, evaluations)
+    if cache is not None:
+        evaluer = cache.envelopper(evaluer)
+    etat = reprise.charger("ag_roulette") if reprise is not None else None
+    if arret is not None:
+        arret.demarrer(etat=etat)
+    if etat is None:
+        premiere_generation = 0
+        population = _population_depart(taille_pop, taille_individu, population_initiale)
+        couts = evaluer(population)
+        indice = int(np.argmin(couts))
+        meilleur, meilleur_cout = population[indice].tolist(), couts[indice].item()
+    else:
+        premiere_generation, population, couts, meilleur, meilleur_cout = _restaurer_generation(etat)
+
+    for gen in range(premiere_generation, generations):
+        if observateur is not None:
+            debut = time.perf_counter()
+        indices = choisir_parents(couts, max(2, int(taille_pop * taux_sel)))
+        parents = population[indices].tolist()
+        if observateur is not None:
+            temps = dict.fromkeys(TEMPS_OPERATEURS, 0.0)
+            temps["temps_selection"] = time.perf_counter() - debut
+
+        if mutation is not None:
+            population = _reproduire_par_lot(parents, couts[indices], couts, taille_pop, fonction_croisement, taux_mut,
+                                             mutation, amelioration, temps if observateur is not None else None)
+        elif observateur is None:
+            population = population_en_tableau(
+                _reproduire([], parents, taille_pop, fonction_croisement, taux_mut, amelioration))
+        else:
+            population = population_en_tableau(
+                _reproduire_chronometre([], parents, taille_pop, fonction_croisement, taux_mut, amelioration, temps))
+        if observateur is not None:
+            debut = time.perf_counter()
+
+        couts = evaluer(population)
+        indice = int(np.argmin(couts))
+        if couts[indice] < meilleur_cout:
+            meilleur, meilleur_cout = population[indice].tolist(), couts[indice].item()
+            if arret is not None:
+                arret.ameliore(gen + 1)
+
+        termine = arret is not None and arret.atteint(gen + 1, meilleur_cout, evaluations[0])
+        if observateur is not None:
+            temps["temps_evaluation"] = time.perf_counter() - debut
+            emettre(observateur, _evenement_generation("ag_roulette", gen + 1, meilleur_cout, couts, population,
+                                                       temps), meilleur)
+        if termine:
+            break
+        if arret is not None and arret.redemarrer(gen + 1):
+            population, couts, meilleur, meilleur_cout = _redemarrer_population(
+                arret, gen + 1, population, couts, 1, meilleur, meilleur_cout, evaluer)
+        if reprise is not None and (gen + 1) % reprise.periode == 0:
+            _sauvegarder_generation(reprise, "ag_roulette", gen + 1, population, couts, meilleur, meilleur_cout,
+                                    arret, evaluations[0])
+
+    if retourner_population:
+        return meilleur, meilleur_cout, population, couts
+    return meilleur, meilleur_cout
+
+
+# --- AG élitiste par lots (population en mémoire partagée) ---
+# Variante de ag_elitiste pour les grandes populations : la population reste
+# dans une PopulationPartagee (population.py) et chaque génération est produite
+# par tranches de lignes avec les croisements par lots de croisements.py. Avec
+# nb_processus != 1, les tranches sont confiées à un pool dont les processus
+# lisent les parents et écrivent les enfants directement en mémoire partagée :
+# seuls les indices des parents et les coûts des enfants transitent. Le
+# découpage en tranches ne dépend pas du nombre de processus, le résultat non plus.
+
+ENFANTS_PAR_TRANCHE = 4096
+
+
+class _Reproduction:
+    """
+    Croise, mute et évalue une tranche d'enfants de la génération suivante.
+    Copiée une fois dans chaque processus de travail (la population par son nom).
+    """
+
+    def __init__(self, population, evaluer, operateur, mutation):
+        self.population = population
+        self.evaluer = evaluer
+        self.operateur = operateur
+        self.mutation = mutation
+        self.tampons = Tampons(population.n)
+
+    def evaluer_tranche(self, debut, fin):
+        return self.evaluer(self.population.courante[debut:fin])
+
+    def produire_tranche(self, debut, fin, indices1, indices2, taux, graine):
+        rng = np.random.default_rng(graine)
+        enfants = self.population.suivante[debut:fin]
+        croisement_lot(self.operateur, self.population.courante, indices1, indices2, enfants, rng, self.tampons)
+        mutation_lot(self.mutation, enfants, taux, rng)
+        return self.evaluer(enfants)
+
+
+_reproduction = None
+
+
+def _initialiser_reproduction(reproduction):
+    global _reproduction
+    _reproduction = reproduction
+
+
+def _evaluer_tranche(debut, fin):
+    return _reproduction.evaluer_tranche(debut, fin)
+
+
+def _produire_tranche(debut, fin, indices1, indices2, taux, graine):
+    return _reproduction.produire_tranche(debut, fin, indices1, indices2, taux, graine)
+
+
+def _tranches(debut, fin):
+    debuts = range(debut, fin, ENFANTS_PAR_TRANCHE)
+    return debuts, [min(d + ENFANTS_PAR_TRANCHE, fin) for d in debuts]
+
+
+def _reporter_evaluations(evaluer, nombre):
+    # Les processus de travail évaluent des copies du problème : leurs évaluations sont reportées sur l'original
+    probleme = getattr(evaluer, "__self__", None)
+    if probleme is not None and hasattr(probleme, "nb_evaluations"):
+        probleme.nb_evaluations += nombre
+
+
+def ag_elitiste_lot(evaluer, taille_individu, taille_population, taux_elitism, taux_mutation, generations,
+                    operateur="ox", taille_reproduction=None, nb_processus=1, population_initiale=None,
+                    retourner_population=False, observateur=None, arret=None, mutation="echange"):
+    """
+    Même schéma que ag_elitiste (élites conservées, parents distincts tirés parmi les
+    `taille_reproduction` meilleurs) sur une population en mémoire partagée.
+    operateur : croisement par lots, "ox", "pmx", "cycle" ou "arete" (voir croisements.croisement_lot).
+    mutation : opérateur de mutations.MUTATIONS ; taux_mutation : nombre ou mutations.TauxAdaptatif.
+    nb_processus : processus produisant et évaluant les tranches (1 = dans le processus courant) ;
+    evaluer doit alors être sérialisable (ex: probleme.evaluer_population).
+    observateur, arret : voir ag_elitiste.
+    Retourne (meilleur, cout) ou (meilleur, cout, population, couts).
+    """
+    if operateur != "ox" and operateur not in OPERATEURS_SEGMENT and operateur not in OPERATEURS_SANS_SEGMENT:
+        raise ValueError("Croisement non reconnu. Choisissez parmi 'ox', 'pmx', 'cycle', 'arete'.")
+    verifier_mutation(mutation)
+    nombre_elites = max(1, int(taille_population * taux_elitism))
+    if taille_reproduction is None:
+        taille_reproduction = int(taille_population * (1 - taux_elitism/2))
+    taille_reproduction = min(max(2, taille_reproduction), taille_population)
+    rng = generateur_numpy()
+
+    population = PopulationPartagee(taille_population, taille_individu)
+    reproduction = _Reproduction(population, evaluer, operateur, mutation)
+    if nb_processus == 1:
+        executeur, carte = None, map
+        evaluer_tranche, produire_tranche = reproduction.evaluer_tranche, reproduction.produire_tranche
+    else:
+        executeur = ProcessPoolExecutor(nb_processus, initializer=_initialiser_reproduction,
+                                        initargs=(reproduction,))
+        carte, evaluer_tranche, produire_tranche = executeur.map, _evaluer_tranche, _produire_tranche
+    evaluations = 0
+    try:
+        if population_initiale is None:
+            population.courante[:] = np.arange(taille_individu)
+            rng.permuted(population.courante, axis=1, out=population.courante)
+        else:
+            population.charger(population_initiale)
+        couts = np.concatenate(list(carte(evaluer_tranche, *_tranches(0, taille_population))))
+        evaluations += taille_population
+        indice = int(np.argmin(couts))
+        meilleur, meilleur_cout = population.courante[indice].tolist(), couts[indice].item()
+        if arret is not None:
+            arret.demarrer()
+
+        for generation in range(generations):
+            if observateur is not None:
+                debut = time.perf_counter()
+            ordre = meilleurs_indices(couts, max(nombre_elites, taille_reproduction))
+            elites, reproducteurs = ordre[:nombre_elites], ordre[:taille_reproduction]
+            population.suivante[:nombre_elites] = population.courante[elites]  # Copies : aucun alias
+
+            # Deux parents distincts par enfant, comme random.sample(parents, 2)
+            nb_enfants = taille_population - nombre_elites
+            rangs1 = rng.integers(0, taille_reproduction, nb_enfants)
+            rangs2 = (rangs1 + rng.integers(1, taille_reproduction, nb_enfants)) % taille_reproduction
+            indices1, indices2 = reproducteurs[rangs1], reproducteurs[rangs2]
+            taux = taux_mutation
+            if callable(taux):
+                taux = taux(np.minimum(couts[indices1], couts[indices2]), couts)
+            debuts, fins = _tranches(nombre_elites, taille_population)
+            tranches = [slice(d - nombre_elites, f - nombre_elites) for d, f in zip(debuts, fins)]
+            couts_enfants = carte(produire_tranche, debuts, fins, [indices1[t] for t in tranches],
+                                  [indices2[t] for t in tranches],
+                                  [taux[t] if callable(taux_mutation) else taux for t in tranches],
+                                  rng.integers(0, 2**63, len(debuts)))
+            couts = np.concatenate([couts[elites], *couts_enfants])
+            population.echanger()
+            evaluations += nb_enfants
+
+            indice = int(np.argmin(couts))
+            if couts[indice] < meilleur_cout:
+                meilleur, meilleur_cout = population.courante[indice].tolist(), couts[indice].item()
+                if arret is not None:
+                    arret.ameliore(generation + 1)
+
+            termine = arret is not None and arret.atteint(generation + 1, meilleur_cout, evaluations)
+            if observateur is not None:
+                emettre(observateur, _evenement_generation("ag_elitiste_lot", generation + 1, meilleur_cout, couts,
+                                                           population.courante,
+                                                           {"duree": time.perf_counter() - debut}), meilleur)
+            if termine:
+                break
+            if arret is not None and arret.redemarrer(generation + 1):
+                # Les élites restent en tête, le reste est remplacé par des perturbations du meilleur
+                population.courante[nombre_elites:] = [arret.redemarrage.perturber(meilleur)
+                                                       for _ in range(nb_enfants)]
+                couts[nombre_elites:] = np.concatenate(
+                    list(carte(evaluer_tranche, *_tranches(nombre_elites, taille_population))))
+                evaluations += nb_enfants
+                indice = int(np.argmin(couts))
+                if couts[indice] < meilleur_cout:
+                    meilleur, meilleur_cout = population.courante[indice].tolist(), couts[indice].item()
+                    arret.ameliore(generation + 1)
+
+        if retourner_population:
+            return meilleur, meilleur_cout, population.courante.copy(), couts
+        return meilleur, meilleur_cout
+    finally:
+        if executeur is not None:
+            executeur.shutdown()
+            _reporter_evaluations(evaluer, evaluations)
+        del reproduction
+        population.fermer()
+
+
+# --- Points d'entrée par problème (utilisés par le modèle en îles) ---
+
+def algorithme_genetique(matrice_distances, taille_population, taux_elitism, taux_mutation, generations,
+                         type_croisement="permutation", population_initiale=None, retourner_population=False,
+                         amelioration=None, cache=None, reprise=None, arret=None):
+    evaluer = partial(evaluer_population, matrice=matrice_en_tableau(matrice_distances))
+    return ag_elitiste(evaluer, len(matrice_distances), taille_population, taux_elitism, taux_mutation, generations,
+                       type_croisement, population_initiale, retourner_population, amelioration, cache=cache,
+                       reprise=reprise, arret=arret)
+
+
+def algo_genetique(matrice, taille_pop, taux_sel, taux_mut, generations, type_croisement,
+                   population_initiale=None, retourner_population=False, amelioration=None, cache=None,
+                   selection="roulette"):
+    evaluer = partial(evaluer_population, matrice=matrice_en_tableau(matrice))
+    return ag_roulette(evaluer, len(matrice), taille_pop, taux_sel, taux_mut, generations, type_croisement,
+                       population_initiale, retourner_population, amelioration, cache, selection=selection)
+
+
+def algo_genetique_elitiste(durees, taille_pop, taux_elite, taux_mut, generations, type_croisement,
+                            population_initiale=None, retourner_population=False, cache=None):
+    # Les parents sont tirés parmi les seules élites
+    evaluer = partial(evaluer_population_flowtime, durees=durees)
+    return ag_elitiste(evaluer, len(durees), taille_pop, taux_elite, taux_mut, generations, type_croisement,
+                       population_initiale, retourner_population,
+                       taille_reproduction=max(1, int(taille_pop * taux_elite)), cache=cache)
+
+
+def algo_genetique_ordonnancement(durees, taille_pop, taux_sel, taux_mut, generations, type_croisement,
+                                  population_initiale=None, retourner_population=False, cache=None,
+                                  selection="roulette"):
+    evaluer = partial(evaluer_population_flowtime, durees=durees)
+    return ag_roulette(evaluer, len(durees), taille_pop, taux_sel, taux_mut, generations, type_croisement,
+                       population_initiale, retourner_population, cache=cache, selection=selection)
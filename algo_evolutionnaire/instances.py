@@ -0,0 +1,171 @@
+import math
+import os
+import random
+import re
+
+import numpy as np
+
+from .distances import MatriceDense, SourceCoordonnees, distances_coordonnees
+from .problemes import ProblemeTSP, ProblemeTWT
+
+# --- Chargement d'instances de référence (fichiers locaux) ---
+# - TSPLIB (.tsp / .atsp) : coordonnées EUC_2D, CEIL_2D, ATT, GEO ou matrice
+#   explicite (FULL_MATRIX, *_ROW, *_DIAG_ROW, *_COL), distances arrondies
+#   selon les conventions TSPLIB pour que les optimums publiés restent valables.
+# - OR-Library, retard pondéré sur une machine (wt40, wt50, wt100) : pour
+#   chaque instance, n temps de traitement, n poids puis n dates de livraison.
+
+SECTIONS = ("NODE_COORD_SECTION", "EDGE_WEIGHT_SECTION", "DISPLAY_DATA_SECTION", "FIXED_EDGES_SECTION",
+            "TOUR_SECTION", "DEMAND_SECTION", "DEPOT_SECTION", "EOF")
+TYPES_DISTANCE = ("EUC_2D", "CEIL_2D", "ATT", "GEO", "EXPLICIT")
+
+
+def _lire_tsplib(chemin):
+    """
+    Retourne (entête, sections) : entête {clé: valeur}, sections {nom: liste de jetons}.
+    """
+    entete, sections, section = {}, {}, None
+    with open(chemin, encoding="utf-8", errors="replace") as fichier:
+        for ligne in fichier:
+            ligne = ligne.strip()
+            if not ligne:
+                continue
+            mot = ligne.split()[0].rstrip(":")
+            if mot in SECTIONS:
+                if mot == "EOF":
+                    break
+                section = mot
+                sections[section] = []
+                continue
+            if section is None:
+                cle, _, valeur = ligne.partition(":")
+                entete[cle.strip().upper()] = valeur.strip()
+            else:
+                sections[section].extend(ligne.split())
+    return entete, sections
+
+
+def _distances_coordonnees(x, y, type_distance):
+    distances = distances_coordonnees(x[:, None], y[:, None], x[None, :], y[None, :], type_distance)
+    if type_distance == "GEO":
+        np.fill_diagonal(distances, 0)
+    return distances
+
+
+def _matrice_explicite(valeurs, n, format_poids):
+    valeurs = np.asarray(valeurs, dtype=float)
+    if format_poids == "FULL_MATRIX":
+        return valeurs[:n * n].reshape(n, n)
+    # Les formats *_COL d'une matrice symétrique équivalent aux formats *_ROW transposés
+    transposes = {"UPPER_COL": "LOWER_ROW", "LOWER_COL": "UPPER_ROW",
+                  "UPPER_DIAG_COL": "LOWER_DIAG_ROW", "LOWER_DIAG_COL": "UPPER_DIAG_ROW"}
+    format_poids = transposes.get(format_poids, format_poids)
+    diagonale = "DIAG" in format_poids
+    if format_poids.startswith("UPPER"):
+        lignes, colonnes = np.triu_indices(n, 0 if diagonale else 1)
+    elif format_poids.startswith("LOWER"):
+        lignes, colonnes = np.tril_indices(n, 0 if diagonale else -1)
+    else:
+        raise ValueError(f"EDGE_WEIGHT_FORMAT non pris en charge : {format_poids}")
+    matrice = np.zeros((n, n))
+    matrice[lignes, colonnes] = valeurs[:len(lignes)]
+    matrice[colonnes, lignes] = valeurs[:len(lignes)]
+    return matrice
+
+
+def charger_tsplib(chemin, compact=False):
+    """
+    Charge une instance TSPLIB (.tsp ou .atsp) et retourne un ProblemeTSP
+    (matrice en liste de listes, nom tiré du champ NAME).
+    compact : pour les grandes instances, distances calculées à la demande depuis
+    les coordonnées (SourceCoordonnees) ou matrice explicite en MatriceDense.
+    """
+    entete, sections = _lire_tsplib(chemin)
+    n = int(entete["DIMENSION"])
+    type_distance = entete.get("EDGE_WEIGHT_TYPE", "EXPLICIT").upper()
+    if type_distance not in TYPES_DISTANCE:
+        raise ValueError(f"EDGE_WEIGHT_TYPE non pris en charge : {type_distance}")
+
+    nom = entete.get("NAME") or os.path.splitext(os.path.basename(chemin))[0]
+    if type_distance == "EXPLICIT":
+        matrice = _matrice_explicite(sections["EDGE_WEIGHT_SECTION"], n,
+                                     entete.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX").upper())
+        if np.array_equal(matrice, np.round(matrice)):
+            matrice = matrice.astype(np.int64)
+        return ProblemeTSP(MatriceDense(matrice) if compact else matrice.tolist(), nom=nom)
+
+    coordonnees = np.asarray(sections["NODE_COORD_SECTION"], dtype=float).reshape(n, -1)
+    if compact:
+        return ProblemeTSP(SourceCoordonnees(coordonnees[:, 1], coordonnees[:, 2], type_distance), nom=nom)
+    return ProblemeTSP(_distances_coordonnees(coordonnees[:, 1], coordonnees[:, 2], type_distance).tolist(), nom=nom)
+
+
+def charger_orlib_wt(chemin, n=None):
+    """
+    Charge un fichier OR-Library de retard pondéré (ex: wt40.txt) et retourne
+    la liste de ses instances (ProblemeTWT nommés wt40_001, wt40_002, ...).
+    n : nombre de tâches par instance (déduit du nom du fichier s'il est omis).
+    """
+    base = os.path.splitext(os.path.basename(chemin))[0]
+    if n is None:
+        correspondance = re.search(r"(\d+)", base)
+        if correspondance is None:
+            raise ValueError("Nombre de tâches introuvable dans le nom du fichier : précisez n.")
+        n = int(correspondance.group(1))
+    with open(chemin, encoding="utf-8") as fichier:
+        valeurs = [int(v) for v in fichier.read().split()]
+    if len(valeurs) % (3 * n):
+        raise ValueError(f"Le fichier ne contient pas un nombre entier d'instances de {n} tâches.")
+
+    problemes = []
+    for k, debut in enumerate(range(0, len(valeurs), 3 * n)):
+        p = valeurs[debut:debut + n]
+        w = valeurs[debut + n:debut + 2 * n]
+        d = valeurs[debut + 2 * n:debut + 3 * n]
+        problemes.append(ProblemeTWT(p, d, w, nom=f"wt{n}_{k + 1:03d}"))
+    return problemes
+
+
+def charger_meilleurs_connus(chemin, noms=None):
+    """
+    Valeurs de référence (optimums ou meilleures solutions connues).
+    - lignes « nom : valeur » ou « nom valeur » (ex: solutions TSPLIB) ;
+    - ou une valeur par ligne, associée dans l'ordre aux `noms` fournis
+      (ex: fichiers wtopt d'OR-Library).
+    """
+    with open(chemin, encoding="utf-8") as fichier:
+        lignes = [ligne.replace(":", " ").split() for ligne in fichier if ligne.strip()]
+    if all(len(morceaux) == 1 for morceaux in lignes):
+        if noms is None:
+            raise ValueError("Fichier à une valeur par ligne : les noms des instances sont nécessaires.")
+        return {nom: float(morceaux[0]) for nom, morceaux in zip(noms, lignes)}
+    return {morceaux[0]: float(morceaux[1]) for morceaux in lignes if len(morceaux) >= 2}
+
+
+# --- Instances aléatoires (tailles arbitraires, reproductibles) ---
+
+def tsp_aleatoire(n, graine=0, cote=1000, compact=False):
+    """
+    n villes uniformes dans un carré, distances EUC_2D (arrondies comme TSPLIB).
+    compact : distances calculées à la demande (SourceCoordonnees) au lieu d'une matrice.
+    """
+    rng = np.random.default_rng(graine)
+    x, y = rng.uniform(0, cote, n), rng.uniform(0, cote, n)
+    if compact:
+        return ProblemeTSP(SourceCoordonnees(x, y, "EUC_2D"), nom=f"alea_tsp{n}")
+    return ProblemeTSP(_distances_coordonnees(x, y, "EUC_2D").tolist(), nom=f"alea_tsp{n}")
+
+
+def twt_aleatoire(n, graine=0, facteur_retard=0.6, etendue=0.6):
+    """
+    Génère n tâches comme les instances OR-Library : p dans [1, 100], w dans [1, 10],
+    dates de livraison uniformes autour de (1 - facteur_retard) * somme(p).
+    """
+    rng = random.Random(graine)
+    p = [rng.randint(1, 100) for _ in range(n)]
+    w = [rng.randint(1, 10) for _ in range(n)]
+    total = sum(p)
+    bas = total * (1 - facteur_retard - etendue / 2)
+    haut = total * (1 - facteur_retard + etendue / 2)
+    d = [rng.randint(max(0, math.floor(bas)), max(0, math.floor(haut))) for _ in range(n)]
+    return ProblemeTWT(p, d, w, nom=f"alea_twt{n}")
@@ -0,0 +1,87 @@
+from collections import deque
+
+# --- Mémoire tabou à temps constant ---
+# Chaque attribut interdit est associé à l'itération à laquelle il expire
+# (table de hachage) ; une file circulaire, ordonnée par date d'expiration,
+# permet de purger les attributs périmés sans parcourir la mémoire. Le test
+# d'appartenance et l'éviction coûtent O(1), quelle que soit la durée tabou.
+
+ATTRIBUTS = ("mouvement", "position")
+
+
+class MemoireTabou:
+    """
+    Mémoire tabou : un attribut ajouté à l'itération t reste tabou jusqu'à
+    l'itération t + duree incluse (même comportement qu'une liste FIFO de
+    `duree` mouvements, à raison d'un ajout par itération).
+    """
+
+    def __init__(self, duree):
+        self.duree = duree
+        self.iteration = 0
+        self._expiration = {}
+        self._file = deque()
+
+    def est_tabou(self, attribut):
+        return self._expiration.get(attribut, -1) >= self.iteration
+
+    __contains__ = est_tabou
+
+    def ajouter(self, attribut):
+        expiration = self.iteration + self.duree
+        self._expiration[attribut] = expiration
+        self._file.append((attribut, expiration))
+
+    def avancer(self):
+        """
+        Passe à l'itération suivante et oublie les attributs expirés.
+        """
+        self.iteration += 1
+        while self._file and self._file[0][1] < self.iteration:
+            attribut, expiration = self._file.popleft()
+            if self._expiration.get(attribut) == expiration:
+                del self._expiration[attribut]
+
+    def __len__(self):
+        return len(self._expiration)
+
+    def entrees(self):
+        # (attribut, expiration) par date d'expiration croissante (points de reprise)
+        return list(self._file)
+
+    def restaurer(self, iteration, entrees):
+        self.iteration = iteration
+        self._file = deque(entrees)
+        self._expiration = {attribut: expiration for attribut, expiration in entrees}
+
+
+# --- Attributs tabous d'un mouvement ---
+# "mouvement" : le mouvement lui-même (ex: le couple de positions (i, j)) est interdit.
+# "position"  : (échanges uniquement) une ville ne peut pas revenir à la position
+#               qu'elle vient de quitter.
+
+def verifier_attribut(attribut):
+    if attribut not in ATTRIBUTS:
+        raise ValueError("Attribut tabou non reconnu. Choisissez parmi 'mouvement', 'position'.")
+
+
+def mouvement_est_tabou(memoire, solution, move, attribut="mouvement"):
+    """
+    Vrai si le mouvement `move` appliqué à `solution` viole la mémoire tabou.
+    """
+    if attribut == "mouvement":
+        return move in memoire
+    i, j = move
+    return (solution[j], i) in memoire or (solution[i], j) in memoire
+
+
+def memoriser_mouvement(memoire, solution, move, attribut="mouvement"):
+    """
+    Enregistre dans la mémoire le mouvement `move` (à appeler AVANT de l'appliquer).
+    """
+    if attribut == "mouvement":
+        memoire.ajouter(move)
+    else:
+        i, j = move
+        memoire.ajouter((solution[i], i))
+        memoire.ajouter((solution[j], j))
@@ -0,0 +1,120 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Modèle en îles (AG parallèle avec migration) ---
+# Chaque île fait évoluer sa propre sous-population avec l'un des AG de
+# genetique.py (algorithme_genetique, algo_genetique, algo_genetique_elitiste ou
+# algo_genetique_ordonnancement) dans un processus séparé. Toutes les
+# `intervalle_migration` générations, les meilleurs individus de chaque île
+# remplacent les pires individus d'une île voisine.
+
+TOPOLOGIES = ("anneau", "aleatoire")
+
+
+def _evoluer_ile(tache):
+    """
+    Exécuté dans un processus de travail : fait évoluer une île pendant une époque
+    et retourne sa population finale avec les coûts calculés par l'AG à la dernière
+    génération (pour la migration, sans nouvelle évaluation).
+    """
+    fonction_ag, donnees, parametres, population, generations, graine = tache
+    random.seed(graine)
+    meilleur, meilleur_cout, population, couts = fonction_ag(
+        donnees, generations=generations, population_initiale=population,
+        retourner_population=True, **parametres
+    )
+    return meilleur, meilleur_cout, population, couts.tolist()
+
+
+def _destinations(nb_iles, topologie, rng):
+    """
+    Île destinataire des migrants de chaque île.
+    """
+    if topologie == "anneau":
+        return [(ile + 1) % nb_iles for ile in range(nb_iles)]
+    # Topologie aléatoire : une autre île tirée au hasard à chaque migration
+    return [(ile + 1 + rng.randrange(nb_iles - 1)) % nb_iles for ile in range(nb_iles)]
+
+
+def _migrer(populations, couts, nb_migrants, destinations):
+    """
+    Remplace les pires individus de chaque île destinataire par des copies des
+    meilleurs individus de l'île source (calculés avant tout échange).
+    """
+    migrants = []
+    for population, couts_ile in zip(populations, couts):
+        ordre = sorted(range(len(population)), key=couts_ile.__getitem__)
+        migrants.append([(list(population[k]), couts_ile[k]) for k in ordre[:nb_migrants]])
+
+    for source, destination in enumerate(destinations):
+        population, couts_ile = populations[destination], couts[destination]
+        pires = sorted(range(len(population)), key=couts_ile.__getitem__, reverse=True)
+        for k, (individu, cout) in zip(pires, migrants[source]):
+            population[k] = individu
+            couts_ile[k] = cout
+
+
+def algorithme_genetique_iles(fonction_ag, donnees, parametres, nb_iles, generations,
+                              intervalle_migration=20, nb_migrants=2, topologie="anneau",
+                              nb_processus=None, graine=None):
+    """
+    Fait évoluer `nb_iles` sous-populations en parallèle (une par processus) et
+    échange les meilleurs individus toutes les `intervalle_migration` générations.
+
+    - fonction_ag : un des AG de genetique.py (doit accepter population_initiale et retourner_population)
+    - donnees : matrice des distances (TSP) ou durées des tâches (ordonnancement)
+    - parametres : autres arguments de fonction_ag (taille de population, taux, croisement...)
+    - topologie : "anneau" (île i -> île i+1) ou "aleatoire" (île tirée à chaque migration)
+    - nb_processus : taille du pool (None = nombre de cœurs, 1 = exécution séquentielle)
+
+    Retourne (meilleur_individu, meilleur_cout, statistiques) où statistiques contient,
+    pour chaque île, son meilleur coût et l'historique par époque du meilleur coût,
+    du coût moyen et de la diversité (part d'individus distincts).
+    """
+    if topologie not in TOPOLOGIES:
+        raise ValueError("Topologie non reconnue. Choisissez parmi 'anneau', 'aleatoire'.")
+    if nb_iles < 2:
+        raise ValueError("Le modèle en îles nécessite au moins deux îles.")
+
+    rng = random.Random(graine)
+    populations = [None] * nb_iles  # Chaque île génère sa population initiale
+    meilleur, meilleur_cout = None, float('inf')
+    statistiques = [
+        {"ile": ile, "meilleur_cout": float('inf'), "meilleurs": [], "moyennes": [], "diversites": []}
+        for ile in range(nb_iles)
+    ]
+
+    executeur = ProcessPoolExecutor(max_workers=nb_processus) if nb_processus != 1 else None
+    carte = executeur.map if executeur is not None else map
+    try:
+        generations_restantes = generations
+        while generations_restantes > 0:
+            duree_epoque = min(intervalle_migration, generations_restantes)
+            generations_restantes -= duree_epoque
+
+            taches = [
+                (fonction_ag, donnees, parametres, populations[ile], duree_epoque, rng.getrandbits(64))
+                for ile in range(nb_iles)
+            ]
+            resultats = list(carte(_evoluer_ile, taches))
+
+            couts = []
+            for ile, (meilleur_ile, cout_ile, population, couts_ile) in enumerate(resultats):
+                populations[ile] = population
+                couts.append(couts_ile)
+                stats = statistiques[ile]
+                stats["meilleur_cout"] = min(stats["meilleur_cout"], cout_ile)
+                stats["meilleurs"].append(min(couts_ile))
+                stats["moyennes"].append(sum(couts_ile) / len(couts_ile))
+                stats["diversites"].append(len({tuple(ind) for ind in population}) / len(population))
+                if cout_ile < meilleur_cout:
+                    meilleur, meilleur_cout = list(meilleur_ile), cout_ile
+
+            # Migration (inutile après la dernière époque)
+            if generations_restantes > 0 and nb_migrants > 0:
+                _migrer(populations, couts, nb_migrants, _destinations(nb_iles, topologie, rng))
+    finally:
+        if executeur is not None:
+            executeur.shutdown()
+
+    return meilleur, meilleur_cout, statistiques
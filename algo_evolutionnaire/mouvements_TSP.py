@@ -0,0 +1,426 @@
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from .distances import SourceDistances, listes_voisins
+from .evaluation_TSP import calculer_distance_totale, matrice_en_tableau
+from .voisinage import masquer
+
+# --- Évaluation incrémentale des mouvements pour le TSP ---
+# Un mouvement ne modifie que quelques arêtes de la tournée : on calcule la
+# variation de distance à partir de ces seules arêtes, sans copier le chemin.
+
+
+def delta_echange(chemin, matrice, i, j):
+    """
+    Variation de la distance totale si l'on échange les villes aux positions i et j.
+    Le calcul ne relit que les (au plus) quatre arêtes touchées : O(1).
+    La matrice peut être asymétrique.
+    """
+    n = len(chemin)
+    if i == j:
+        return 0
+    if i > j:
+        i, j = j, i
+    a, b = chemin[i], chemin[j]
+
+    # Cas général : positions non adjacentes (ni directement, ni par le bouclage)
+    if j - i > 1 and not (i == 0 and j == n - 1):
+        pi, si = chemin[i - 1], chemin[i + 1]
+        pj, sj = chemin[j - 1], chemin[(j + 1) % n]
+        return (matrice[pi][b] + matrice[b][si] + matrice[pj][a] + matrice[a][sj]) \
+            - (matrice[pi][a] + matrice[a][si] + matrice[pj][b] + matrice[b][sj])
+
+    # Positions adjacentes : on recalcule les arêtes touchées sans les compter deux fois
+    delta = 0
+    for k in {(i - 1) % n, i, (j - 1) % n, j}:
+        s = (k + 1) % n
+        u = b if k == i else a if k == j else chemin[k]
+        v = b if s == i else a if s == j else chemin[s]
+        delta += matrice[u][v] - matrice[chemin[k]][chemin[s]]
+    return delta
+
+
+def appliquer_echange(chemin, i, j):
+    """
+    Applique l'échange (i, j) directement dans le chemin (sans copie).
+    """
+    chemin[i], chemin[j] = chemin[j], chemin[i]
+    return chemin
+
+
+def meilleur_echange(chemin, matrice, interdit=None):
+    """
+    Parcourt tous les échanges (i, j), i < j, et retourne le meilleur (delta, (i, j))
+    parmi ceux que `interdit(move, delta)` n'exclut pas, sans construire aucun voisin.
+    Retourne (inf, None) si tous les mouvements sont exclus.
+    """
+    n = len(chemin)
+    meilleur_delta = float('inf')
+    meilleur_move = None
+    for i in range(n):
+        for j in range(i + 1, n):
+            delta = delta_echange(chemin, matrice, i, j)
+            if delta >= meilleur_delta:
+                continue
+            if interdit is not None and interdit((i, j), delta):
+                continue
+            meilleur_delta = delta
+            meilleur_move = (i, j)
+    return meilleur_delta, meilleur_move
+
+
+# --- Mouvement 2-opt : inversion du segment chemin[i+1..j] ---
+
+def delta_2opt(chemin, matrice, i, j, symetrique=False):
+    """
+    Variation de la distance si l'on inverse le segment chemin[i+1..j] (i < j).
+    Les arêtes (a, b) et (c, d) sont remplacées par (a, c) et (b, d) : O(1) si
+    la matrice est symétrique. Sinon le sens des arêtes internes au segment change
+    et leur variation est ajoutée (coût proportionnel à la longueur du segment).
+    """
+    n = len(chemin)
+    if i > j:
+        i, j = j, i
+    a, b = chemin[i], chemin[i + 1]
+    c, d = chemin[j], chemin[(j + 1) % n]
+    delta = matrice[a][c] + matrice[b][d] - matrice[a][b] - matrice[c][d]
+    if not symetrique:
+        delta += _delta_inversion_interne(chemin, matrice, i + 1, j)
+    return delta
+
+
+def _delta_inversion_interne(chemin, matrice, debut, fin):
+    """
+    Variation des arêtes internes au segment chemin[debut..fin] lorsqu'on l'inverse
+    (nulle pour une matrice symétrique).
+    """
+    delta = 0
+    for k in range(debut, fin):
+        u, v = chemin[k], chemin[k + 1]
+        delta += matrice[v][u] - matrice[u][v]
+    return delta
+
+
+def appliquer_2opt(chemin, i, j):
+    """
+    Inverse sur place le segment chemin[i+1..j].
+    """
+    if i > j:
+        i, j = j, i
+    chemin[i + 1:j + 1] = chemin[i + 1:j + 1][::-1]
+    return chemin
+
+
+# --- Mouvement Or-opt : déplacement d'un segment de 1 à 3 villes ---
+
+def delta_or_opt(chemin, matrice, i, longueur, j):
+    """
+    Variation de la distance si l'on déplace le segment chemin[i..i+longueur-1]
+    entre les villes chemin[j] et chemin[j+1] (sans l'inverser) : O(1).
+    j ne doit appartenir ni au segment ni être la position qui le précède.
+    """
+    n = len(chemin)
+    p, s0 = chemin[i - 1], chemin[i]
+    s1, nx = chemin[i + longueur - 1], chemin[(i + longueur) % n]
+    u, v = chemin[j], chemin[(j + 1) % n]
+    return (matrice[p][nx] + matrice[u][s0] + matrice[s1][v]) \
+        - (matrice[p][s0] + matrice[s1][nx] + matrice[u][v])
+
+
+def appliquer_or_opt(chemin, i, longueur, j):
+    """
+    Déplace sur place le segment chemin[i..i+longueur-1] juste après chemin[j].
+    """
+    segment = chemin[i:i + longueur]
+    del chemin[i:i + longueur]
+    if j > i:
+        j -= longueur
+    chemin[j + 1:j + 1] = segment
+    return chemin
+
+
+# --- Opérateurs de voisinage interchangeables ---
+# Chaque opérateur décrit un type de mouvement : `delta(chemin, matrice, move)`,
+# `appliquer(chemin, move)`, `tirer(n)` (mouvement aléatoire) et `enumerer(n)`
+# (tous les mouvements, dans un ordre fixe). Ils servent au recuit simulé et à
+# la recherche tabou.
+
+Operateur = namedtuple("Operateur", ["delta", "appliquer", "tirer", "enumerer"])
+
+LONGUEUR_MAX_OR_OPT = 3
+
+
+def _tirer_echange(n):
+    return tuple(random.sample(range(n), 2))
+
+
+def _enumerer_echange(n):
+    for i in range(n):
+        for j in range(i + 1, n):
+            yield (i, j)
+
+
+def _tirer_2opt(n):
+    return tuple(sorted(random.sample(range(n), 2)))
+
+
+def _enumerer_2opt(n):
+    for i in range(n - 1):
+        for j in range(i + 2, n):
+            yield (i, j)
+
+
+def _tirer_or_opt(n):
+    longueur = random.randint(1, min(LONGUEUR_MAX_OR_OPT, n - 2))
+    i = random.randrange(n - longueur + 1)
+    # Positions interdites : le segment et la position qui le précède
+    j = (i + longueur + random.randrange(n - longueur - 1)) % n
+    return (i, longueur, j)
+
+
+def _enumerer_or_opt(n):
+    for longueur in range(1, min(LONGUEUR_MAX_OR_OPT, n - 2) + 1):
+        for i in range(n - longueur + 1):
+            for decalage in range(n - longueur - 1):
+                yield (i, longueur, (i + longueur + decalage) % n)
+
+
+def _operateur_2opt(symetrique):
+    return Operateur(
+        lambda chemin, matrice, move: delta_2opt(chemin, matrice, *move, symetrique=symetrique),
+        lambda chemin, move: appliquer_2opt(chemin, *move),
+        _tirer_2opt, _enumerer_2opt,
+    )
+
+
+OPERATEURS = {
+    "echange": Operateur(
+        lambda chemin, matrice, move: delta_echange(chemin, matrice, *move),
+        lambda chemin, move: appliquer_echange(chemin, *move),
+        _tirer_echange, _enumerer_echange,
+    ),
+    "2opt": _operateur_2opt(symetrique=False),
+    "oropt": Operateur(
+        lambda chemin, matrice, move: delta_or_opt(chemin, matrice, *move),
+        lambda chemin, move: appliquer_or_opt(chemin, *move),
+        _tirer_or_opt, _enumerer_or_opt,
+    ),
+}
+OPERATEUR_2OPT_SYMETRIQUE = _operateur_2opt(symetrique=True)
+
+
+def est_symetrique(matrice):
+    """
+    Vrai si matrice[a][b] == matrice[b][a] pour toutes les paires de villes.
+    """
+    if isinstance(matrice, SourceDistances):
+        return matrice.est_symetrique()
+    if isinstance(matrice, np.ndarray):
+        return bool(np.array_equal(matrice, matrice.T))
+    n = len(matrice)
+    return all(matrice[a][b] == matrice[b][a] for a in range(n) for b in range(a + 1, n))
+
+
+def obtenir_operateur(mouvement, matrice=None, symetrique=None):
+    """
+    Retourne l'opérateur correspondant au nom du mouvement. Si la matrice est
+    symétrique (indiqué par `symetrique` ou vérifié sur `matrice`), le 2-opt
+    est évalué en O(1).
+    """
+    if mouvement not in OPERATEURS:
+        raise ValueError("Mouvement non reconnu. Choisissez parmi 'echange', '2opt', 'oropt'.")
+    if symetrique is None and mouvement == "2opt" and matrice is not None:
+        symetrique = est_symetrique(matrice)
+    if mouvement == "2opt" and symetrique:
+        return OPERATEUR_2OPT_SYMETRIQUE
+    return OPERATEURS[mouvement]
+
+
+def meilleur_mouvement(chemin, matrice, operateur, interdit=None):
+    """
+    Comme meilleur_echange, pour n'importe quel opérateur de voisinage.
+    Retourne (delta, move) ou (inf, None) si tous les mouvements sont exclus.
+    """
+    meilleur_delta = float('inf')
+    meilleur_move = None
+    for move in operateur.enumerer(len(chemin)):
+        delta = operateur.delta(chemin, matrice, move)
+        if delta >= meilleur_delta:
+            continue
+        if interdit is not None and interdit(move, delta):
+            continue
+        meilleur_delta = delta
+        meilleur_move = move
+    return meilleur_delta, meilleur_move
+
+
+def taille_voisinage(mouvement, n):
+    """
+    Nombre de mouvements énumérés par l'opérateur pour une tournée de n villes.
+    """
+    if mouvement == "echange":
+        return n * (n - 1) // 2
+    if mouvement == "2opt":
+        return max(0, (n - 1) * (n - 2) // 2)
+    return sum((n - longueur + 1) * (n - longueur - 1) for longueur in range(1, min(LONGUEUR_MAX_OR_OPT, n - 2) + 1))
+
+
+# --- Évaluateur incrémental (interface commune avec evaluation_ordonnancement) ---
+
+class EvaluateurTSP:
+    """
+    Maintient une tournée (`ordre`) et sa distance (`cout`) ; les mouvements
+    "echange", "2opt" et "oropt" sont évalués par delta avec les opérateurs
+    ci-dessus. La symétrie de la matrice n'est vérifiée qu'au premier 2-opt.
+    """
+
+    MOUVEMENTS = tuple(OPERATEURS)
+
+    def __init__(self, matrice, ordre=None, symetrique=None):
+        self.matrice = matrice
+        self.symetrique = symetrique
+        self._operateurs = {}
+        self._distances = None  # Lecture vectorisée des distances, préparée au premier noyau_deltas
+        self._voisins = None  # Plus proches voisins de chaque ville (paires_proches)
+        self.nb_evaluations = 0
+        self.definir_ordre(range(len(matrice)) if ordre is None else ordre)
+
+    def definir_ordre(self, ordre):
+        self.ordre = list(ordre)
+        self.cout = calculer_distance_totale(self.ordre, self.matrice)
+        self.nb_evaluations += 1
+
+    def operateur(self, mouvement):
+        try:
+            return self._operateurs[mouvement]
+        except KeyError:
+            if mouvement == "2opt" and self.symetrique is None:
+                self.symetrique = est_symetrique(self.matrice)
+            operateur = self._operateurs[mouvement] = obtenir_operateur(mouvement, self.matrice, self.symetrique)
+            return operateur
+
+    def tirer(self, mouvement):
+        return self.operateur(mouvement).tirer(len(self.ordre))
+
+    def delta(self, mouvement, move):
+        self.nb_evaluations += 1
+        return self.operateur(mouvement).delta(self.ordre, self.matrice, move)
+
+    def enumerer(self, mouvement):
+        return self.operateur(mouvement).enumerer(len(self.ordre))
+
+    def meilleur_mouvement(self, mouvement="echange", interdit=None):
+        self.nb_evaluations += taille_voisinage(mouvement, len(self.ordre))
+        return meilleur_mouvement(self.ordre, self.matrice, self.operateur(mouvement), interdit)
+
+    def _preparer_distances(self):
+        # Distances lues par blocs, converties en int64 / float64 : mêmes sommes que matrice[a][b] en Python
+        source = matrice_en_tableau(self.matrice)
+        lire = source.distances if isinstance(source, SourceDistances) else (lambda u, v: source[u, v])
+
+        def distances(u, v):
+            valeurs = np.asarray(lire(u, v))
+            return valeurs.astype(np.result_type(valeurs.dtype, np.int64), copy=False)
+        self._distances = distances
+
+    def _deltas_vectorises(self, chemin, mouvement, i, j):
+        # Deltas des mouvements (i, j), i < j, pour des tableaux d'indices diffusables entre eux,
+        # sans le cas des positions adjacentes de l'échange
+        d, n = self._distances, len(chemin)
+        a, b = chemin[i], chemin[j]
+        if mouvement == "2opt":
+            s, t = chemin[(i + 1) % n], chemin[(j + 1) % n]
+            return d(a, b) + d(s, t) - d(a, s) - d(b, t)
+        pi, si, pj, sj = chemin[i - 1], chemin[(i + 1) % n], chemin[j - 1], chemin[(j + 1) % n]
+        # Mêmes termes, dans le même ordre, que delta_echange
+        return (d(pi, b) + d(b, si) + d(pj, a) + d(a, sj)) - (d(pi, a) + d(a, si) + d(pj, b) + d(b, sj))
+
+    def _vectorisable(self, mouvement):
+        if mouvement == "oropt":
+            return False
+        if mouvement == "2opt" and self.operateur(mouvement) is not OPERATEUR_2OPT_SYMETRIQUE:
+            return False
+        if self._distances is None:
+            self._preparer_distances()
+        return True
+
+    def noyau_deltas(self, mouvement):
+        """
+        Fonction (debut, fin) -> bloc des deltas des mouvements (i, j) des lignes
+        debut..fin-1, calculés d'un coup (voir voisinage.masquer). None pour l'Or-opt
+        et le 2-opt sur matrice asymétrique.
+        """
+        if not self._vectorisable(mouvement):
+            return None
+        chemin = np.asarray(self.ordre)
+        n = len(chemin)
+        positions = np.arange(n)
+        ecart = 2 if mouvement == "2opt" else 1  # Plus petit j - i énuméré
+
+        def noyau(debut, fin):
+            i, j = np.arange(debut, fin)[:, None], positions[debut + ecart:]
+            deltas = self._deltas_vectorises(chemin, mouvement, i, j)
+            if mouvement == "echange":
+                # Positions adjacentes (directement ou par le bouclage) : au plus une par ligne, calcul exact
+                for k in range(debut, min(fin, n - 1)):
+                    deltas[k - debut, k - debut] = delta_echange(self.ordre, self.matrice, k, k + 1)
+                if debut == 0:
+                    deltas[0, n - 2] = delta_echange(self.ordre, self.matrice, 0, n - 1)
+            return masquer(deltas, j >= i + ecart, debut + ecart)
+        return noyau
+
+    def deltas_paires(self, mouvement, i, j):
+        """
+        Deltas des mouvements (i[k], j[k]) ("echange" ou "2opt", i < j), calculés d'un
+        coup (un par un pour le 2-opt asymétrique). Ne compte pas les évaluations.
+        """
+        i, j = np.asarray(i), np.asarray(j)
+        if not self._vectorisable(mouvement):
+            operateur = self.operateur(mouvement)
+            return np.array([operateur.delta(self.ordre, self.matrice, move) for move in zip(i.tolist(), j.tolist())])
+        if len(i) == 0:
+            return np.zeros(0)
+        deltas = self._deltas_vectorises(np.asarray(self.ordre), mouvement, i, j)
+        if mouvement == "echange":
+            # Positions adjacentes (directement ou par le bouclage) : calcul exact
+            for k in np.flatnonzero((j - i == 1) | (j - i == len(self.ordre) - 1)).tolist():
+                deltas[k] = delta_echange(self.ordre, self.matrice, int(i[k]), int(j[k]))
+        return deltas
+
+    def paires_proches(self, mouvement, k):
+        """
+        Mouvements (i, j), i < j, qui rendent chaque ville a voisine dans la tournée de
+        l'une de ses k plus proches villes c (distances.listes_voisins, calculées une
+        fois) : "echange" place c juste avant ou juste après a, "2opt" crée l'arête
+        (a, c). Retourne (i, j), éventuellement avec doublons, ou None pour l'Or-opt.
+        """
+        if mouvement == "oropt":
+            return None
+        if self._voisins is None or self._voisins.shape[1] != min(k, len(self.ordre) - 1):
+            self._voisins = np.asarray(listes_voisins(self.matrice, k), dtype=np.intp)
+        n, k = self._voisins.shape
+        position = np.empty(n, dtype=np.intp)
+        position[self.ordre] = np.arange(n)
+        pa, pc = np.repeat(position, k), position[self._voisins.ravel()]
+        if mouvement == "echange":
+            # c échangée avec le prédécesseur ou le successeur de a
+            i, j = np.concatenate(((pa - 1) % n, (pa + 1) % n)), np.concatenate((pc, pc))
+        else:
+            # Arête (a, c) créée par le 2-opt (min, max) ou par celui décalé d'un cran vers la gauche
+            i, j = np.minimum(pa, pc), np.maximum(pa, pc)
+            i, j = np.concatenate((i, i - 1)), np.concatenate((j, j - 1))
+        i, j = np.minimum(i, j), np.maximum(i, j)
+        valides = (j - i >= (2 if mouvement == "2opt" else 1)) & (i >= 0)
+        return i[valides], j[valides]
+
+    def appliquer(self, mouvement, move, delta=None):
+        """
+        Applique le mouvement sur place ; delta (s'il est déjà calculé) évite de le réévaluer.
+        """
+        operateur = self.operateur(mouvement)
+        if delta is None:
+            delta = operateur.delta(self.ordre, self.matrice, move)
+        operateur.appliquer(self.ordre, move)
+        self.cout += delta
@@ -0,0 +1,111 @@
+import math
+import multiprocessing
+import os
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from .recuit import recuit_simule
+
+# --- Recuit simulé multi-départs ---
+# Des centaines de chaînes indépendantes (départs aléatoires × configurations de
+# température) sont réparties sur un pool de processus. Chaque chaîne reçoit sa
+# propre graine, dérivée d'une graine maître par numpy.random.SeedSequence :
+# les résultats sont reproductibles quel que soit le nombre de processus.
+# Les chaînes sont envoyées par lots et la matrice n'est transmise qu'une fois
+# par processus, pour que le coût de démarrage ne domine pas les chaînes courtes.
+
+# Données partagées par toutes les chaînes d'un processus de travail
+_matrice = None
+_arret = None
+
+
+def _initialiser(matrice, arret):
+    global _matrice, _arret
+    _matrice, _arret = matrice, arret
+
+
+def _executer_lot(lot, distance_cible):
+    """
+    Exécute un lot de chaînes dans le processus courant. Le lot s'interrompt si
+    une chaîne (de n'importe quel processus) a atteint la distance cible.
+    """
+    resultats = []
+    for indice, configuration, graine in lot:
+        if _arret.is_set():
+            break
+        random.seed(graine)
+        trace = []
+        solution, distance = recuit_simule(_matrice, **configuration, trace=trace, distance_cible=distance_cible)
+        resultats.append({
+            "chaine": indice,
+            "configuration": configuration,
+            "graine": graine,
+            "solution": solution,
+            "distance": distance,
+            "trace": trace,
+        })
+        if distance_cible is not None and distance <= distance_cible:
+            _arret.set()
+    return resultats
+
+
+def graines_independantes(graine, nombre):
+    """
+    `nombre` graines entières indépendantes dérivées de la graine maître.
+    """
+    return [int(s.generate_state(1, np.uint64)[0]) for s in np.random.SeedSequence(graine).spawn(nombre)]
+
+
+def recuit_multi_departs(matrice_distances, configurations, nb_departs=1, graine=None, distance_cible=None,
+                         nb_processus=None, taille_lot=None):
+    """
+    Lance nb_departs chaînes de recuit_simule pour chaque configuration et
+    retourne (meilleure_solution, meilleure_distance, resultats).
+
+    - configurations : liste de dicts d'arguments de recuit_simule, ex:
+      {"temperature_initiale": 1000, "taux_refroidissement": 0.995, "iterations_max": 1000}
+      (la clé "mouvement" est facultative)
+    - distance_cible : arrêt anticipé de toutes les chaînes dès qu'elle est atteinte
+    - nb_processus : taille du pool (None = nombre de cœurs, 1 = exécution séquentielle)
+    - taille_lot : nombre de chaînes envoyées à la fois à un processus
+      (par défaut environ quatre lots par processus)
+
+    resultats contient, pour chaque chaîne exécutée, sa configuration, sa graine,
+    sa meilleure solution et sa trace [(iteration, meilleure_distance), ...].
+    """
+    chaines = [configuration for configuration in configurations for _ in range(nb_departs)]
+    graines = graines_independantes(graine, len(chaines))
+    taches = list(zip(range(len(chaines)), chaines, graines))
+
+    if nb_processus is None:
+        nb_processus = os.cpu_count() or 1
+    if taille_lot is None:
+        taille_lot = max(1, math.ceil(len(taches) / (4 * nb_processus)))
+    lots = [taches[k:k + taille_lot] for k in range(0, len(taches), taille_lot)]
+
+    resultats = []
+    if nb_processus == 1:
+        _initialiser(matrice_distances, threading.Event())
+        for lot in lots:
+            resultats += _executer_lot(lot, distance_cible)
+    else:
+        arret = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=nb_processus, initializer=_initialiser,
+                                 initargs=(matrice_distances, arret)) as executeur:
+            en_cours = {executeur.submit(_executer_lot, lot, distance_cible) for lot in lots}
+            while en_cours:
+                termines, en_cours = wait(en_cours, return_when=FIRST_COMPLETED)
+                for futur in termines:
+                    resultats += futur.result()
+                # Cible atteinte : les lots non démarrés sont annulés
+                if arret.is_set():
+                    for futur in en_cours:
+                        futur.cancel()
+                    en_cours = {futur for futur in en_cours if not futur.cancelled()}
+
+    resultats.sort(key=lambda resultat: resultat["chaine"])
+    meilleur = min(resultats, key=lambda resultat: resultat["distance"])
+    return meilleur["solution"], meilleur["distance"], resultats
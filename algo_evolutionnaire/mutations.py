@@ -0,0 +1,118 @@
+import numpy as np
+
+from .selection import generateur_numpy
+
+# --- Mutations par lots ---
+# genetique.mutation mute un enfant à la fois (au plus un échange, un appel
+# Python par enfant). Ici, une mutation s'applique en place à tout un tableau
+# d'enfants (une ligne par enfant), avec des tirages vectorisés :
+# - "echange" : deux gènes échangés
+# - "insertion" : un gène déplacé à une autre position
+# - "inversion" : segment [i, j] renversé (2-opt)
+# - "melange" : segment [i, j] permuté aléatoirement
+# taux : probabilité de muter chaque enfant, un nombre ou un tableau d'un taux par
+# enfant (voir TauxAdaptatif). Seules les lignes du tableau passé sont modifiées :
+# les moteurs n'y mettent que les enfants, jamais les élites.
+#
+#     mutation_lot("inversion", enfants, 0.2, rng)
+
+
+def _lignes_mutees(enfants, taux, rng):
+    return np.flatnonzero(rng.random(len(enfants)) < taux)
+
+
+def _positions(rng, nb, n):
+    # Deux positions distinctes par ligne mutée, dans un ordre quelconque
+    a = rng.integers(0, n, nb)
+    return a, (a + rng.integers(1, n, nb)) % n
+
+
+def _segments(rng, enfants, taux):
+    """
+    Tire les lignes mutées et, pour chacune, deux positions distinctes a et b. Pour
+    tous les gènes des segments [min(a, b), max(a, b)] mis bout à bout, retourne :
+    le numéro du segment, a < b, la ligne, la position, le décalage dans le segment,
+    la longueur du segment et son début.
+    """
+    lignes = _lignes_mutees(enfants, taux, rng)
+    a, b = _positions(rng, len(lignes), enfants.shape[1])
+    i, longueurs = np.minimum(a, b), np.abs(a - b) + 1
+    rangs = np.repeat(np.arange(len(lignes)), longueurs)
+    decalages = np.arange(len(rangs)) - np.repeat(np.cumsum(longueurs) - longueurs, longueurs)
+    return rangs, (a < b)[rangs], lignes[rangs], i[rangs] + decalages, decalages, longueurs[rangs], i[rangs]
+
+
+def muter_echange_lot(enfants, taux, rng):
+    lignes = _lignes_mutees(enfants, taux, rng)
+    i, j = _positions(rng, len(lignes), enfants.shape[1])
+    enfants[lignes, i], enfants[lignes, j] = enfants[lignes, j], enfants[lignes, i]
+    return enfants
+
+
+def muter_insertion_lot(enfants, taux, rng):
+    # Gène déplacé de a vers b : rotation d'un cran du segment [min(a, b), max(a, b)]
+    _, vers_la_droite, lignes, positions, decalages, longueurs, debuts = _segments(rng, enfants, taux)
+    source = debuts + (decalages + np.where(vers_la_droite, 1, -1)) % longueurs
+    enfants[lignes, positions] = enfants[lignes, source]
+    return enfants
+
+
+def muter_inversion_lot(enfants, taux, rng):
+    _, _, lignes, positions, decalages, longueurs, debuts = _segments(rng, enfants, taux)
+    enfants[lignes, positions] = enfants[lignes, debuts + longueurs - 1 - decalages]
+    return enfants
+
+
+def muter_melange_lot(enfants, taux, rng):
+    # Tri par (ligne, clé aléatoire) : chaque segment est permuté sans sortir de sa ligne
+    rangs, _, lignes, positions, _, _, _ = _segments(rng, enfants, taux)
+    ordre = np.argsort(rangs + rng.random(len(rangs)))
+    enfants[lignes, positions] = enfants[lignes, positions[ordre]]
+    return enfants
+
+
+MUTATIONS = {
+    "echange": muter_echange_lot,
+    "insertion": muter_insertion_lot,
+    "inversion": muter_inversion_lot,
+    "melange": muter_melange_lot,
+}
+
+
+def verifier_mutation(operateur):
+    if operateur not in MUTATIONS:
+        raise ValueError(f"Mutation non reconnue. Choisissez parmi {', '.join(MUTATIONS)}.")
+
+
+def mutation_lot(operateur, enfants, taux, rng=None):
+    """
+    Mute en place les lignes du tableau 2-D `enfants` avec l'opérateur `operateur`
+    de MUTATIONS, chacune avec la probabilité `taux` (nombre ou tableau). Retourne `enfants`.
+    """
+    verifier_mutation(operateur)
+    return MUTATIONS[operateur](enfants, taux, generateur_numpy() if rng is None else rng)
+
+
+# --- Taux adaptatifs ---
+
+class TauxAdaptatif:
+    """
+    Taux de mutation par enfant d'après le coût de son meilleur parent (schéma de
+    Srinivas et Patnaik, en minimisation) : de taux_min pour le meilleur coût de la
+    population à taux_max pour le coût moyen, taux_max au-delà. Les bons individus
+    sont préservés, les mauvais explorent. S'utilise comme taux_mutation des AG.
+    """
+
+    def __init__(self, taux_min=0.01, taux_max=0.5):
+        if not 0 <= taux_min <= taux_max <= 1:
+            raise ValueError("Il faut 0 <= taux_min <= taux_max <= 1.")
+        self.taux_min = taux_min
+        self.taux_max = taux_max
+
+    def __call__(self, couts_parents, couts):
+        # couts_parents : meilleur coût des parents de chaque enfant ; couts : coûts de la population
+        minimum, moyenne = couts.min(), couts.mean()
+        if moyenne <= minimum:  # Population de coûts identiques : diversifier
+            return np.full(len(couts_parents), self.taux_max)
+        relatif = np.clip((couts_parents - minimum) / (moyenne - minimum), 0.0, 1.0)
+        return self.taux_min + (self.taux_max - self.taux_min) * relatif
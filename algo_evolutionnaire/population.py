@@ -0,0 +1,92 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# --- Population en mémoire partagée ---
+# Une population de permutations est un seul tableau d'entiers contigu (int16
+# jusqu'à 32 767 gènes, int32 au-delà) au lieu d'une liste de listes Python.
+# PopulationPartagee en garde deux générations dans un même segment de mémoire
+# partagée : la génération suivante est écrite pendant que la courante est lue,
+# puis echanger() inverse leurs rôles sans copie. Sérialisée par le nom du
+# segment, elle est transmise aux processus de travail qui lisent et écrivent
+# directement leurs tranches de lignes : aucun individu n'est sérialisé.
+#
+#     with PopulationPartagee(10**6, 1000) as population:   # 2 x 2 Go en int16
+#         population.courante[:] = ...
+#         population.suivante[debut:fin] = ...              # dans n'importe quel processus
+#         population.echanger()
+
+OCTETS_ENTETE = 64  # Entête du segment : indice de la génération courante (aligné sur 64 octets)
+
+
+def type_genes(n):
+    """
+    Plus petit type entier signé contenant les gènes 0..n-1.
+    """
+    return np.int16 if n <= np.iinfo(np.int16).max + 1 else np.int32
+
+
+def _attacher(nom, taille, n, type_gene):
+    return PopulationPartagee(taille, n, type_gene, nom=nom)
+
+
+class PopulationPartagee:
+    """
+    Deux générations de `taille` individus de `n` gènes en mémoire partagée.
+    nom : segment existant auquel s'attacher (sinon un segment est créé, et
+    supprimé par fermer() dans le processus qui l'a créé).
+    """
+
+    def __init__(self, taille, n, type_gene=None, nom=None):
+        self.taille, self.n = taille, n
+        self.type_gene = np.dtype(type_gene or type_genes(n))
+        self.proprietaire = nom is None
+        if self.proprietaire:
+            octets = OCTETS_ENTETE + 2 * taille * n * self.type_gene.itemsize
+            self._segment = shared_memory.SharedMemory(create=True, size=octets)
+        else:
+            self._segment = shared_memory.SharedMemory(name=nom)
+        self._indice = np.ndarray(1, dtype=np.int64, buffer=self._segment.buf)
+        self._tampons = np.ndarray((2, taille, n), dtype=self.type_gene, buffer=self._segment.buf,
+                                   offset=OCTETS_ENTETE)
+        if self.proprietaire:
+            self._indice[0] = 0
+
+    @property
+    def nom(self):
+        return self._segment.name
+
+    @property
+    def courante(self):
+        return self._tampons[self._indice[0]]
+
+    @property
+    def suivante(self):
+        return self._tampons[1 - self._indice[0]]
+
+    @property
+    def nbytes(self):
+        return self._tampons.nbytes
+
+    def echanger(self):
+        # La génération suivante devient la courante (vu par tous les processus attachés)
+        self._indice[0] = 1 - self._indice[0]
+
+    def charger(self, population):
+        self.courante[:] = population
+
+    def __reduce__(self):
+        return _attacher, (self.nom, self.taille, self.n, self.type_gene.str)
+
+    def fermer(self):
+        # Les vues NumPy sont libérées avant le segment
+        del self._indice, self._tampons
+        self._segment.close()
+        if self.proprietaire:
+            self._segment.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
@@ -0,0 +1,113 @@
+from typing import Protocol
+
+from .evaluation_TSP import calculer_distance_totale, evaluer_population, matrice_en_tableau
+from .evaluation_ordonnancement import (EvaluateurFlowTime, EvaluateurTWT, calculer_cout_ordonnancement,
+                                        calculer_twt, evaluer_population_flowtime, evaluer_population_twt)
+from .mouvements_TSP import EvaluateurTSP
+
+# --- Problèmes de permutation ---
+# Un problème fournit les trois formes d'évaluation dont les solveurs ont
+# besoin : coût d'une solution, coûts d'une population (tableau 2-D, vectorisé)
+# et évaluateur incrémental pour le recuit et la recherche tabou. Il compte
+# les évaluations effectuées (nb_evaluations), y compris celles faites par delta.
+
+
+class Probleme(Protocol):
+    nom: str
+    taille: int
+    nb_evaluations: int
+    MOUVEMENTS: tuple
+
+    def cout(self, solution): ...
+
+    def evaluer_population(self, population): ...
+
+    def evaluateur(self, ordre=None): ...
+
+
+class ProblemeTSP:
+    """
+    Voyageur de commerce : minimiser la longueur de la tournée (retour au départ inclus).
+    """
+
+    MOUVEMENTS = EvaluateurTSP.MOUVEMENTS
+
+    def __init__(self, matrice_distances, nom="tsp"):
+        self.nom = nom
+        self.matrice = matrice_distances
+        self.taille = len(matrice_distances)
+        self.nb_evaluations = 0
+        self._tableau = None  # Copie NumPy de la matrice, construite au premier besoin
+
+    def cout(self, solution):
+        self.nb_evaluations += 1
+        return calculer_distance_totale(solution, self.matrice)
+
+    def evaluer_population(self, population):
+        if self._tableau is None:
+            self._tableau = matrice_en_tableau(self.matrice)
+        self.nb_evaluations += len(population)
+        return evaluer_population(population, self._tableau)
+
+    def evaluateur(self, ordre=None):
+        return EvaluateurTSP(self.matrice, ordre)
+
+
+class ProblemeFlowTime:
+    """
+    Ordonnancement sur une machine : minimiser la somme des temps d'achèvement.
+    """
+
+    MOUVEMENTS = EvaluateurFlowTime.MOUVEMENTS
+
+    def __init__(self, durees, nom="flowtime"):
+        self.nom = nom
+        self.durees = list(durees)
+        self.taille = len(self.durees)
+        self.nb_evaluations = 0
+
+    def cout(self, solution):
+        self.nb_evaluations += 1
+        return calculer_cout_ordonnancement(solution, self.durees)
+
+    def evaluer_population(self, population):
+        self.nb_evaluations += len(population)
+        return evaluer_population_flowtime(population, self.durees)
+
+    def evaluateur(self, ordre=None):
+        return EvaluateurFlowTime(range(self.taille) if ordre is None else ordre, self.durees)
+
+
+class ProblemeTWT:
+    """
+    Ordonnancement sur une machine : minimiser le retard pondéré total
+    (p : temps de traitement, d : dates de livraison, w : poids).
+    """
+
+    MOUVEMENTS = EvaluateurTWT.MOUVEMENTS
+
+    def __init__(self, p, d, w, nom="twt"):
+        self.nom = nom
+        self.p, self.d, self.w = list(p), list(d), list(w)
+        self.taches = list(zip(self.p, self.d, self.w))
+        self.taille = len(self.p)
+        self.nb_evaluations = 0
+
+    @classmethod
+    def depuis_taches(cls, taches, nom="twt"):
+        """
+        Construit le problème depuis une liste de tuples (p_j, d_j, w_j).
+        """
+        p, d, w = zip(*taches)
+        return cls(p, d, w, nom)
+
+    def cout(self, solution):
+        self.nb_evaluations += 1
+        return calculer_twt(solution, self.taches)
+
+    def evaluer_population(self, population):
+        self.nb_evaluations += len(population)
+        return evaluer_population_twt(population, self.p, self.d, self.w)
+
+    def evaluateur(self, ordre=None):
+        return EvaluateurTWT(self.p, self.d, self.w, ordre)
@@ -0,0 +1,166 @@
+from collections import deque
+from functools import partial
+
+from .distances import listes_voisins
+from .mouvements_TSP import est_symetrique
+
+# --- Recherche locale 2-opt / Or-opt avec listes de voisins ---
+# Pour chaque ville, seuls ses k plus proches voisins sont envisagés comme
+# nouvelle extrémité d'arête, et des « don't-look bits » (une file des villes
+# à réexaminer) évitent de reparcourir les villes dont l'entourage n'a pas
+# changé. Chaque mouvement est évalué en O(1) à partir des arêtes modifiées.
+# Les listes de voisins sont calculées par distances.listes_voisins.
+
+
+def _rotation(tour, position, debut, longueur, decalage):
+    """
+    Fait tourner de `decalage` cases le bloc cyclique tour[debut..debut+longueur-1]
+    et met à jour les positions des villes déplacées.
+    """
+    n = len(tour)
+    indices = [(debut + k) % n for k in range(longueur)]
+    villes = [tour[k] for k in indices]
+    villes = villes[decalage:] + villes[:decalage]
+    for k, ville in zip(indices, villes):
+        tour[k] = ville
+        position[ville] = k
+
+
+def _inverser(tour, position, debut, fin):
+    """
+    Inverse le bloc cyclique tour[debut..fin] et met à jour les positions.
+    """
+    n = len(tour)
+    longueur = (fin - debut) % n + 1
+    for k in range(longueur // 2):
+        p, q = (debut + k) % n, (fin - k) % n
+        tour[p], tour[q] = tour[q], tour[p]
+        position[tour[p]] = p
+        position[tour[q]] = q
+
+
+def _cout_inversion(tour, matrice, debut, fin):
+    """
+    Variation des arêtes internes du bloc cyclique tour[debut..fin] lorsqu'on
+    l'inverse (utile seulement pour une matrice asymétrique).
+    """
+    n = len(tour)
+    delta = 0
+    for k in range((fin - debut) % n):
+        u, v = tour[(debut + k) % n], tour[(debut + k + 1) % n]
+        delta += matrice[v][u] - matrice[u][v]
+    return delta
+
+
+def _essayer_2opt(tour, position, matrice, voisins, a, symetrique):
+    """
+    Cherche un 2-opt améliorant qui crée l'arête (a, c), c parmi les voisins de a.
+    Applique le premier trouvé et retourne les villes touchées (ou None).
+    """
+    n = len(tour)
+    i = position[a]
+    for sens in (1, -1):
+        b = tour[(i + sens) % n]
+        ab = matrice[a][b] if sens == 1 else matrice[b][a]
+        for c in voisins[a]:
+            ac = matrice[a][c] if sens == 1 else matrice[c][a]
+            if symetrique and ac >= ab:
+                break  # Les voisins suivants sont plus éloignés : aucun gain possible
+            j = position[c]
+            d = tour[(j + sens) % n]
+            if c == b or d == a:
+                continue
+            if sens == 1:
+                # ... a b ... c d ...  ->  ... a c ... b d ...  (inversion de b..c)
+                debut, fin = (i + 1) % n, j
+                delta = ac + matrice[b][d] - ab - matrice[c][d]
+            else:
+                # ... d c ... b a ...  ->  ... d b ... c a ...  (inversion de c..b)
+                debut, fin = j, (i - 1) % n
+                delta = ac + matrice[d][b] - ab - matrice[d][c]
+            if not symetrique:
+                delta += _cout_inversion(tour, matrice, debut, fin)
+            if delta < 0:
+                # Matrice symétrique : on inverse le plus court des deux côtés
+                if symetrique and (fin - debut) % n > n // 2:
+                    debut, fin = (fin + 1) % n, (debut - 1) % n
+                _inverser(tour, position, debut, fin)
+                return (a, b, c, d)
+    return None
+
+
+def _essayer_or_opt(tour, position, matrice, voisins, a, longueur_max):
+    """
+    Cherche un déplacement améliorant du segment de 1 à longueur_max villes qui
+    commence en a, réinséré à côté d'une voisine de ses extrémités.
+    Applique le premier trouvé et retourne les villes touchées (ou None).
+    """
+    n = len(tour)
+    i = position[a]
+    for longueur in range(1, min(longueur_max, n - 3) + 1):
+        s0, s1 = a, tour[(i + longueur - 1) % n]
+        p, nx = tour[(i - 1) % n], tour[(i + longueur) % n]
+        gain_retrait = matrice[p][s0] + matrice[s1][nx] - matrice[p][nx]
+        segment = {tour[(i + k) % n] for k in range(longueur)}
+
+        # Insertion entre u et v (u -> s0 ... s1 -> v), u voisine de s0 ou v voisine de s1
+        candidats = [(c, tour[(position[c] + 1) % n]) for c in voisins[s0]]
+        candidats += [(tour[(position[c] - 1) % n], c) for c in voisins[s1]]
+        for u, v in candidats:
+            if u in segment or v in segment or u == p:
+                continue
+            delta = matrice[u][s0] + matrice[s1][v] - matrice[u][v] - gain_retrait
+            if delta < 0:
+                # Bloc [segment, nx..u] -> [nx..u, segment], ou bloc [v..p, segment]
+                # -> [segment, v..p] : on fait tourner le plus court des deux
+                avant = (position[u] - (i + longueur) + 1) % n
+                apres = (i - position[v]) % n
+                if avant <= apres:
+                    _rotation(tour, position, i, longueur + avant, longueur)
+                else:
+                    _rotation(tour, position, position[v], apres + longueur, apres)
+                return (p, nx, s0, s1, u, v)
+    return None
+
+
+def recherche_locale(chemin, matrice, voisins, or_opt=True, longueur_max_or_opt=3, symetrique=None):
+    """
+    Améliore une tournée par 2-opt et Or-opt jusqu'à un optimum local
+    (première amélioration, listes de voisins et don't-look bits).
+    Retourne une nouvelle tournée ; le chemin fourni n'est pas modifié.
+    """
+    n = len(chemin)
+    tour = list(chemin)
+    if n < 5:
+        return tour
+    if symetrique is None:
+        symetrique = est_symetrique(matrice)
+    position = [0] * n
+    for k, ville in enumerate(tour):
+        position[ville] = k
+
+    # Don't-look bits : seules les villes présentes dans la file sont examinées
+    file = deque(tour)
+    dans_file = [True] * n
+    while file:
+        a = file.popleft()
+        dans_file[a] = False
+        touchees = _essayer_2opt(tour, position, matrice, voisins, a, symetrique)
+        if touchees is None and or_opt:
+            touchees = _essayer_or_opt(tour, position, matrice, voisins, a, longueur_max_or_opt)
+        if touchees is not None:
+            for ville in (a,) + touchees:
+                if not dans_file[ville]:
+                    dans_file[ville] = True
+                    file.append(ville)
+    return tour
+
+
+def operateur_memetique(matrice, k=10, or_opt=True):
+    """
+    Prépare l'étape d'amélioration d'un algorithme mémétique : la fonction
+    retournée applique recherche_locale à un enfant. Les listes de voisins et la
+    symétrie de la matrice ne sont calculées qu'une fois.
+    """
+    return partial(recherche_locale, matrice=matrice, voisins=listes_voisins(matrice, k),
+                   or_opt=or_opt, symetrique=est_symetrique(matrice))
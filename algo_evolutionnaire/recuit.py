@@ -0,0 +1,205 @@
+import math
+import random
+import time
+
+import numpy as np
+
+from .arret import PERIODE_ARRET
+from .evaluation_ordonnancement import EvaluateurTWT
+from .mouvements_TSP import EvaluateurTSP
+from .refroidissement import SEUIL_EXP, Geometrique, calibrer_temperatures, obtenir_refroidissement
+from .reprise import entiers_compacts, etat_evaluateur, restaurer_evaluateur
+from .telemetrie import emettre, periode_observation
+
+# --- Recuit simulé ---
+# Le recuit ne manipule qu'un évaluateur incrémental (EvaluateurTSP,
+# EvaluateurFlowTime ou EvaluateurTWT) : chaque voisin est évalué par delta et
+# le mouvement accepté est appliqué sur place, sans copier la solution.
+
+
+def verifier_mouvement(evaluateur, mouvement):
+    if mouvement not in evaluateur.MOUVEMENTS:
+        raise ValueError(f"Mouvement non reconnu. Choisissez parmi {', '.join(evaluateur.MOUVEMENTS)}.")
+
+
+def _prochaine_borne(faites, periode):
+    # Plus petit multiple de `periode` strictement supérieur à `faites`
+    return (faites // periode + 1) * periode
+
+
+def recuit_simule_generique(evaluateur, temperature_initiale, taux_refroidissement, iterations_max,
+                            mouvement="echange", trace=None, cout_cible=None, observateur=None, reprise=None,
+                            arret=None, refroidissement=None, solution_initiale=None):
+    """
+    Recuit simulé depuis `solution_initiale` (par exemple construction.construire), ou un ordre aléatoire.
+    - temperature_initiale : nombre, ou "auto" pour la calibrer sur un échantillon de deltas
+      (voir refroidissement.calibrer_temperatures)
+    - refroidissement : schéma (objet ou nom de refroidissement.REFROIDISSEMENTS) ; par défaut
+      géométrique de taux `taux_refroidissement` (nombre, ou "auto" pour atteindre la
+      température finale à la dernière itération)
+    - trace : liste optionnelle complétée par (iteration, meilleur_cout) à chaque amélioration
+    - cout_cible : arrêt anticipé dès que le meilleur coût l'atteint
+    - observateur : reçoit un événement toutes les `observateur.periode` itérations (voir telemetrie.py)
+    - reprise : PointReprise optionnel (reprise.py), sauvegardé toutes les `reprise.periode` itérations ;
+      le recuit repart du dernier point sauvegardé s'il existe
+    - arret : Arret optionnel (arret.py), vérifié toutes les PERIODE_ARRET itérations ; un
+      redémarrage repart de la meilleure solution perturbée, à la température courante
+    Retourne (meilleure_solution, meilleur_cout).
+    """
+    verifier_mouvement(evaluateur, mouvement)
+    if refroidissement is None:
+        refroidissement = Geometrique(None if taux_refroidissement == "auto" else taux_refroidissement)
+    schema = obtenir_refroidissement(refroidissement)
+    etat = reprise.charger("recuit") if reprise is not None else None
+    if arret is not None:
+        arret.demarrer(evaluateur.nb_evaluations, etat)
+        if arret.cout_cible is not None:
+            cout_cible = arret.cout_cible if cout_cible is None else max(cout_cible, arret.cout_cible)
+    if etat is None:
+        if solution_initiale is None:
+            solution_initiale = list(range(len(evaluateur.ordre)))
+            random.shuffle(solution_initiale)
+        evaluateur.definir_ordre(solution_initiale)
+        meilleure_solution, meilleur_cout = evaluateur.ordre[:], evaluateur.cout
+        temperature_finale = None
+        if temperature_initiale == "auto" or schema.requiert_temperature_finale:
+            temperature_auto, temperature_finale = calibrer_temperatures(evaluateur, mouvement)
+            if temperature_initiale == "auto":
+                temperature_initiale = temperature_auto
+            temperature_finale = min(temperature_finale, temperature_initiale)
+        schema.initialiser(temperature_initiale, temperature_finale, iterations_max)
+        temperature, facteur = schema.ajuster(0, temperature_initiale, None)
+        faites, acceptes = 0, 0
+        if trace is not None:
+            trace.append((0, meilleur_cout))
+    else:
+        restaurer_evaluateur(evaluateur, etat)
+        meilleure_solution, meilleur_cout = etat["meilleure_solution"].tolist(), etat["meilleur_cout"].item()
+        temperature, faites = etat["temperature"].item(), etat["iteration"].item()
+        temperature_finale = etat["temperature_finale"].item()
+        if math.isnan(temperature_finale):
+            temperature_finale = None
+        schema.initialiser(etat["temperature_initiale"].item(), temperature_finale, iterations_max)
+        schema.restaurer(etat)
+        facteur, acceptes = etat["facteur"].item(), etat["acceptes_palier"].item()
+
+    tirer, evaluer, appliquer = evaluateur.tirer, evaluateur.delta, evaluateur.appliquer
+    exp, aleatoire = math.exp, random.random
+
+    # Les itérations sont parcourues par blocs qui s'arrêtent aux bornes des périodes
+    # d'observation, de sauvegarde, de vérification des critères d'arrêt et des paliers
+    # du schéma de refroidissement (un seul bloc sans aucune d'elles) : la boucle
+    # interne reste sans test supplémentaire.
+    periode = periode_observation(observateur, iterations_max)
+    periode_reprise = reprise.periode if reprise is not None else iterations_max
+    periode_arret = PERIODE_ARRET if arret is not None else iterations_max
+    palier = schema.palier or iterations_max
+    derniere_amelioration = arret.derniere_amelioration if arret is not None else faites
+    debut_fenetre, debut, termine = faites, time.perf_counter(), False
+    acceptes_fenetre, acceptes_palier = acceptes, 0  # Valeurs de `acceptes` au début de la fenêtre et du palier
+    while faites < iterations_max and not termine:
+        fin_bloc = min(_prochaine_borne(faites, periode), _prochaine_borne(faites, periode_reprise),
+                       _prochaine_borne(faites, periode_arret), _prochaine_borne(faites, palier), iterations_max)
+
+        for iteration in range(faites + 1, fin_bloc + 1):
+            if cout_cible is not None and meilleur_cout <= cout_cible:
+                termine = True
+                break
+
+            move = tirer(mouvement)
+            delta = evaluer(mouvement, move)
+
+            # Critère d'acceptation (Metropolis), sans exponentielle pour les dégradations
+            # trop fortes pour être acceptées (voir refroidissement.SEUIL_EXP)
+            if delta < 0 or (delta < SEUIL_EXP * temperature and aleatoire() < exp(-delta / temperature)):
+                appliquer(mouvement, move, delta)
+                acceptes += 1
+
+                if evaluateur.cout < meilleur_cout:
+                    meilleure_solution, meilleur_cout = evaluateur.ordre[:], evaluateur.cout
+                    derniere_amelioration = iteration
+                    if trace is not None:
+                        trace.append((iteration, meilleur_cout))
+
+            temperature *= facteur
+        faites = iteration - 1 if termine else fin_bloc
+
+        if not termine and schema.palier is not None and faites % palier == 0:
+            temperature, facteur = schema.ajuster(faites, temperature, (acceptes - acceptes_palier) / palier)
+            acceptes_palier = acceptes
+        # Critères d'arrêt et redémarrages aux seuls multiples de PERIODE_ARRET (et en fin d'exécution) :
+        # les autres bornes de bloc (observation, reprise, palier) ne changent pas le résultat.
+        # La dernière amélioration est notée à chaque bloc, pour les points de reprise
+        verifier_arret = arret is not None and (termine or faites % PERIODE_ARRET == 0 or faites == iterations_max)
+        if arret is not None:
+            arret.ameliore(derniere_amelioration)
+        if verifier_arret:
+            termine = arret.atteint(faites, meilleur_cout, evaluateur.nb_evaluations) or termine
+        if observateur is not None and faites > debut_fenetre and (
+                termine or faites % periode == 0 or faites == iterations_max):
+            emettre(observateur, {"solveur": "recuit", "iteration": faites, "meilleur_cout": meilleur_cout,
+                                  "cout_courant": evaluateur.cout, "temperature": temperature,
+                                  "taux_acceptation": (acceptes - acceptes_fenetre) / (faites - debut_fenetre),
+                                  "duree": time.perf_counter() - debut}, meilleure_solution)
+            debut_fenetre, acceptes_fenetre, debut = faites, acceptes, time.perf_counter()
+        if verifier_arret and not termine and arret.redemarrer(faites):
+            evaluateur.definir_ordre(arret.redemarrage.perturber(meilleure_solution))
+        if reprise is not None and not termine and faites % periode_reprise == 0:
+            reprise.sauvegarder("recuit", faites, **etat_evaluateur(evaluateur),
+                                meilleure_solution=entiers_compacts(meilleure_solution),
+                                meilleur_cout=np.asarray(meilleur_cout), temperature=np.float64(temperature),
+                                temperature_initiale=np.float64(schema.temperature_initiale),
+                                temperature_finale=np.float64(
+                                    math.nan if temperature_finale is None else temperature_finale),
+                                facteur=np.float64(facteur), acceptes_palier=np.int64(acceptes - acceptes_palier),
+                                **schema.etat(),
+                                **(arret.etat(evaluateur.nb_evaluations) if arret is not None else {}))
+
+    return meilleure_solution, meilleur_cout
+
+
+def palier_metropolis(evaluateur, solution, temperature, nb_pas, mouvement="echange"):
+    """
+    Chaîne de Metropolis à température fixe (une réplique de l'échange de répliques).
+    Part de `solution` (ou d'un ordre aléatoire si None) et retourne
+    (solution, cout, meilleure_solution, meilleur_cout, nb_acceptes).
+    """
+    verifier_mouvement(evaluateur, mouvement)
+    if solution is None:
+        solution = list(range(len(evaluateur.ordre)))
+        random.shuffle(solution)
+    evaluateur.definir_ordre(solution)
+    meilleure_solution, meilleur_cout = evaluateur.ordre[:], evaluateur.cout
+    nb_acceptes = 0
+    tirer, evaluer, appliquer = evaluateur.tirer, evaluateur.delta, evaluateur.appliquer
+    limite = SEUIL_EXP * temperature  # Seuil précalculé : la température est fixe
+
+    for _ in range(nb_pas):
+        move = tirer(mouvement)
+        delta = evaluer(mouvement, move)
+
+        if delta < 0 or (delta < limite and random.random() < math.exp(-delta / temperature)):
+            appliquer(mouvement, move, delta)
+            nb_acceptes += 1
+
+            if evaluateur.cout < meilleur_cout:
+                meilleure_solution, meilleur_cout = evaluateur.ordre[:], evaluateur.cout
+
+    return evaluateur.ordre[:], evaluateur.cout, meilleure_solution, meilleur_cout, nb_acceptes
+
+
+# --- Points d'entrée par problème ---
+
+def recuit_simule(matrice_distances, temperature_initiale, taux_refroidissement, iterations_max, mouvement="echange",
+                  trace=None, distance_cible=None, reprise=None, arret=None, refroidissement=None):
+    # mouvement : "echange", "2opt" ou "oropt" (voir mouvements_TSP)
+    return recuit_simule_generique(EvaluateurTSP(matrice_distances), temperature_initiale, taux_refroidissement,
+                                   iterations_max, mouvement, trace, distance_cible, reprise=reprise, arret=arret,
+                                   refroidissement=refroidissement)
+
+
+def recuit_simule_ordonnancement_simple(temp_initiale, taux_refroidissement, max_iterations, taches,
+                                        refroidissement=None):
+    # taches : liste de tuples (p_j, d_j, w_j) ; minimise le TWT par échanges de tâches
+    return recuit_simule_generique(EvaluateurTWT.depuis_taches(taches), temp_initiale, taux_refroidissement,
+                                   max_iterations, refroidissement=refroidissement)
@@ -0,0 +1,202 @@
+import math
+import statistics
+
+import numpy as np
+
+# --- Schémas de refroidissement du recuit simulé ---
+# La boucle du recuit multiplie la température par un facteur à chaque
+# itération. Un schéma ne fait que recalculer ce facteur (et, au besoin, la
+# température) à la fin de chaque palier de `palier` itérations, d'après le
+# taux d'acceptation mesuré sur le palier : la boucle interne reste aussi
+# simple qu'avec le refroidissement géométrique d'origine.
+# - Geometrique(taux) : T <- taux * T
+# - LundyMees(beta) : T <- T / (1 + beta * T)
+# - Adaptatif() : la température suit un taux d'acceptation cible (schéma de Lam modifié)
+# - Rechauffage(schema) : remonte la température quand plus aucun mouvement n'est accepté
+# Sans valeur explicite, taux et beta sont calculés pour que la température
+# atteigne à la dernière itération une température finale calibrée (voir
+# calibrer_temperatures) : le budget d'itérations n'est plus gaspillé à
+# température quasi nulle.
+#
+#     RecuitSimule(temperature_initiale="auto", refroidissement="lundy_mees", iterations_max=10**6)
+
+ACCEPTATION_INITIALE = 0.8  # Probabilité d'accepter la dégradation moyenne au départ
+ACCEPTATION_FINALE = 0.01  # Probabilité d'accepter la plus petite dégradation à la fin
+TAILLE_ECHANTILLON = 1000  # Mouvements tirés pour calibrer la température initiale
+
+# Au-delà de delta = SEUIL_EXP * T, exp(-delta / T) < 2**-53 : random.random() ne
+# peut lui être inférieur que s'il vaut 0. La dégradation est alors refusée sans
+# calculer l'exponentielle (ni tirer de nombre aléatoire).
+SEUIL_EXP = 37.0
+
+
+def calibrer_temperatures(evaluateur, mouvement, echantillon=TAILLE_ECHANTILLON):
+    """
+    Températures initiale et finale estimées sur `echantillon` mouvements aléatoires
+    depuis l'ordre courant de l'évaluateur (évalués par delta, sans être appliqués) :
+    la dégradation moyenne est acceptée avec la probabilité ACCEPTATION_INITIALE à la
+    première, la plus petite dégradation avec ACCEPTATION_FINALE à la seconde.
+    """
+    deltas = (evaluateur.delta(mouvement, evaluateur.tirer(mouvement)) for _ in range(echantillon))
+    degradations = [delta for delta in deltas if delta > 0]
+    if not degradations:
+        return 1.0, 1.0
+    return (-statistics.fmean(degradations) / math.log(ACCEPTATION_INITIALE),
+            -min(degradations) / math.log(ACCEPTATION_FINALE))
+
+
+# --- Schémas ---
+
+class Refroidissement:
+    """
+    Base des schémas : initialiser(T0, Tf, iterations_max) en début d'exécution, puis
+    ajuster(iteration, temperature, taux_acceptation) -> (temperature, facteur) au
+    départ (taux_acceptation=None) et à la fin de chaque palier.
+    palier = None : facteur constant, jamais réajusté.
+    requiert_temperature_finale : Tf doit être calibrée (sinon elle peut valoir None).
+    """
+
+    palier = 100
+    requiert_temperature_finale = False
+    ETAT = ()  # Attributs sauvegardés dans les points de reprise
+
+    def initialiser(self, temperature_initiale, temperature_finale, iterations_max):
+        self.temperature_initiale = temperature_initiale
+        self.temperature_finale = temperature_finale
+        self.iterations_max = iterations_max
+
+    def ajuster(self, iteration, temperature, taux_acceptation):
+        raise NotImplementedError
+
+    def etat(self):
+        return {"refroidissement_" + nom: np.asarray(getattr(self, nom)) for nom in self.ETAT}
+
+    def restaurer(self, etat):
+        for nom in self.ETAT:
+            setattr(self, nom, etat["refroidissement_" + nom].item())
+
+
+class Geometrique(Refroidissement):
+    """
+    T <- taux * T à chaque itération (taux=None : de T0 à Tf sur l'exécution).
+    """
+
+    palier = None
+
+    def __init__(self, taux=None):
+        self.taux = taux
+        self.requiert_temperature_finale = taux is None
+
+    def initialiser(self, temperature_initiale, temperature_finale, iterations_max):
+        super().initialiser(temperature_initiale, temperature_finale, iterations_max)
+        self._taux = self.taux
+        if self._taux is None:
+            self._taux = (temperature_finale / temperature_initiale) ** (1 / iterations_max)
+
+    def ajuster(self, iteration, temperature, taux_acceptation):
+        return temperature, self._taux
+
+
+class LundyMees(Refroidissement):
+    """
+    T <- T / (1 + beta * T) à chaque itération, appliqué sous forme d'un facteur
+    constant sur chaque palier (beta=None : de T0 à Tf sur l'exécution).
+    """
+
+    def __init__(self, beta=None, palier=100):
+        self.beta = beta
+        self.palier = palier
+        self.requiert_temperature_finale = beta is None
+
+    def initialiser(self, temperature_initiale, temperature_finale, iterations_max):
+        super().initialiser(temperature_initiale, temperature_finale, iterations_max)
+        self._beta = self.beta
+        if self._beta is None:
+            self._beta = (1 / temperature_finale - 1 / temperature_initiale) / iterations_max
+
+    def ajuster(self, iteration, temperature, taux_acceptation):
+        # Sur un palier de L itérations : T_L = T / (1 + L * beta * T)
+        return temperature, (1 + self.palier * self._beta * temperature) ** (-1 / self.palier)
+
+
+def acceptation_cible(progression):
+    """
+    Taux d'acceptation visé par le schéma de Lam modifié à `progression` (0 à 1) de l'exécution :
+    décroissance de 1 à 0.44 sur les premiers 15 %, plateau jusqu'à 65 %, puis décroissance vers 0.
+    """
+    if progression < 0.15:
+        return 0.44 + 0.56 * 560 ** (-progression / 0.15)
+    if progression < 0.65:
+        return 0.44
+    return 0.44 * 440 ** (-(progression - 0.65) / 0.35)
+
+
+class Adaptatif(Refroidissement):
+    """
+    Ajuste la température à la fin de chaque palier pour rapprocher le taux
+    d'acceptation mesuré de acceptation_cible : sur le palier suivant, T est
+    multipliée par exp(gain * (cible - taux)).
+    """
+
+    def __init__(self, gain=2.0, palier=100):
+        self.gain = gain
+        self.palier = palier
+
+    def ajuster(self, iteration, temperature, taux_acceptation):
+        if taux_acceptation is None:
+            return temperature, 1.0
+        ecart = acceptation_cible(iteration / self.iterations_max) - taux_acceptation
+        return temperature, math.exp(self.gain * ecart / self.palier)
+
+
+class Rechauffage(Refroidissement):
+    """
+    Suit le schéma `schema` (géométrique par défaut) et, dès que le taux
+    d'acceptation d'un palier tombe sous `seuil`, remonte la température à
+    T0 * proportion ** k au k-ième réchauffage. Le palier est celui de `schema`
+    (1000 itérations pour un schéma à facteur constant).
+    """
+
+    ETAT = ("rechauffes",)
+
+    def __init__(self, schema=None, seuil=0.001, proportion=0.5):
+        self.schema = schema if schema is not None else Geometrique()
+        self.seuil = seuil
+        self.proportion = proportion
+        self.palier = self.schema.palier or 1000
+        self.requiert_temperature_finale = self.schema.requiert_temperature_finale
+
+    def initialiser(self, temperature_initiale, temperature_finale, iterations_max):
+        super().initialiser(temperature_initiale, temperature_finale, iterations_max)
+        self.schema.initialiser(temperature_initiale, temperature_finale, iterations_max)
+        self.rechauffes = 0
+
+    def ajuster(self, iteration, temperature, taux_acceptation):
+        if taux_acceptation is not None and taux_acceptation < self.seuil:
+            self.rechauffes += 1
+            temperature = self.temperature_initiale * self.proportion ** self.rechauffes
+        return self.schema.ajuster(iteration, temperature, taux_acceptation)
+
+    def etat(self):
+        return {**super().etat(), **self.schema.etat()}
+
+    def restaurer(self, etat):
+        super().restaurer(etat)
+        self.schema.restaurer(etat)
+
+
+REFROIDISSEMENTS = {
+    "geometrique": Geometrique,
+    "lundy_mees": LundyMees,
+    "adaptatif": Adaptatif,
+    "rechauffage": Rechauffage,
+}
+
+
+def obtenir_refroidissement(refroidissement):
+    # Nom de REFROIDISSEMENTS (schéma avec ses paramètres par défaut) ou schéma déjà construit
+    if isinstance(refroidissement, Refroidissement):
+        return refroidissement
+    if refroidissement not in REFROIDISSEMENTS:
+        raise ValueError(f"Refroidissement non reconnu. Choisissez parmi {', '.join(REFROIDISSEMENTS)}.")
+    return REFROIDISSEMENTS[refroidissement]()
@@ -0,0 +1,117 @@
+import math
+import os
+import random
+
+import numpy as np
+
+# --- Points de reprise ---
+# L'état complet d'un solveur (population et coûts, ordre courant et caches de
+# l'évaluateur, température, mémoire tabou, meilleure solution, état du
+# générateur `random`) est écrit périodiquement dans un fichier .npz non
+# compressé : les tableaux sont copiés tels quels, la population dans le plus
+# petit type entier suffisant. L'écriture passe par un fichier temporaire
+# renommé ensuite (os.replace) : un arrêt brutal laisse toujours le dernier
+# point de reprise complet. Reprendre depuis ce fichier donne exactement le
+# même résultat qu'une exécution sans interruption.
+#
+#     solveur = RecuitSimule(iterations_max=10**7, reprise=PointReprise("recuit.npz", periode=100_000))
+#     solveur.resoudre(probleme)  # relancé après un arrêt : reprend au dernier point sauvegardé
+
+
+def entiers_compacts(tableau):
+    """
+    Copie de `tableau` (entiers positifs) dans le plus petit type non signé suffisant.
+    """
+    tableau = np.asarray(tableau)
+    maximum = int(tableau.max()) if tableau.size else 0
+    for type_entier in (np.uint8, np.uint16, np.uint32):
+        if maximum <= np.iinfo(type_entier).max:
+            return tableau.astype(type_entier)
+    return tableau.astype(np.uint64)
+
+
+# --- Générateur aléatoire ---
+
+def etat_aleatoire():
+    _, interne, gauss = random.getstate()
+    return {"aleatoire": np.array(interne, dtype=np.uint32),
+            "aleatoire_gauss": np.float64(math.nan if gauss is None else gauss)}
+
+
+def restaurer_aleatoire(etat):
+    gauss = etat["aleatoire_gauss"].item()
+    random.setstate((3, tuple(etat["aleatoire"].tolist()), None if math.isnan(gauss) else gauss))
+
+
+# --- Évaluateurs incrémentaux et mémoire tabou ---
+# L'ordre et le coût courants sont sauvegardés avec les tableaux tenus à jour
+# incrémentalement (attribut CACHES de l'évaluateur) : les recalculer ne
+# redonnerait pas forcément les mêmes arrondis sur des données réelles.
+
+def etat_evaluateur(evaluateur):
+    etat = {"ordre": entiers_compacts(evaluateur.ordre), "cout": np.asarray(evaluateur.cout)}
+    for nom in getattr(evaluateur, "CACHES", ()):
+        etat["cache_" + nom] = getattr(evaluateur, nom)
+    return etat
+
+
+def restaurer_evaluateur(evaluateur, etat):
+    evaluateur.definir_ordre(etat["ordre"].tolist())
+    evaluateur.cout = etat["cout"].item()
+    for nom in getattr(evaluateur, "CACHES", ()):
+        getattr(evaluateur, nom)[:] = etat["cache_" + nom]
+
+
+def etat_memoire(memoire):
+    # Une ligne par entrée de la file : composantes de l'attribut puis expiration
+    entrees = [(*attribut, expiration) for attribut, expiration in memoire.entrees()]
+    return {"tabou_iteration": np.int64(memoire.iteration),
+            "tabou_entrees": np.array(entrees, dtype=np.int64).reshape(len(entrees), -1)}
+
+
+def restaurer_memoire(memoire, etat):
+    entrees = [(tuple(ligne[:-1]), ligne[-1]) for ligne in etat["tabou_entrees"].tolist()]
+    memoire.restaurer(etat["tabou_iteration"].item(), entrees)
+
+
+# --- Fichier de reprise ---
+
+class PointReprise:
+    """
+    Fichier de reprise d'un solveur, réécrit toutes les `periode` itérations
+    (générations pour les AG). Le fichier est conservé en fin d'exécution :
+    le supprimer (effacer()) pour repartir de zéro.
+    """
+
+    def __init__(self, chemin, periode=100):
+        if periode < 1:
+            raise ValueError("periode doit être au moins 1.")
+        self.chemin = os.fspath(chemin)
+        self.periode = periode
+
+    def sauvegarder(self, solveur, iteration, **tableaux):
+        temporaire = self.chemin + ".tmp"
+        with open(temporaire, "wb") as fichier:
+            np.savez(fichier, solveur=np.str_(solveur), iteration=np.int64(iteration), **etat_aleatoire(),
+                     **tableaux)
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        os.replace(temporaire, self.chemin)
+
+    def charger(self, solveur):
+        """
+        Contenu du dernier point de reprise (None s'il n'existe pas) ; l'état du
+        générateur `random` est restauré au passage.
+        """
+        if not os.path.exists(self.chemin):
+            return None
+        with np.load(self.chemin) as fichier:
+            etat = {cle: fichier[cle] for cle in fichier.files}
+        if str(etat["solveur"]) != solveur:
+            raise ValueError(f"Point de reprise de '{etat['solveur']}', incompatible avec '{solveur}'.")
+        restaurer_aleatoire(etat)
+        return etat
+
+    def effacer(self):
+        if os.path.exists(self.chemin):
+            os.remove(self.chemin)
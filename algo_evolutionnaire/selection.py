@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+
+# --- Sélection vectorisée sur des tableaux de coûts ---
+# Chaque méthode reçoit les coûts déjà calculés de la population (tableau 1-D,
+# à minimiser) et retourne les indices des k individus choisis, sans boucle
+# Python par individu : la sélection reste négligeable même pour 10⁶ individus.
+# Les tirages utilisent un générateur NumPy initialisé depuis le module random,
+# si bien que random.seed suffit à rendre une exécution reproductible.
+
+
+def generateur_numpy():
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def _echantillonnage_universel(poids, k, rng):
+    # k pointeurs équidistants sur la roue cumulée, un seul tirage aléatoire
+    cumul = np.cumsum(poids)
+    pas = cumul[-1] / k
+    pointeurs = rng.random() * pas + pas * np.arange(k)
+    indices = np.minimum(np.searchsorted(cumul, pointeurs, side="right"), len(poids) - 1)
+    return rng.permutation(indices)  # Ordre mélangé pour l'appariement des parents
+
+
+def selection_tournoi(couts, k, taille_tournoi=2, rng=None):
+    """
+    k tournois indépendants de `taille_tournoi` individus tirés avec remise :
+    le moins coûteux de chaque tournoi est retenu. O(k * taille_tournoi).
+    """
+    rng = rng or generateur_numpy()
+    couts = np.asarray(couts)
+    candidats = rng.integers(0, len(couts), size=(k, taille_tournoi))
+    gagnants = np.argmin(couts[candidats], axis=1)
+    return candidats[np.arange(k), gagnants]
+
+
+def selection_sus(couts, k, rng=None):
+    """
+    Échantillonnage universel stochastique (SUS) : probabilités proportionnelles
+    à 1 / coût comme la roulette, mais avec une variance minimale. O(n + k log n).
+    """
+    rng = rng or generateur_numpy()
+    fitness = 1 / (np.asarray(couts, dtype=float) + 1e-6)
+    return _echantillonnage_universel(fitness, k, rng)
+
+
+def selection_rang(couts, k, pression=1.5, rng=None):
+    """
+    Sélection par rang linéaire : le meilleur individu reçoit un poids `pression`,
+    le pire 2 - pression (1 <= pression <= 2), indépendamment de l'échelle des coûts.
+    Tirage par SUS sur ces poids. O(n log n).
+    """
+    if not 1 <= pression <= 2:
+        raise ValueError("pression doit être comprise entre 1 et 2.")
+    rng = rng or generateur_numpy()
+    n = len(couts)
+    poids = np.empty(n)
+    poids[np.argsort(couts, kind="stable")] = pression - (2 * pression - 2) * np.arange(n) / max(n - 1, 1)
+    return _echantillonnage_universel(poids, k, rng)
+
+
+SELECTIONS = {
+    "tournoi": selection_tournoi,
+    "sus": selection_sus,
+    "rang": selection_rang,
+}
+
+
+def obtenir_selection(nom):
+    if nom not in SELECTIONS:
+        raise ValueError(f"Sélection non reconnue. Choisissez parmi {', '.join(SELECTIONS)}.")
+    return SELECTIONS[nom]
+
+
+# --- Élites ---
+
+def meilleurs_indices(couts, k):
+    """
+    Indices des k plus petits coûts, triés : identique à np.argsort(couts, kind="stable")[:k]
+    (égalités départagées par indice) mais en O(n + k log k) grâce à une sélection partielle.
+    """
+    couts = np.asarray(couts)
+    n = len(couts)
+    if k >= n:
+        return np.argsort(couts, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    seuil = np.partition(couts, k - 1)[k - 1]
+    inferieurs = np.flatnonzero(couts < seuil)
+    egaux = np.flatnonzero(couts == seuil)[:k - len(inferieurs)]
+    retenus = np.concatenate((inferieurs, egaux))
+    retenus.sort()  # Ordre des indices : le tri stable départage ensuite les égalités
+    return retenus[np.argsort(couts[retenus], kind="stable")]
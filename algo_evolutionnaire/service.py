@@ -0,0 +1,447 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import random
+import signal
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+
+import numpy as np
+
+from .arret import Arret, Redemarrage
+from .distances import SourceCoordonnees
+from .problemes import ProblemeFlowTime, ProblemeTSP, ProblemeTWT
+from .solveurs import SOLVEURS
+
+# --- Service de calcul asynchrone ---
+# Un serveur HTTP minimal (asyncio, bibliothèque standard uniquement), sur un
+# port local ou un socket Unix, reçoit des demandes de résolution et les confie
+# à un pool borné de processus : les exécutions longues ne bloquent ni le
+# serveur ni les autres demandes. Chaque processus de travail renvoie sa
+# progression par une file multiprocessing, relayée aux clients en
+# server-sent events ; l'annulation d'une tâche en cours passe par un drapeau
+# en mémoire partagée, lu par le critère d'arrêt du solveur (arret.py).
+#
+#     python -m algo_evolutionnaire.service --port 8765 --processus 4
+#
+#     POST   /taches                 {"solveur": "recuit", "parametres": {...}, "probleme": {...}, "graine": 0,
+#                                     "arret": {"duree_max": 5, "patience": 10000,
+#                                               "redemarrage": {"stagnation": 2000}}}
+#     GET    /taches                 état de toutes les tâches
+#     GET    /taches/<id>            état d'une tâche (dernier événement de progression)
+#     GET    /taches/<id>/resultat   solution et coût (409 tant que la tâche n'est pas terminée)
+#     GET    /taches/<id>/evenements progression en text/event-stream
+#     DELETE /taches/<id>            annulation (au plus PERIODE_ARRET itérations du recuit, une
+#                                     itération ou une génération des autres solveurs plus tard)
+#
+# Problèmes acceptés : {"type": "tsp", "matrice": [[...]]},
+# {"type": "tsp", "x": [...], "y": [...], "distance": "EUC_2D"},
+# {"type": "flowtime", "durees": [...]}, {"type": "twt", "p": [...], "d": [...], "w": [...]}.
+# "parametres" sont ceux du solveur (solveurs.py), sauf "repliques" : l'échange de
+# répliques se passe d'observateur et de critère d'arrêt, donc d'annulation.
+
+ETATS_FINAUX = ("terminee", "annulee", "echec")
+TAILLE_CORPS_MAX = 64 << 20
+INTERVALLE_PROGRESSION = 0.25  # Secondes minimales entre deux événements relayés
+PERIODE_ITERATIONS = {"recuit": 1000, "tabou": 1}  # Période d'observation par défaut
+
+
+class TacheAnnulee(Exception):
+    pass
+
+
+class FileSaturee(Exception):
+    pass
+
+
+def probleme_depuis_description(description):
+    """
+    Construit le problème décrit par un dictionnaire JSON (voir l'entête du module).
+    """
+    type_probleme = description.get("type")
+    nom = description.get("nom", type_probleme)
+    if type_probleme == "tsp":
+        if "matrice" in description:
+            return ProblemeTSP(description["matrice"], nom=nom)
+        return ProblemeTSP(SourceCoordonnees(description["x"], description["y"],
+                                             description.get("distance", "EUC_2D")), nom=nom)
+    if type_probleme == "flowtime":
+        return ProblemeFlowTime(description["durees"], nom=nom)
+    if type_probleme == "twt":
+        return ProblemeTWT(description["p"], description["d"], description["w"], nom=nom)
+    raise ValueError("Type de problème non reconnu. Choisissez parmi 'tsp', 'flowtime', 'twt'.")
+
+
+def arret_depuis_description(description, classe=Arret, *arguments):
+    """
+    Construit l'Arret décrit par un dictionnaire JSON (paramètres de arret.Arret,
+    "redemarrage" étant lui-même un dictionnaire de paramètres de Redemarrage).
+    classe, arguments : sous-classe d'Arret et ses arguments positionnels supplémentaires.
+    """
+    description = dict(description)
+    if description.get("redemarrage") is not None:
+        description["redemarrage"] = Redemarrage(**description["redemarrage"])
+    return classe(*arguments, **description)
+
+
+def _verifier_objet(nom, valeur):
+    if not isinstance(valeur, dict):
+        raise TypeError(f"{nom} doit être un objet JSON.")
+
+
+def _en_json(valeur):
+    if isinstance(valeur, np.generic):
+        return valeur.item()
+    if isinstance(valeur, np.ndarray):
+        return valeur.tolist()
+    return repr(valeur)
+
+
+def _json(valeur):
+    return json.dumps(valeur, default=_en_json)
+
+
+# --- Côté processus de travail ---
+
+_file = None
+_drapeaux = None
+
+
+def _initialiser_processus(file, drapeaux):
+    global _file, _drapeaux
+    _file, _drapeaux = file, drapeaux
+
+
+class _ArretTache(Arret):
+    """
+    Critères d'arrêt de la demande, plus l'annulation de la tâche : le drapeau est lu à
+    chaque vérification du critère (chaque itération ou génération, toutes les
+    PERIODE_ARRET itérations pour le recuit), indépendamment de la période d'observation.
+    """
+
+    def __init__(self, emplacement, **criteres):
+        super().__init__(**criteres)
+        self.emplacement = emplacement
+
+    def atteint(self, iteration, meilleur_cout, evaluations):
+        if _drapeaux[self.emplacement]:
+            self.motif = "annulation"
+            return True
+        return super().atteint(iteration, meilleur_cout, evaluations)
+
+
+class _ObservateurTache:
+    """
+    Observateur exécuté dans le processus de travail : interrompt le solveur si
+    la tâche est annulée et relaie au plus un événement par INTERVALLE_PROGRESSION.
+    """
+
+    avec_solution = True
+
+    def __init__(self, identifiant, emplacement, periode):
+        self.identifiant = identifiant
+        self.emplacement = emplacement
+        self.periode = periode
+        self._dernier = 0.0
+
+    def __call__(self, evenement):
+        if _drapeaux[self.emplacement]:
+            raise TacheAnnulee(self.identifiant)
+        maintenant = time.monotonic()
+        if maintenant - self._dernier >= INTERVALLE_PROGRESSION:
+            self._dernier = maintenant
+            _file.put((self.identifiant, "progression", evenement))
+
+
+def _executer_tache(identifiant, emplacement, demande):
+    _file.put((identifiant, "debut", None))
+    nom_solveur = demande["solveur"]
+    observateur = _ObservateurTache(identifiant, emplacement,
+                                    demande.get("periode", PERIODE_ITERATIONS.get(nom_solveur, 1)))
+    arret = arret_depuis_description(demande.get("arret") or {}, _ArretTache, emplacement)
+    solveur = SOLVEURS[nom_solveur](**demande.get("parametres", {}), observateur=observateur, arret=arret)
+    probleme = probleme_depuis_description(demande["probleme"])
+    random.seed(demande.get("graine"))
+    debut = time.perf_counter()
+    solution, cout = solveur.resoudre(probleme)
+    if arret.motif == "annulation":
+        raise TacheAnnulee(identifiant)
+    return {"solution": list(solution), "cout": cout, "evaluations": probleme.nb_evaluations,
+            "duree_s": time.perf_counter() - debut, "motif_arret": arret.motif}
+
+
+# --- Côté serveur ---
+
+class Tache:
+    def __init__(self, identifiant, emplacement, demande):
+        self.identifiant = identifiant
+        self.emplacement = emplacement
+        self.demande = demande
+        self.etat = "en_attente"
+        self.soumise = time.time()
+        self.derniere_progression = None
+        self.resultat = None
+        self.erreur = None
+        self.futur = None
+        self.abonnes = set()
+
+    def resume(self):
+        return {"id": self.identifiant, "solveur": self.demande["solveur"], "etat": self.etat,
+                "soumise": self.soumise, "progression": self.derniere_progression, "erreur": self.erreur}
+
+
+class ServiceSolveurs:
+    """
+    File de tâches servie par `nb_processus` processus ; au plus `taille_file`
+    tâches en attente ou en cours (au-delà, soumettre lève FileSaturee).
+    Les `conservation` dernières tâches terminées restent consultables.
+    """
+
+    def __init__(self, nb_processus=None, taille_file=64, conservation=1000):
+        self.taille_file = taille_file
+        self.conservation = conservation
+        self.taches = OrderedDict()
+        self._compteur = itertools.count(1)
+        self._libres = deque(range(taille_file))  # Emplacements des drapeaux d'annulation
+        self._file = multiprocessing.Queue()
+        self._drapeaux = multiprocessing.RawArray("b", taille_file)
+        self._pool = ProcessPoolExecutor(max_workers=nb_processus, initializer=_initialiser_processus,
+                                         initargs=(self._file, self._drapeaux))
+        self._boucle = None
+        self._lecteur = None
+
+    def demarrer(self):
+        # À appeler depuis la boucle asyncio : relaie la file de progression vers la boucle
+        self._boucle = asyncio.get_running_loop()
+        self._lecteur = threading.Thread(target=self._relayer, daemon=True)
+        self._lecteur.start()
+
+    def _relayer(self):
+        while True:
+            message = self._file.get()
+            if message is None:
+                return
+            try:
+                self._boucle.call_soon_threadsafe(self._recevoir, *message)
+            except RuntimeError:  # Boucle déjà fermée : messages tardifs ignorés
+                return
+
+    def _recevoir(self, identifiant, nature, evenement):
+        tache = self.taches.get(identifiant)
+        if tache is None or tache.etat in ETATS_FINAUX:
+            return
+        if nature == "debut":
+            tache.etat = "en_cours"
+        else:
+            tache.derniere_progression = evenement
+        self._diffuser(tache, nature, evenement)
+
+    def _diffuser(self, tache, nature, donnees):
+        for abonne in tache.abonnes:
+            abonne.put_nowait((nature, donnees))
+
+    # --- Opérations ---
+
+    def soumettre(self, demande):
+        _verifier_objet("La demande", demande)
+        if demande.get("solveur") not in SOLVEURS:
+            raise ValueError(f"Solveur non reconnu. Choisissez parmi {', '.join(SOLVEURS)}.")
+        _verifier_objet("parametres", demande.get("parametres", {}))
+        if demande.get("parametres", {}).get("repliques") is not None:
+            # Les tâches sont observées et annulées par leur critère d'arrêt, que l'échange de répliques exclut
+            raise ValueError("L'échange de répliques (repliques) n'est pas disponible dans le service.")
+        _verifier_objet("probleme", demande.get("probleme"))
+        probleme_depuis_description(demande["probleme"])  # Validation avant mise en file
+        if demande.get("arret") is not None:
+            _verifier_objet("arret", demande["arret"])
+            arret_depuis_description(demande["arret"])
+        if not self._libres:
+            raise FileSaturee("File de tâches pleine, réessayez plus tard.")
+
+        emplacement = self._libres.popleft()
+        self._drapeaux[emplacement] = 0
+        tache = Tache(str(next(self._compteur)), emplacement, demande)
+        self.taches[tache.identifiant] = tache
+        # futur de concurrent.futures : cancel() échoue (et retourne False) si la tâche a démarré
+        tache.futur = self._pool.submit(_executer_tache, tache.identifiant, emplacement, demande)
+        tache.futur.add_done_callback(lambda futur: self._boucle.call_soon_threadsafe(self._terminer, tache, futur))
+        return tache
+
+    def _terminer(self, tache, futur):
+        if futur.cancelled():
+            tache.etat = "annulee"
+        else:
+            try:
+                tache.resultat = futur.result()
+                tache.etat = "terminee"
+            except (TacheAnnulee, CancelledError):
+                tache.etat = "annulee"
+            except Exception as erreur:
+                tache.etat, tache.erreur = "echec", f"{type(erreur).__name__}: {erreur}"
+        self._libres.append(tache.emplacement)
+        self._diffuser(tache, "fin", tache.resume())
+        self._oublier_anciennes()
+
+    def _oublier_anciennes(self):
+        terminees = [cle for cle, tache in self.taches.items() if tache.etat in ETATS_FINAUX]
+        for cle in terminees[:max(0, len(terminees) - self.conservation)]:
+            del self.taches[cle]
+
+    def annuler(self, identifiant):
+        tache = self.taches[identifiant]
+        if tache.etat not in ETATS_FINAUX:
+            # Tâche non démarrée : retirée du pool ; en cours : interrompue par son critère d'arrêt
+            if not tache.futur.cancel():
+                self._drapeaux[tache.emplacement] = 1
+        return tache
+
+    def fermer(self):
+        for tache in self.taches.values():
+            if tache.etat not in ETATS_FINAUX:
+                self._drapeaux[tache.emplacement] = 1
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._file.put(None)
+        self._lecteur.join()
+
+    # --- HTTP ---
+
+    async def traiter_connexion(self, lecteur, ecrivain):
+        try:
+            ligne = await lecteur.readline()
+            if not ligne:
+                return
+            methode, chemin, _ = ligne.decode("latin-1").split(" ", 2)
+            entetes = {}
+            while True:
+                ligne = await lecteur.readline()
+                if ligne in (b"\r\n", b"\n", b""):
+                    break
+                cle, _, valeur = ligne.decode("latin-1").partition(":")
+                entetes[cle.strip().lower()] = valeur.strip()
+            longueur = int(entetes.get("content-length") or 0)
+            if longueur > TAILLE_CORPS_MAX:
+                await self._repondre(ecrivain, 413, {"erreur": "Requête trop volumineuse."})
+                return
+            corps = await lecteur.readexactly(longueur) if longueur else b""
+            await self._router(methode, chemin.split("?")[0].rstrip("/"), corps, ecrivain)
+        except (ValueError, asyncio.IncompleteReadError):
+            await self._repondre(ecrivain, 400, {"erreur": "Requête HTTP invalide."})
+        except ConnectionError:
+            pass
+        finally:
+            ecrivain.close()
+
+    async def _router(self, methode, chemin, corps, ecrivain):
+        morceaux = chemin.strip("/").split("/")
+        if methode == "OPTIONS":
+            return await self._repondre(ecrivain, 204, None)
+        if morceaux == ["solveurs"] and methode == "GET":
+            return await self._repondre(ecrivain, 200, sorted(SOLVEURS))
+        if morceaux[0] != "taches" or len(morceaux) > 3:
+            return await self._repondre(ecrivain, 404, {"erreur": "Ressource inconnue."})
+
+        if len(morceaux) == 1:
+            if methode == "GET":
+                return await self._repondre(ecrivain, 200, [tache.resume() for tache in self.taches.values()])
+            if methode == "POST":
+                try:
+                    tache = self.soumettre(json.loads(corps or b"{}"))
+                except FileSaturee as erreur:
+                    return await self._repondre(ecrivain, 503, {"erreur": str(erreur)})
+                except (ValueError, KeyError, TypeError) as erreur:
+                    return await self._repondre(ecrivain, 400, {"erreur": f"Demande invalide : {erreur}"})
+                return await self._repondre(ecrivain, 201, tache.resume())
+            return await self._repondre(ecrivain, 405, {"erreur": "Méthode non autorisée."})
+
+        tache = self.taches.get(morceaux[1])
+        if tache is None:
+            return await self._repondre(ecrivain, 404, {"erreur": "Tâche inconnue."})
+        action = morceaux[2] if len(morceaux) == 3 else None
+        if action is None and methode == "GET":
+            return await self._repondre(ecrivain, 200, tache.resume())
+        if action is None and methode == "DELETE":
+            return await self._repondre(ecrivain, 202, self.annuler(tache.identifiant).resume())
+        if action == "resultat" and methode == "GET":
+            if tache.etat != "terminee":
+                return await self._repondre(ecrivain, 409, tache.resume())
+            return await self._repondre(ecrivain, 200, {**tache.resume(), **tache.resultat})
+        if action == "evenements" and methode == "GET":
+            return await self._flux_evenements(tache, ecrivain)
+        return await self._repondre(ecrivain, 404, {"erreur": "Ressource inconnue."})
+
+    async def _repondre(self, ecrivain, statut, contenu):
+        corps = b"" if contenu is None else _json(contenu).encode()
+        ecrivain.write(
+            f"HTTP/1.1 {statut} {_RAISONS.get(statut, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corps)}\r\n"
+            f"{_ENTETES_CORS}Connection: close\r\n\r\n".encode() + corps
+        )
+        await ecrivain.drain()
+
+    async def _flux_evenements(self, tache, ecrivain):
+        ecrivain.write(("HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                        f"{_ENTETES_CORS}Connection: close\r\n\r\n").encode())
+        abonne = asyncio.Queue()
+        tache.abonnes.add(abonne)
+        try:
+            if tache.etat in ETATS_FINAUX:
+                abonne.put_nowait(("fin", tache.resume()))
+            elif tache.derniere_progression is not None:
+                abonne.put_nowait(("progression", tache.derniere_progression))
+            while True:
+                nature, donnees = await abonne.get()
+                ecrivain.write(f"event: {nature}\ndata: {_json(donnees)}\n\n".encode())
+                await ecrivain.drain()
+                if nature == "fin":
+                    return
+        finally:
+            tache.abonnes.discard(abonne)
+
+
+_RAISONS = {200: "OK", 201: "Created", 202: "Accepted", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 503: "Service Unavailable"}
+# Le front-end (index.html) peut être servi depuis une autre origine
+_ENTETES_CORS = ("Access-Control-Allow-Origin: *\r\nAccess-Control-Allow-Methods: GET, POST, DELETE, OPTIONS\r\n"
+                 "Access-Control-Allow-Headers: Content-Type\r\n")
+
+
+async def servir(service, hote="127.0.0.1", port=8765, socket_unix=None):
+    service.demarrer()
+    if socket_unix:
+        serveur = await asyncio.start_unix_server(service.traiter_connexion, path=socket_unix)
+    else:
+        serveur = await asyncio.start_server(service.traiter_connexion, hote, port)
+    # SIGINT / SIGTERM : fermeture propre (tâches en cours interrompues, pool arrêté)
+    boucle = asyncio.get_running_loop()
+    for signal_arret in (signal.SIGINT, signal.SIGTERM):
+        try:
+            boucle.add_signal_handler(signal_arret, serveur.close)
+        except NotImplementedError:
+            pass
+    try:
+        async with serveur:
+            await serveur.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        service.fermer()
+
+
+def main(arguments=None):
+    parseur = argparse.ArgumentParser(description="Service HTTP de résolution (AG, recuit, tabou).")
+    parseur.add_argument("--hote", default="127.0.0.1")
+    parseur.add_argument("--port", type=int, default=8765)
+    parseur.add_argument("--socket", default=None, help="socket Unix à utiliser au lieu du port TCP")
+    parseur.add_argument("--processus", type=int, default=None, help="taille du pool (défaut : nombre de cœurs)")
+    parseur.add_argument("--taille-file", type=int, default=64, help="tâches en attente ou en cours au maximum")
+    args = parseur.parse_args(arguments)
+    asyncio.run(servir(ServiceSolveurs(args.processus, args.taille_file), args.hote, args.port, args.socket))
+
+
+if __name__ == "__main__":
+    main()
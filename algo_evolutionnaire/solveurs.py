@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from .construction import construire, population_amorcee
+from .echange_repliques import EchangeRepliques
+from .genetique import ag_elitiste, ag_elitiste_lot, ag_roulette
+from .recuit import recuit_simule_generique
+from .tabou import recherche_tabou_generique
+
+# --- Solveurs ---
+# Chaque solveur porte ses paramètres et s'applique à n'importe quel problème
+# de problemes.py : solveur.resoudre(probleme) retourne (meilleure_solution, meilleur_cout)
+# et ajoute les évaluations effectuées au compteur du problème.
+
+
+class Solveur(Protocol):
+    def resoudre(self, probleme): ...
+
+
+def _population_initiale(probleme, taille_population, amorcage, population_initiale):
+    # Population fournie, sinon amorcée par les heuristiques de construction (construction.py) si amorcage > 0
+    if population_initiale is None and amorcage:
+        return population_amorcee(probleme, taille_population, amorcage)
+    return population_initiale
+
+
+@dataclass
+class AGElitiste:
+    taille_population: int = 100
+    taux_elitism: float = 0.1
+    taux_mutation: Any = 0.1  # Nombre ou, avec une mutation par lot, TauxAdaptatif (mutations.py)
+    generations: int = 500
+    type_croisement: str = "permutation"
+    amelioration: Any = None  # Étape mémétique optionnelle appliquée à chaque enfant
+    taille_reproduction: Any = None  # Nombre de meilleurs individus parmi lesquels tirer les parents
+    cache: Any = None  # CacheFitness optionnel (cache.py), propre à un problème
+    observateur: Any = None  # Reçoit les événements de télémétrie (telemetrie.py)
+    reprise: Any = None  # PointReprise optionnel (reprise.py)
+    arret: Any = None  # Arret optionnel (arret.py) : budgets, coût cible, patience, redémarrages
+    mutation: Any = None  # Mutation par lot (mutations.py) : "echange", "insertion", "inversion" ou "melange"
+    amorcage: float = 0.0  # Part de la population initiale construite par heuristiques (construction.py)
+
+    def resoudre(self, probleme, population_initiale=None):
+        population_initiale = _population_initiale(probleme, self.taille_population, self.amorcage,
+                                                   population_initiale)
+        return ag_elitiste(probleme.evaluer_population, probleme.taille, self.taille_population, self.taux_elitism,
+                           self.taux_mutation, self.generations, self.type_croisement, population_initiale,
+                           amelioration=self.amelioration, taille_reproduction=self.taille_reproduction,
+                           cache=self.cache, observateur=self.observateur, reprise=self.reprise, arret=self.arret,
+                           mutation=self.mutation)
+
+
+@dataclass
+class AGElitisteLot:
+    # AG élitiste sur une population en mémoire partagée (grandes populations, voir genetique.ag_elitiste_lot)
+    taille_population: int = 10_000
+    taux_elitism: float = 0.05
+    taux_mutation: Any = 0.1  # Nombre ou TauxAdaptatif (mutations.py)
+    generations: int = 500
+    operateur: str = "ox"  # "ox", "pmx", "cycle" ou "arete"
+    mutation: str = "echange"
+    taille_reproduction: Any = None
+    nb_processus: int = 1
+    observateur: Any = None
+    arret: Any = None
+    amorcage: float = 0.0
+
+    def resoudre(self, probleme, population_initiale=None):
+        population_initiale = _population_initiale(probleme, self.taille_population, self.amorcage,
+                                                   population_initiale)
+        return ag_elitiste_lot(probleme.evaluer_population, probleme.taille, self.taille_population,
+                               self.taux_elitism, self.taux_mutation, self.generations, self.operateur,
+                               self.taille_reproduction, self.nb_processus, population_initiale,
+                               observateur=self.observateur, arret=self.arret, mutation=self.mutation)
+
+
+@dataclass
+class AGRoulette:
+    taille_population: int = 100
+    taux_selection: float = 0.3
+    taux_mutation: float = 0.1
+    generations: int = 500
+    type_croisement: str = "permutation"
+    amelioration: Any = None
+    cache: Any = None
+    observateur: Any = None
+    reprise: Any = None
+    selection: Any = "roulette"  # "roulette", "tournoi", "sus", "rang" ou fonction (selection.py)
+    arret: Any = None
+    mutation: Any = None
+    amorcage: float = 0.0
+
+    def resoudre(self, probleme, population_initiale=None):
+        population_initiale = _population_initiale(probleme, self.taille_population, self.amorcage,
+                                                   population_initiale)
+        return ag_roulette(probleme.evaluer_population, probleme.taille, self.taille_population, self.taux_selection,
+                           self.taux_mutation, self.generations, self.type_croisement, population_initiale,
+                           amelioration=self.amelioration, cache=self.cache,
+                           observateur=self.observateur, reprise=self.reprise, selection=self.selection,
+                           arret=self.arret, mutation=self.mutation)
+
+
+@dataclass
+class RecuitSimule:
+    temperature_initiale: Any = 1000.0  # Ou "auto" : calibrée sur un échantillon de deltas
+    taux_refroidissement: Any = 0.995  # Ou "auto" : température finale atteinte à la dernière itération
+    iterations_max: int = 1000
+    mouvement: str = "echange"
+    observateur: Any = None
+    reprise: Any = None
+    arret: Any = None
+    refroidissement: Any = None  # Schéma ou nom (refroidissement.py), remplace taux_refroidissement
+    depart: Any = None  # Heuristique de construction de la solution initiale (construction.py), sinon aléatoire
+    repliques: Any = None  # Nombre de répliques ou EchangeRepliques (echange_repliques.py) : échange de répliques
+
+    def resoudre(self, probleme):
+        solution_initiale = construire(probleme, self.depart) if self.depart is not None else None
+        evaluateur = probleme.evaluateur()
+        try:
+            if self.repliques is not None:
+                return self._echange_repliques(evaluateur, solution_initiale)
+            return recuit_simule_generique(evaluateur, self.temperature_initiale, self.taux_refroidissement,
+                                           self.iterations_max, self.mouvement, observateur=self.observateur,
+                                           reprise=self.reprise, arret=self.arret,
+                                           refroidissement=self.refroidissement, solution_initiale=solution_initiale)
+        finally:
+            probleme.nb_evaluations += evaluateur.nb_evaluations
+
+    def _echange_repliques(self, evaluateur, solution_initiale):
+        # Températures fixes : la progression passe par EchangeRepliques(rapport=...), pas par l'observateur
+        if any(option is not None for option in (self.observateur, self.reprise, self.arret, self.refroidissement)):
+            raise ValueError("observateur, reprise, arret et refroidissement sont incompatibles "
+                             "avec l'échange de répliques.")
+        repliques = self.repliques
+        if not isinstance(repliques, EchangeRepliques):
+            repliques = EchangeRepliques(repliques)
+        temperature_max = None if self.temperature_initiale == "auto" else self.temperature_initiale
+        return repliques.executer(evaluateur, self.iterations_max, self.mouvement, solution_initiale,
+                                  temperature_max)
+
+
+@dataclass
+class RechercheTabou:
+    iterations: int = 500
+    taille_tabou: int = 20
+    mouvement: str = "echange"
+    attribut: str = "mouvement"
+    aspiration: bool = True
+    observateur: Any = None
+    reprise: Any = None
+    arret: Any = None
+    balayage: Any = None  # Stratégie de voisinage (voisinage.py), nom de BALAYAGES ou True : blocs sur des threads
+    depart: Any = None
+
+    def resoudre(self, probleme):
+        solution_initiale = construire(probleme, self.depart) if self.depart is not None else None
+        evaluateur = probleme.evaluateur()
+        try:
+            return recherche_tabou_generique(evaluateur, self.iterations, self.taille_tabou, self.mouvement,
+                                             self.attribut, self.aspiration, self.observateur, self.reprise,
+                                             self.arret, self.balayage, solution_initiale)
+        finally:
+            probleme.nb_evaluations += evaluateur.nb_evaluations
+
+
+SOLVEURS = {
+    "ag_elitiste": AGElitiste,
+    "ag_elitiste_lot": AGElitisteLot,
+    "ag_roulette": AGRoulette,
+    "recuit": RecuitSimule,
+    "tabou": RechercheTabou,
+}
@@ -0,0 +1,145 @@
+import random
+import time
+
+import numpy as np
+
+from .evaluation_ordonnancement import EvaluateurFlowTime
+from .memoire_tabou import MemoireTabou, memoriser_mouvement, mouvement_est_tabou, verifier_attribut
+from .mouvements_TSP import EvaluateurTSP
+from .recuit import verifier_mouvement
+from .reprise import entiers_compacts, etat_evaluateur, etat_memoire, restaurer_evaluateur, restaurer_memoire
+from .telemetrie import emettre, periode_observation
+from .voisinage import Balayage, obtenir_balayage
+
+# --- Recherche tabou ---
+# Comme le recuit, la recherche ne manipule qu'un évaluateur incrémental :
+# le meilleur voisin non tabou est trouvé par évaluation des deltas
+# (evaluateur.meilleur_mouvement), sans construire la liste des voisins.
+
+
+def recherche_tabou_generique(evaluateur, iterations, taille_tabou, mouvement="echange", attribut="mouvement",
+                              aspiration=True, observateur=None, reprise=None, arret=None, balayage=None,
+                              solution_initiale=None):
+    """
+    Recherche tabou depuis `solution_initiale` (par exemple construction.construire), ou un ordre aléatoire :
+    - mémoire tabou en O(1), attribut "mouvement" ou "position" (un élément ne
+      revient pas à la position qu'il vient de quitter, échanges uniquement)
+    - critère d'aspiration : un mouvement tabou est accepté s'il bat la meilleure solution
+    - observateur : reçoit un événement toutes les `observateur.periode` itérations (voir telemetrie.py)
+    - reprise : PointReprise optionnel (reprise.py), sauvegardé toutes les `reprise.periode` itérations ;
+      la recherche repart du dernier point sauvegardé s'il existe
+    - arret : Arret optionnel (arret.py) ; un redémarrage repart de la meilleure
+      solution perturbée, la mémoire tabou étant conservée
+    - balayage : stratégie de voisinage optionnelle (voisinage.py), objet ou nom de
+      voisinage.BALAYAGES, True pour BalayageParallele : voisinage complet évalué par blocs
+      sur plusieurs threads, avec les mêmes mouvements retenus (coups_tabous ne compte alors
+      que les coups tabous meilleurs que le mouvement retenu), ou voisinage restreint
+      (VoisinageAleatoire, VoisinageProches, ListeElite) pour les grandes instances
+    Retourne (meilleure_solution, meilleur_cout).
+    """
+    verifier_mouvement(evaluateur, mouvement)
+    verifier_attribut(attribut)
+    if attribut == "position" and mouvement != "echange":
+        raise ValueError("L'attribut 'position' n'est défini que pour le mouvement 'echange'.")
+
+    tabou = MemoireTabou(taille_tabou)  # Attributs interdits temporairement
+    etat = reprise.charger("tabou") if reprise is not None else None
+    if arret is not None:
+        arret.demarrer(evaluateur.nb_evaluations, etat)
+    if etat is None:
+        if solution_initiale is None:
+            solution_initiale = list(range(len(evaluateur.ordre)))
+            random.shuffle(solution_initiale)
+        evaluateur.definir_ordre(solution_initiale)
+        meilleure_solution, meilleur_cout = evaluateur.ordre[:], evaluateur.cout
+        premiere_iteration = 0
+    else:
+        restaurer_evaluateur(evaluateur, etat)
+        restaurer_memoire(tabou, etat)
+        meilleure_solution, meilleur_cout = etat["meilleure_solution"].tolist(), etat["meilleur_cout"].item()
+        premiere_iteration = etat["iteration"].item()
+    compteurs = {"coups_tabous": 0, "aspirations": 0}  # Voisins tabous rencontrés, tabous levés
+
+    def interdit(move, delta):
+        if not mouvement_est_tabou(tabou, evaluateur.ordre, move, attribut):
+            return False
+        compteurs["coups_tabous"] += 1
+        # Aspiration : le tabou est levé si le mouvement bat la meilleure solution
+        if aspiration and evaluateur.cout + delta < meilleur_cout:
+            compteurs["aspirations"] += 1
+            return False
+        return True
+
+    balayage_interne = balayage is not None and not isinstance(balayage, Balayage)
+    if balayage_interne:
+        balayage = obtenir_balayage(balayage)
+    if balayage is not None:
+        balayage.reinitialiser()
+        if etat is not None:
+            balayage.restaurer(etat, evaluateur, mouvement)
+    try:
+        periode = periode_observation(observateur, iterations)
+        debut = time.perf_counter()
+        for it in range(premiere_iteration, iterations):
+            if balayage is None:
+                meilleur_delta, meilleur_move = evaluateur.meilleur_mouvement(mouvement, interdit)
+            else:
+                # Au plus un mouvement interdit par attribut de la mémoire
+                meilleur_delta, meilleur_move = balayage.meilleur_mouvement(evaluateur, mouvement, interdit,
+                                                                            len(tabou) + 1)
+
+            if meilleur_move is None:
+                break  # tous les mouvements sont tabous
+
+            # Le mouvement est mémorisé avant d'être appliqué sur place
+            memoriser_mouvement(tabou, evaluateur.ordre, meilleur_move, attribut)
+            evaluateur.appliquer(mouvement, meilleur_move, meilleur_delta)
+
+            if evaluateur.cout < meilleur_cout:
+                meilleure_solution, meilleur_cout = evaluateur.ordre[:], evaluateur.cout
+                if arret is not None:
+                    arret.ameliore(it + 1)
+
+            tabou.avancer()
+
+            termine = arret is not None and arret.atteint(it + 1, meilleur_cout, evaluateur.nb_evaluations)
+            if observateur is not None and (termine or (it + 1) % periode == 0):
+                emettre(observateur, {"solveur": "tabou", "iteration": it + 1, "meilleur_cout": meilleur_cout,
+                                      "cout_courant": evaluateur.cout, **compteurs,
+                                      "duree": time.perf_counter() - debut}, meilleure_solution)
+                compteurs.update(coups_tabous=0, aspirations=0)
+                debut = time.perf_counter()
+            if termine:
+                break
+            if arret is not None and arret.redemarrer(it + 1):
+                evaluateur.definir_ordre(arret.redemarrage.perturber(meilleure_solution))
+                if balayage is not None:
+                    balayage.reinitialiser()
+            if reprise is not None and (it + 1) % reprise.periode == 0:
+                reprise.sauvegarder("tabou", it + 1, **etat_evaluateur(evaluateur), **etat_memoire(tabou),
+                                    meilleure_solution=entiers_compacts(meilleure_solution),
+                                    meilleur_cout=np.asarray(meilleur_cout),
+                                    **(balayage.etat() if balayage is not None else {}),
+                                    **(arret.etat(evaluateur.nb_evaluations) if arret is not None else {}))
+    finally:
+        if balayage_interne:
+            balayage.fermer()
+
+    return meilleure_solution, meilleur_cout
+
+
+# --- Points d'entrée par problème ---
+
+def recherche_tabou(matrice, iterations, taille_tabou, mouvement="echange", attribut="mouvement", aspiration=True,
+                    reprise=None, arret=None, balayage=None):
+    # mouvement : "echange", "2opt" ou "oropt" (voir mouvements_TSP)
+    return recherche_tabou_generique(EvaluateurTSP(matrice), iterations, taille_tabou, mouvement, attribut, aspiration,
+                                     reprise=reprise, arret=arret, balayage=balayage)
+
+
+def recherche_tabou_ordonnancement(durees, iterations, taille_tabou, attribut="mouvement", aspiration=True,
+                                   mouvement="echange", reprise=None, arret=None, balayage=None):
+    # Minimise le flow time ; mouvement : "echange" ou "insertion"
+    return recherche_tabou_generique(EvaluateurFlowTime(range(len(durees)), durees), iterations, taille_tabou,
+                                     mouvement, attribut, aspiration, reprise=reprise, arret=arret,
+                                     balayage=balayage)
@@ -0,0 +1,116 @@
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+# --- Télémétrie des solveurs ---
+# Les moteurs (ag_elitiste, ag_roulette, recuit_simule_generique,
+# recherche_tabou_generique) acceptent un paramètre `observateur` : n'importe
+# quel appelable recevant un dictionnaire par événement. Sans observateur, les
+# boucles ne font aucun chronométrage ni calcul de statistiques.
+#
+# Champs émis (selon le solveur) :
+# - communs : solveur, iteration, meilleur_cout
+# - AG : cout_moyen, diversite, temps_evaluation, temps_selection,
+#   temps_croisement, temps_mutation, temps_amelioration (secondes, par génération)
+# - ag_elitiste_lot : cout_moyen, diversite, duree (par génération)
+# - recuit : cout_courant, temperature, taux_acceptation, duree (sur la période)
+# - tabou : cout_courant, coups_tabous, aspirations, duree (sur la période)
+# - meilleure_solution, si l'observateur a un attribut avec_solution vrai
+#
+#     journal = TamponCirculaire(10_000)
+#     AGElitiste(observateur=Observateur(journal, JournalJSONL("ag.jsonl"))).resoudre(probleme)
+
+
+def diversite(population):
+    """
+    Diversité d'une population de permutations (tableau 2-D) : 1 - fréquence moyenne
+    du gène majoritaire à chaque position. 0 si tous les individus sont identiques.
+    """
+    population = np.asarray(population)
+    nb, n = population.shape
+    # Gènes de chaque position triés (une ligne par position) : le gène majoritaire est la plus
+    # longue suite de valeurs égales de la ligne. Mémoire en O(nb * n), sans table n x n
+    genes = np.sort(population.T, axis=1)
+    debuts = np.ones(genes.shape, dtype=bool)
+    debuts[:, 1:] = genes[:, 1:] != genes[:, :-1]
+    indices = np.flatnonzero(debuts)
+    longueurs = np.diff(indices, append=genes.size)
+    majoritaires = np.maximum.reduceat(longueurs, np.searchsorted(indices, np.arange(n) * nb))
+    return float(1.0 - majoritaires.mean() / nb)
+
+
+# --- Puits d'événements ---
+
+class TamponCirculaire:
+    """
+    Conserve en mémoire les `capacite` derniers événements.
+    """
+
+    def __init__(self, capacite=10_000):
+        self.evenements = deque(maxlen=capacite)
+
+    def __call__(self, evenement):
+        self.evenements.append(evenement)
+
+    def __len__(self):
+        return len(self.evenements)
+
+    def __iter__(self):
+        return iter(self.evenements)
+
+
+class JournalJSONL:
+    """
+    Écrit chaque événement sur une ligne JSON (fichier en mode ajout, écriture tamponnée).
+    """
+
+    def __init__(self, chemin):
+        self.fichier = open(chemin, "a", encoding="utf-8")
+
+    def __call__(self, evenement):
+        self.fichier.write(json.dumps(evenement, default=repr) + "\n")
+
+    def fermer(self):
+        self.fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+class Observateur:
+    """
+    Diffuse les événements vers plusieurs puits en ajoutant `t` (secondes depuis la création).
+    periode : le recuit et la tabou n'émettent qu'un événement toutes les `periode` itérations.
+    avec_solution : joindre une copie de la meilleure solution à chaque événement.
+    """
+
+    def __init__(self, *puits, periode=1, avec_solution=False):
+        if periode < 1:
+            raise ValueError("periode doit être au moins 1.")
+        self.puits = puits
+        self.periode = periode
+        self.avec_solution = avec_solution
+        self._debut = time.perf_counter()
+
+    def __call__(self, evenement):
+        evenement["t"] = time.perf_counter() - self._debut
+        for puits in self.puits:
+            puits(evenement)
+
+
+def emettre(observateur, evenement, meilleure_solution):
+    if getattr(observateur, "avec_solution", False):
+        evenement["meilleure_solution"] = list(meilleure_solution)
+    observateur(evenement)
+
+
+def periode_observation(observateur, defaut):
+    # Nombre d'itérations entre deux événements (`defaut` sans observateur)
+    if observateur is None:
+        return defaut
+    return max(1, getattr(observateur, "periode", 1))
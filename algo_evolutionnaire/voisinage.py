@@ -0,0 +1,328 @@
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .selection import generateur_numpy
+
+# --- Balayage parallèle du voisinage (recherche tabou) ---
+# evaluateur.meilleur_mouvement parcourt les mouvements (i, j) un par un ou ligne
+# par ligne. Un évaluateur qui fournit noyau_deltas(mouvement) calcule les deltas
+# de tout un bloc de lignes i (tableau à une ligne par i et une colonne par j à
+# partir de la première colonne utile du bloc) en quelques opérations NumPy, qui
+# libèrent le GIL : BalayageParallele découpe l'espace des mouvements en blocs de
+# lignes et les répartit sur un pool de threads. Chaque bloc retourne ses
+# `nb_candidats` meilleurs mouvements ; ils sont fusionnés dans l'ordre
+# d'énumération puis examinés par delta croissant dans le thread principal (le
+# test tabou n'est appelé que là) : le mouvement retenu est celui du balayage
+# série. nb_candidats = nombre de mouvements interdits + 1 suffit, la recherche
+# tabou passe len(memoire) + 1 (chaque attribut interdit au plus un mouvement).
+# En dessous de `taille_min` éléments, ou pour un mouvement sans noyau (Or-opt,
+# 2-opt asymétrique, TWT), le balayage série est utilisé.
+#
+#     RechercheTabou(balayage=BalayageParallele(nb_threads=8)).resoudre(probleme)
+#
+# Toutes les stratégies de ce module (voir Balayage) se passent à la recherche
+# tabou par le même paramètre `balayage`, objet ou nom de BALAYAGES.
+
+TAILLE_MIN = 300  # Éléments en dessous desquels le balayage série est plus rapide
+MOUVEMENTS_PAR_BLOC = 1 << 18
+
+
+def masquer(deltas, valides, premiere_colonne=0):
+    """
+    Bloc retourné par un noyau : (deltas, valides, premiere_colonne), la colonne c
+    correspondant à j = premiere_colonne + c. Les cases qui ne sont pas des
+    mouvements (valides faux) reçoivent la plus grande valeur du type, jamais retenue.
+    """
+    sentinelle = np.inf if deltas.dtype.kind == "f" else np.iinfo(deltas.dtype).max
+    return np.where(valides, deltas, sentinelle), valides, premiere_colonne
+
+
+def _meilleurs(deltas, k):
+    """
+    Indices à plat des k plus petits deltas du bloc 2-D, premiers dans l'ordre en cas
+    d'égalité, triés par (delta, indice).
+    """
+    plats = deltas.ravel()
+    if plats.size <= k:
+        indices = np.arange(plats.size)
+    else:
+        # La k-ième plus petite valeur est majorée par le k-ième plus petit minimum de ligne : seules
+        # les cases sous ce seuil sont triées (sélection exacte sur tout le bloc s'il a moins de k lignes)
+        minima = deltas.min(axis=1) if len(deltas) >= k else plats
+        indices = np.flatnonzero(plats <= np.partition(minima, k - 1)[k - 1])
+    return indices[np.argsort(plats[indices], kind="stable")[:k]]
+
+
+def _premier_autorise(deltas, mouvements, interdit):
+    # Mouvements (lignes de `mouvements`) par delta croissant, premiers dans l'ordre en cas d'égalité
+    for k in np.argsort(deltas, kind="stable"):
+        move, delta = tuple(mouvements[k].tolist()), deltas[k].item()
+        if interdit is None or not interdit(move, delta):
+            return delta, move
+    return float('inf'), None
+
+
+def _evaluer(evaluateur, mouvement, mouvements):
+    # Deltas d'une liste de mouvements (tableau à une ligne par mouvement), comptés dans nb_evaluations
+    if mouvements.shape[1] != 2:
+        return np.array([evaluateur.delta(mouvement, move) for move in map(tuple, mouvements.tolist())])
+    evaluateur.nb_evaluations += len(mouvements)
+    return np.asarray(evaluateur.deltas_paires(mouvement, mouvements[:, 0], mouvements[:, 1]))
+
+
+def paires_uniques(i, j, n):
+    """
+    Couples (i, j) de positions sans doublon, dans l'ordre d'énumération (i puis j
+    croissants), en tableau à une ligne par couple.
+    """
+    cles = np.unique(np.asarray(i, dtype=np.int64) * n + j)
+    return np.column_stack(np.divmod(cles, n))
+
+
+class Balayage:
+    """
+    Base des stratégies de voisinage de la recherche tabou :
+    meilleur_mouvement(evaluateur, mouvement, interdit, nb_candidats) -> (delta, move)
+    ou (inf, None) ; reinitialiser() oublie l'état gardé d'une itération à l'autre
+    (appelé au départ et aux redémarrages), etat() et restaurer() le sauvegardent dans
+    les points de reprise ; fermer() libère les ressources.
+    """
+
+    def meilleur_mouvement(self, evaluateur, mouvement="echange", interdit=None, nb_candidats=1):
+        raise NotImplementedError
+
+    def reinitialiser(self):
+        pass
+
+    def etat(self):
+        return {}
+
+    def restaurer(self, etat, evaluateur, mouvement):
+        pass
+
+    def fermer(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+class BalayageParallele(Balayage):
+    """
+    Recherche du meilleur mouvement non interdit par blocs de lignes (voir l'entête du module).
+    nb_threads : threads de calcul (par défaut le nombre de processeurs) ;
+    taille_min : nombre d'éléments en dessous duquel le balayage reste série ;
+    mouvements_par_bloc : nombre de cases (i, j) visé par bloc.
+    """
+
+    def __init__(self, nb_threads=None, taille_min=TAILLE_MIN, mouvements_par_bloc=MOUVEMENTS_PAR_BLOC):
+        self.nb_threads = nb_threads or os.cpu_count() or 1
+        self.taille_min = taille_min
+        self.mouvements_par_bloc = mouvements_par_bloc
+        self._executeur = None
+
+    def _carte(self, fonction, elements):
+        if self.nb_threads == 1 or len(elements) == 1:
+            return map(fonction, elements)
+        if self._executeur is None:
+            self._executeur = ThreadPoolExecutor(self.nb_threads)
+        return self._executeur.map(fonction, elements)
+
+    def meilleur_mouvement(self, evaluateur, mouvement="echange", interdit=None, nb_candidats=1):
+        """
+        Même résultat que evaluateur.meilleur_mouvement(mouvement, interdit), pourvu
+        qu'au plus nb_candidats - 1 mouvements soient interdits. Retourne (delta, move)
+        ou (inf, None) si tous les mouvements examinés sont exclus.
+        """
+        noyau = evaluateur.noyau_deltas(mouvement) if len(evaluateur.ordre) >= self.taille_min else None
+        if noyau is None:
+            return evaluateur.meilleur_mouvement(mouvement, interdit)
+        return _premier_autorise(*self._par_blocs(evaluateur, noyau, nb_candidats), interdit)
+
+    def meilleurs_mouvements(self, evaluateur, mouvement, k):
+        """
+        Les k meilleurs mouvements de tout le voisinage, par blocs si l'évaluateur a un
+        noyau (quelle que soit la taille), un par un sinon. Retourne (deltas, mouvements)
+        triés par delta croissant, une ligne de `mouvements` par mouvement.
+        """
+        noyau = evaluateur.noyau_deltas(mouvement)
+        if noyau is not None:
+            deltas, mouvements = self._par_blocs(evaluateur, noyau, k)
+            ordre = np.argsort(deltas, kind="stable")
+            return deltas[ordre], mouvements[ordre]
+        # heapq.nsmallest est stable : ordre d'énumération en cas d'égalité
+        meilleurs = heapq.nsmallest(k, ((evaluateur.delta(mouvement, move), move)
+                                        for move in evaluateur.enumerer(mouvement)), key=lambda c: c[0])
+        return (np.array([delta for delta, _ in meilleurs]),
+                np.array([move for _, move in meilleurs], dtype=np.intp).reshape(len(meilleurs), -1))
+
+    def _par_blocs(self, evaluateur, noyau, nb_candidats):
+        # nb_candidats meilleurs mouvements de chaque bloc, dans l'ordre d'énumération
+        n = len(evaluateur.ordre)
+
+        def balayer_bloc(debut):
+            deltas, valides, premiere_colonne = noyau(debut, min(debut + lignes, n))
+            meilleurs = _meilleurs(deltas, nb_candidats)
+            meilleurs = meilleurs[valides.ravel()[meilleurs]]
+            i, colonne = np.divmod(meilleurs, deltas.shape[1])
+            return np.count_nonzero(valides), deltas.ravel()[meilleurs], debut + i, premiere_colonne + colonne
+
+        lignes = max(1, self.mouvements_par_bloc // n)
+        blocs = list(self._carte(balayer_bloc, range(0, n, lignes)))
+        evaluateur.nb_evaluations += sum(bloc[0] for bloc in blocs)
+
+        # Blocs dans l'ordre d'énumération : le tri stable départage les égalités comme le balayage série
+        deltas, i, j = (np.concatenate([bloc[k] for bloc in blocs]) for k in (1, 2, 3))
+        return deltas, np.column_stack((i, j))
+
+    def fermer(self):
+        if self._executeur is not None:
+            self._executeur.shutdown()
+            self._executeur = None
+
+
+# --- Voisinages restreints (grandes instances) ---
+# Le balayage complet évalue O(n²) mouvements par itération. Les stratégies
+# suivantes n'en évaluent qu'une partie ; le mouvement retenu n'est plus
+# forcément le meilleur du voisinage complet :
+# - VoisinageAleatoire(taille) : `taille` mouvements tirés au hasard, O(taille)
+# - VoisinageProches(k) : mouvements qui rapprochent chaque élément de ses k plus
+#   proches (plus proches villes pour le TSP, positions voisines en ordonnancement), O(n·k)
+# - ListeElite(taille) : les `taille` meilleurs mouvements d'un balayage complet,
+#   réévalués à chaque itération, O(taille) ; la liste n'est reconstruite que
+#   lorsqu'elle a vieilli ou que son meilleur mouvement devient moins bon que le
+#   pire mouvement retenu à sa construction
+# taille et k règlent le compromis qualité / vitesse. Les deltas des paires de
+# positions (échange, 2-opt, insertion) sont calculés d'un coup par
+# evaluateur.deltas_paires ; l'Or-opt est évalué mouvement par mouvement et
+# n'a pas de voisinage des plus proches.
+#
+#     RechercheTabou(mouvement="2opt", balayage=VoisinageProches(k=8)).resoudre(probleme)
+
+
+class VoisinageAleatoire(Balayage):
+    """
+    Meilleur mouvement non interdit parmi `taille` mouvements tirés au hasard à
+    chaque itération (doublons retirés).
+    """
+
+    def __init__(self, taille=1000):
+        self.taille = taille
+
+    def meilleur_mouvement(self, evaluateur, mouvement="echange", interdit=None, nb_candidats=1):
+        n = len(evaluateur.ordre)
+        if mouvement == "oropt":
+            mouvements = np.array(sorted({evaluateur.tirer(mouvement) for _ in range(self.taille)}), dtype=np.intp)
+        else:
+            rng = generateur_numpy()
+            i = rng.integers(0, n, self.taille)
+            j = (i + rng.integers(1, n, self.taille)) % n
+            if mouvement != "insertion":
+                i, j = np.minimum(i, j), np.maximum(i, j)
+            if mouvement == "2opt":
+                i, j = i[j - i >= 2], j[j - i >= 2]
+            mouvements = paires_uniques(i, j, n)
+        return _premier_autorise(_evaluer(evaluateur, mouvement, mouvements), mouvements, interdit)
+
+
+class VoisinageProches(Balayage):
+    """
+    Meilleur mouvement non interdit parmi ceux de evaluateur.paires_proches(mouvement, k) :
+    pour le TSP, ceux qui rendent chaque ville voisine de l'une de ses k plus proches
+    villes ; en ordonnancement, ceux entre positions distantes d'au plus k.
+    """
+
+    def __init__(self, k=10):
+        self.k = k
+
+    def meilleur_mouvement(self, evaluateur, mouvement="echange", interdit=None, nb_candidats=1):
+        paires = evaluateur.paires_proches(mouvement, self.k)
+        if paires is None:
+            raise ValueError(f"Pas de voisinage des plus proches pour le mouvement '{mouvement}'.")
+        mouvements = paires_uniques(*paires, len(evaluateur.ordre))
+        return _premier_autorise(_evaluer(evaluateur, mouvement, mouvements), mouvements, interdit)
+
+
+class ListeElite(Balayage):
+    """
+    Liste de candidats d'élite : les `taille` meilleurs mouvements d'un balayage
+    complet (`balayage`, BalayageParallele par défaut), réévalués à chaque itération.
+    La liste est reconstruite après `age_max` itérations (par défaut `taille`), dès
+    que son meilleur mouvement est moins bon que le pire retenu à sa construction, ou
+    lorsque tous ses mouvements sont interdits. fermer() ferme aussi `balayage`.
+    """
+
+    def __init__(self, taille=50, age_max=None, balayage=None):
+        self.taille = taille
+        self.age_max = taille if age_max is None else age_max
+        self.balayage = balayage if balayage is not None else BalayageParallele()
+        self.reinitialiser()
+
+    def reinitialiser(self):
+        self._evaluateur = self._mouvement = self._mouvements = self._seuil = None
+        self._age = 0
+
+    def _construire(self, evaluateur, mouvement, nb_candidats):
+        deltas, self._mouvements = self.balayage.meilleurs_mouvements(evaluateur, mouvement,
+                                                                      max(self.taille, nb_candidats))
+        self._evaluateur, self._mouvement, self._age = evaluateur, mouvement, 0
+        self._seuil = deltas[-1] if len(deltas) else None
+        return deltas
+
+    def meilleur_mouvement(self, evaluateur, mouvement="echange", interdit=None, nb_candidats=1):
+        reconstruite = (evaluateur is not self._evaluateur or mouvement != self._mouvement
+                        or self._age >= self.age_max)
+        if reconstruite:
+            deltas = self._construire(evaluateur, mouvement, nb_candidats)
+        else:
+            deltas = _evaluer(evaluateur, mouvement, self._mouvements)
+            if len(deltas) == 0 or deltas.min() > self._seuil:
+                deltas, reconstruite = self._construire(evaluateur, mouvement, nb_candidats), True
+        self._age += 1
+        delta, move = _premier_autorise(deltas, self._mouvements, interdit)
+        if move is None and not reconstruite:
+            deltas = self._construire(evaluateur, mouvement, nb_candidats)
+            self._age = 1
+            delta, move = _premier_autorise(deltas, self._mouvements, interdit)
+        return delta, move
+
+    def etat(self):
+        if self._mouvements is None or len(self._mouvements) == 0:
+            return {}
+        return {"elite_mouvements": self._mouvements, "elite_seuil": np.asarray(self._seuil),
+                "elite_age": np.int64(self._age)}
+
+    def restaurer(self, etat, evaluateur, mouvement):
+        if "elite_mouvements" in etat:
+            self._evaluateur, self._mouvement = evaluateur, mouvement
+            self._mouvements, self._seuil = etat["elite_mouvements"], etat["elite_seuil"].item()
+            self._age = etat["elite_age"].item()
+
+    def fermer(self):
+        self.balayage.fermer()
+
+
+BALAYAGES = {
+    "complet": BalayageParallele,
+    "aleatoire": VoisinageAleatoire,
+    "proches": VoisinageProches,
+    "elite": ListeElite,
+}
+
+
+def obtenir_balayage(balayage):
+    # True (balayage complet), nom de BALAYAGES (stratégie avec ses paramètres par défaut)
+    # ou stratégie déjà construite
+    if isinstance(balayage, Balayage):
+        return balayage
+    if balayage is True:
+        balayage = "complet"
+    if balayage not in BALAYAGES:
+        raise ValueError(f"Balayage non reconnu. Choisissez parmi {', '.join(BALAYAGES)}.")
+    return BALAYAGES[balayage]()
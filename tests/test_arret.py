@@ -0,0 +1,23 @@
+import random
+
+from algo_evolutionnaire import ProblemeTSP, RecuitSimule
+from algo_evolutionnaire.arret import Arret, Redemarrage
+from algo_evolutionnaire.instances import tsp_aleatoire
+from algo_evolutionnaire.reprise import PointReprise
+from algo_evolutionnaire.telemetrie import Observateur
+
+
+def recuit_avec_redemarrages(**options):
+    random.seed(5)
+    arret = Arret(patience=10**9, redemarrage=Redemarrage(2000, force=3))
+    solveur = RecuitSimule(iterations_max=20000, mouvement="2opt", arret=arret, **options)
+    solution, cout = solveur.resoudre(ProblemeTSP(tsp_aleatoire(40, graine=1).matrice))
+    return solution, cout, arret.redemarrages
+
+
+def test_recuit_redemarrages_independants_de_l_observation(tmp_path):
+    reference = recuit_avec_redemarrages()
+    assert reference[2] > 0
+    assert recuit_avec_redemarrages(observateur=Observateur(periode=1)) == reference
+    assert recuit_avec_redemarrages(observateur=Observateur(periode=333)) == reference
+    assert recuit_avec_redemarrages(reprise=PointReprise(tmp_path / "recuit.npz", periode=250)) == reference
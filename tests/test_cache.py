@@ -0,0 +1,35 @@
+import itertools
+
+import numpy as np
+
+from algo_evolutionnaire.cache import CacheFitness
+
+
+def test_hachages_distincts_et_coherents():
+    cache = CacheFitness(8)
+    permutations = np.array(list(itertools.permutations(range(8))))
+    cles = cache.hacher_population(permutations)
+    assert len(set(cles.tolist())) == len(permutations)
+    assert cache.hacher(permutations[123]) == cles[123]
+    assert cache.hacher(permutations[123].astype(np.int16)) == cles[123]
+
+
+def test_cles_en_memoire_lineaire():
+    cache = CacheFitness(50_000)
+    assert cache._cles_genes.nbytes + cache._cles_positions.nbytes == 16 * 50_000
+
+
+def test_evaluation_par_le_cache():
+    rng = np.random.default_rng(0)
+    base = np.array([rng.permutation(30) for _ in range(10)])
+    population = base[rng.integers(0, 10, size=100)]
+    evalues = []
+
+    def evaluer(sous_population):
+        evalues.append(len(sous_population))
+        return (sous_population * np.arange(30)).sum(axis=1)
+
+    cache = CacheFitness(30, taille_max=5)
+    assert np.array_equal(cache.evaluer_population(population, evaluer), (population * np.arange(30)).sum(axis=1))
+    assert evalues[0] == len(np.unique(population, axis=0))
+    assert len(cache) == 5 and cache.evictions == evalues[0] - 5
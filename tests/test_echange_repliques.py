@@ -0,0 +1,30 @@
+import random
+
+import pytest
+
+from algo_evolutionnaire import ProblemeTSP, RecuitSimule
+from algo_evolutionnaire.echange_repliques import EchangeRepliques
+from algo_evolutionnaire.instances import tsp_aleatoire
+
+
+def resoudre(matrice, repliques):
+    random.seed(0)
+    probleme = ProblemeTSP(matrice)
+    solution, cout = RecuitSimule(iterations_max=8000, mouvement="2opt", temperature_initiale="auto",
+                                  repliques=repliques).resoudre(probleme)
+    return solution, cout, probleme.nb_evaluations
+
+
+def test_repliques_sequentiel_et_pool_identiques():
+    matrice = tsp_aleatoire(30, graine=2).matrice
+    sequentiel = resoudre(matrice, EchangeRepliques(4, 500, nb_processus=1))
+    assert resoudre(matrice, EchangeRepliques(4, 500, nb_processus=2)) == sequentiel
+    solution, cout, nb_evaluations = sequentiel
+    assert sorted(solution) == list(range(30))
+    assert cout == ProblemeTSP(matrice).evaluer_population([solution])[0]
+    assert nb_evaluations >= 4 * 4 * 500
+
+
+def test_repliques_incompatibles_avec_refroidissement():
+    with pytest.raises(ValueError):
+        RecuitSimule(repliques=2, refroidissement="lundy_mees").resoudre(ProblemeTSP(tsp_aleatoire(10).matrice))
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from algo_evolutionnaire.donnees import MATRICE_DISTANCES
+from algo_evolutionnaire.evaluation_TSP import calculer_distance_totale
+from algo_evolutionnaire.instances import tsp_aleatoire
+from algo_evolutionnaire.tabou import recherche_tabou
+
+
+def recherche_tabou_reference(matrice, iterations, taille_tabou):
+    # Version d'origine : tous les voisins construits et réévalués en entier, liste tabou FIFO
+    n = len(matrice)
+    solution_courante = list(range(n))
+    random.shuffle(solution_courante)
+    meilleure_solution = solution_courante[:]
+    meilleure_distance = calculer_distance_totale(meilleure_solution, matrice)
+    tabou = []
+    for _ in range(iterations):
+        meilleur_voisin, meilleure_dist_voisin, meilleur_move = None, float('inf'), None
+        for i in range(n):
+            for j in range(i + 1, n):
+                if (i, j) in tabou:
+                    continue
+                voisin = solution_courante.copy()
+                voisin[i], voisin[j] = voisin[j], voisin[i]
+                dist = calculer_distance_totale(voisin, matrice)
+                if dist < meilleure_dist_voisin:
+                    meilleur_voisin, meilleure_dist_voisin, meilleur_move = voisin, dist, (i, j)
+        if meilleur_voisin is None:
+            break
+        solution_courante = meilleur_voisin
+        if meilleure_dist_voisin < meilleure_distance:
+            meilleure_solution, meilleure_distance = meilleur_voisin, meilleure_dist_voisin
+        tabou.append(meilleur_move)
+        if len(tabou) > taille_tabou:
+            tabou.pop(0)
+    return meilleure_solution, meilleure_distance
+
+
+def matrice_asymetrique(n, graine):
+    rng = random.Random(graine)
+    return [[0 if a == b else rng.randint(1, 100) for b in range(n)] for a in range(n)]
+
+
+@pytest.mark.parametrize("matrice, iterations, taille_tabou", [
+    (MATRICE_DISTANCES, 500, 20),
+    (tsp_aleatoire(25, graine=3).matrice, 150, 10),
+    (matrice_asymetrique(20, graine=4), 150, 7),
+])
+@pytest.mark.parametrize("graine", [0, 1, 2])
+def test_deltas_identiques_au_recalcul_complet(matrice, iterations, taille_tabou, graine):
+    random.seed(graine)
+    attendu = recherche_tabou_reference(matrice, iterations, taille_tabou)
+    random.seed(graine)
+    obtenu = recherche_tabou(matrice, iterations, taille_tabou, aspiration=False)
+    assert obtenu == attendu
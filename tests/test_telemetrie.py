@@ -0,0 +1,28 @@
+import numpy as np
+
+from algo_evolutionnaire.telemetrie import diversite
+
+
+def diversite_reference(population):
+    # Ancien calcul exact : table des comptes (position, gène) de taille n x n
+    population = np.asarray(population)
+    nb, n = population.shape
+    comptes = np.bincount((population + np.arange(n) * n).ravel(), minlength=n * n).reshape(n, n)
+    return float(1.0 - comptes.max(axis=1).mean() / nb)
+
+
+def test_diversite_grande_population():
+    rng = np.random.default_rng(0)
+    n = 3000
+    base = rng.permutation(n)
+    population = np.array([base if k % 3 == 0 else rng.permutation(n) for k in range(60)], dtype=np.int32)
+    assert diversite(population) == diversite_reference(population)
+
+
+def test_diversite_cas_limites():
+    identiques = np.tile(np.arange(50), (20, 1))
+    assert diversite(identiques) == 0.0
+    assert diversite(identiques[:1]) == 0.0
+    rng = np.random.default_rng(1)
+    population = np.array([rng.permutation(7) for _ in range(200)])
+    assert diversite(population) == diversite_reference(population)